@@ -0,0 +1,43 @@
+"""Add posts.search_vector full-text index
+
+Revision ID: 5c1e7a9d3b42
+Revises: d42b376acf81
+Create Date: 2026-10-18 10:12:31.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a9d3b42'
+down_revision: Union[str, Sequence[str], None] = 'd42b376acf81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        # SQLite 등은 프로세스 내 역색인을 사용하므로 컬럼만 맞춰둔다
+        op.add_column('posts', sa.Column('search_vector', sa.Text(), nullable=True))
+        return
+
+    op.add_column('posts', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    # 기존 게시글 색인 (SEARCH_CONFIG 기본값 'simple'과 동일하게 맞춤)
+    op.execute(
+        "UPDATE posts SET search_vector = "
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(content, '')), 'B')"
+    )
+    op.create_index('ix_posts_search_vector', 'posts', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index('ix_posts_search_vector', table_name='posts', postgresql_using='gin')
+    op.drop_column('posts', 'search_vector')
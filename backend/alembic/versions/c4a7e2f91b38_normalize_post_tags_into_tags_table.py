@@ -0,0 +1,69 @@
+"""Normalize post_tags.tag_name into a tags table with post counts
+
+Revision ID: c4a7e2f91b38
+Revises: b6d1f4a8c935
+Create Date: 2026-10-18 20:31:12.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a7e2f91b38'
+down_revision: Union[str, Sequence[str], None] = 'b6d1f4a8c935'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('post_count', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tags_id'), 'tags', ['id'], unique=False)
+    op.create_index(op.f('ix_tags_name'), 'tags', ['name'], unique=True)
+
+    # 기존 태그 이름으로 카탈로그 생성 후 post_tags.tag_id 채우기
+    op.execute("INSERT INTO tags (name) SELECT DISTINCT tag_name FROM post_tags")
+    op.add_column('post_tags', sa.Column('tag_id', sa.Integer(), nullable=True))
+    op.execute("UPDATE post_tags SET tag_id = (SELECT tags.id FROM tags WHERE tags.name = post_tags.tag_name)")
+
+    # 같은 Post에 중복 연결된 태그 정리 (유일 인덱스 생성 전)
+    op.execute(
+        "DELETE FROM post_tags WHERE id NOT IN (SELECT MIN(id) FROM post_tags GROUP BY post_id, tag_id)"
+    )
+
+    op.alter_column('post_tags', 'tag_id', nullable=False)
+    op.create_foreign_key('post_tags_tag_id_fkey', 'post_tags', 'tags', ['tag_id'], ['id'])
+    op.create_index('ix_post_tags_tag_id_post_id', 'post_tags', ['tag_id', 'post_id'], unique=True)
+    op.create_index(op.f('ix_post_tags_post_id'), 'post_tags', ['post_id'], unique=False)
+    op.drop_column('post_tags', 'tag_name')
+
+    # 공개 Post 수 초기값
+    op.execute(
+        "UPDATE tags SET post_count = (SELECT COUNT(*) FROM post_tags "
+        "JOIN posts ON posts.id = post_tags.post_id "
+        "WHERE post_tags.tag_id = tags.id AND posts.is_published = true AND posts.is_deleted = false)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('post_tags', sa.Column('tag_name', sa.String(), nullable=True))
+    op.execute("UPDATE post_tags SET tag_name = (SELECT tags.name FROM tags WHERE tags.id = post_tags.tag_id)")
+    op.alter_column('post_tags', 'tag_name', nullable=False)
+
+    op.drop_index(op.f('ix_post_tags_post_id'), table_name='post_tags')
+    op.drop_index('ix_post_tags_tag_id_post_id', table_name='post_tags')
+    op.drop_constraint('post_tags_tag_id_fkey', 'post_tags', type_='foreignkey')
+    op.drop_column('post_tags', 'tag_id')
+
+    op.drop_index(op.f('ix_tags_name'), table_name='tags')
+    op.drop_index(op.f('ix_tags_id'), table_name='tags')
+    op.drop_table('tags')
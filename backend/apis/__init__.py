@@ -1,16 +1,22 @@
 # 모든 모델을 import하여 SQLAlchemy relationship이 작동하도록 함
 from apis.auth.models import User
 from apis.posts.models import Post, PostTags
+from apis.tag.models import Tag
 from apis.project.models import Project, Project_tech_stack
 from apis.profile.models import Profile, Profile_skills, Profile_timeline
+from apis.dashboard.models import DashboardStats
+from apis.generation.models import CollectionGeneration
 
 __all__ = [
     "User",
     "Post",
     "PostTags",
+    "Tag",
     "Project",
     "Project_tech_stack",
     "Profile",
     "Profile_skills",
     "Profile_timeline",
+    "DashboardStats",
+    "CollectionGeneration",
 ]
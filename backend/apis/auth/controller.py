@@ -1,75 +1,128 @@
+from typing import Optional
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, Depends
+from starlette.concurrency import run_in_threadpool
 from apis.auth import models, schema
-from apis.auth.schema import UserResponse, UserLoginResponse
+from apis.auth.schema import UserResponse, UserLoginResponse, UserLogOutResponse
 from common.utils import JWTHandler
 from common.config import settings
+from common.principal import Principal, cache_user, invalidate_user, user_cache
+from common.revocation import revoke_token
+from common.controller import controller_provider
 from database.engine import get_db
 
+# 요청마다 실행되는 조회는 모듈 로드 시 한 번 만든 statement를 재사용한다 (값은 bound parameter).
+# 쿼리 객체 생성/캐시 키 계산을 반복하지 않고, SQLAlchemy compiled cache에서 바로 찾는다.
+USER_BY_EMAIL = select(models.User).where(models.User.email == bindparam("email")).limit(1)
+USER_BY_USERNAME = select(models.User).where(models.User.username == bindparam("username")).limit(1)
+USER_BY_ID = select(models.User).where(models.User.id == bindparam("user_id")).limit(1)
+
 
 class AuthController:
     def __init__(self, db: Session=Depends(get_db)):
         self.db = db
+        # 요청 내 사용자 확인 결과 (같은 요청에서 두 번 조회하지 않음)
+        self._resolved: dict = {}
+
+    async def _call_db(self, method, *args):
+        """DB 작업 실행 (동기 Session → 스레드풀, DB_ASYNC면 AsyncSessionController가 run_sync로 교체)"""
+        return await run_in_threadpool(method, *args)
 
     def get_user_by_email(self, email: str):
-        return self.db.query(models.User).filter(models.User.email == email).first()
+        return self.db.scalars(USER_BY_EMAIL, {"email": email}).first()
 
     def get_user_by_username(self, username: str):
         """username으로 User 조회"""
-        return self.db.query(models.User).filter(models.User.username == username).first()
+        return self.db.scalars(USER_BY_USERNAME, {"username": username}).first()
 
 
     def get_user_by_id(self, user_id: int):
         """ID로 User 조회"""
-        return self.db.query(models.User).filter(models.User.id == user_id).first()
-
-    def get_access_token(self, email: str):
-        """Access Token 생성"""
+        return self.db.scalars(USER_BY_ID, {"user_id": user_id}).first()
+
+    def resolve_user(self, principal: Principal) -> Optional[Principal]:
+        """
+        토큰의 Principal을 실제 사용자로 확정 (없거나 비활성이면 None)
+
+        요청 내 memo → 사용자 LRU 캐시 → users 테이블(PK 또는 email) 순으로 조회한다.
+        """
+        key = ("id", principal.id) if principal.id is not None else ("email", principal.email)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        resolved = user_cache.get(key)
+        if resolved is None:
+            if principal.id is not None:
+                user = self.get_user_by_id(principal.id)
+            else:
+                user = self.get_user_by_email(principal.email)
+            if user:
+                resolved = Principal.from_user(user)
+                cache_user(resolved)
+
+        # 토큰 발급 후 이메일이 바뀌었거나 비활성화된 사용자는 인정하지 않음
+        if resolved and (resolved.email != principal.email or not resolved.is_active):
+            resolved = None
+
+        self._resolved[key] = resolved
+        return resolved
+
+    def get_access_token(self, user):
+        """Access Token 생성 (user id, superuser 여부 claims 포함)"""
         access_token = JWTHandler.create_access_token(
-            email=email,
+            email=user.email,
             secret_key=settings.SECRET_KEY,
             algorithm=settings.ALGORITHM,
+            user_id=user.id,
+            is_superuser=user.is_superuser,
         )
         return access_token
 
-    def get_refresh_token(self, email: str):
-        """Refresh Token 생성"""
+    def get_refresh_token(self, user):
+        """Refresh Token 생성 (user id, superuser 여부 claims 포함)"""
         refresh_token = JWTHandler.create_refresh_token(
-            email=email,
+            email=user.email,
             secret_key=settings.SECRET_KEY,
-            algorithm=settings.ALGORITHM
+            algorithm=settings.ALGORITHM,
+            user_id=user.id,
+            is_superuser=user.is_superuser,
         )
         return refresh_token
 
-    def create_user(self, user_create: schema.UserCreate):
+    async def create_user(self, user_create: schema.UserCreate):
         """User creation - Step 1"""
 
         # 1. Check if email already exists
-        if self.get_user_by_email(user_create.email):
+        if await self._call_db(self.get_user_by_email, user_create.email):
             raise HTTPException(status_code=400, detail="Email already registered")
 
         # 2. Check if username already exists
-        if self.get_user_by_username(user_create.username):
+        if await self._call_db(self.get_user_by_username, user_create.username):
             raise HTTPException(status_code=400, detail="Username already taken")
 
-        # 3. Hash the password
-        hashed_password = JWTHandler.create_password_hash(user_create.password)
+        # 3. Hash the password (해싱 스레드 풀에서 실행)
+        hashed_password = await JWTHandler.create_password_hash_async(user_create.password)
 
-        # 4. User 객체 생성
+        # 4. DB에 추가
+        return await self._call_db(self.insert_user, user_create.username, user_create.email, hashed_password)
+
+    def insert_user(self, username: str, email: str, hashed_password: str):
+        """User 생성 (해싱된 비밀번호로 INSERT)"""
         db_user = models.User(
-            username=user_create.username,
-            email=user_create.email,
+            username=username,
+            email=email,
             hashed_password=hashed_password,
             is_active=True,
             is_superuser=False
         )
 
-        # 5. DB에 추가
         try:
             self.db.add(db_user)
             self.db.commit()
             self.db.refresh(db_user)
+            invalidate_user(db_user.id, db_user.email)
             return db_user
 
         except IntegrityError:
@@ -77,41 +130,52 @@ class AuthController:
             raise HTTPException(status_code=400, detail="User creation failed")
 
 
-    def authenticate_user(self, email: str, password: str):
+    async def authenticate_user(self, email: str, password: str):
         """User 인증 (비밀번호 검증만 수행)"""
 
         # 1. Get user by email
-        user = self.get_user_by_email(email)
+        user = await self._call_db(self.get_user_by_email, email)
         if not user:
             return None
 
-        # 2. Verify password
-        if not JWTHandler.verify_password(password, user.hashed_password):
+        # 2. Verify password (해싱 스레드 풀에서 실행)
+        verified, new_hash = await JWTHandler.verify_and_update_password_async(password, user.hashed_password)
+        if not verified:
             return None
 
         # 3. Check if user is active
         if not user.is_active:
             return None
 
+        # 4. scheme/cost 설정이 바뀌었으면 평문을 아는 지금 새 설정으로 다시 저장
+        if new_hash:
+            await self._call_db(self.update_password_hash, user, new_hash)
+
         return user
 
+    def update_password_hash(self, user, hashed_password: str):
+        """비밀번호 해시만 교체 (로그인 시 재해싱)"""
+        user.hashed_password = hashed_password
+        self.db.commit()
+        self.db.refresh(user)
+
 
-    def login_user(self, email: str, password: str):
+    async def login_user(self, email: str, password: str):
         """로그인 처리 (인증 + 토큰 생성)"""
 
         # 1. 사용자 인증
-        user = self.authenticate_user(email, password)
+        user = await self.authenticate_user(email, password)
         if not user:
             raise HTTPException(status_code=401, detail="Invalid email or password")
 
         # 2. 토큰 생성
-        access_token = self.get_access_token(user.email)
-        refresh_token = self.get_refresh_token(user.email)
+        access_token = self.get_access_token(user)
+        refresh_token = self.get_refresh_token(user)
 
         return UserLoginResponse(access_token=access_token, refresh_token=refresh_token)
 
-    def refresh_user_token(self, refresh_token: str):
-        """토큰 리프레시 처리"""
+    async def refresh_user_token(self, refresh_token: str):
+        """토큰 리프레시 처리 (refresh token rotation: 사용한 refresh token은 폐기하고 새로 발급)"""
 
         # 1. Refresh Token 검증
         payload = JWTHandler.verify_refresh_token(
@@ -126,7 +190,30 @@ class AuthController:
         if not email:
             raise HTTPException(status_code=401, detail="Invalid refresh token payload")
 
-        # 2. 새로운 Access Token 생성
-        new_access_token = self.get_access_token(email)
+        # 2. 사용자 확인 (최신 superuser 여부를 새 토큰에 반영)
+        user = await self._call_db(self.resolve_user, JWTHandler.principal_from_payload(payload))
+        if not user:
+            raise HTTPException(status_code=401, detail="User not found or inactive")
+
+        # 3. 사용한 refresh token 폐기 (동시에 같은 토큰으로 요청해도 한 번만 성공)
+        if payload.get("jti") and not revoke_token(payload, "rotated"):
+            raise HTTPException(status_code=401, detail="Token revoked")
+
+        # 4. 새로운 Access/Refresh Token 생성
+        new_access_token = self.get_access_token(user)
+        new_refresh_token = self.get_refresh_token(user)
+
+        return UserLoginResponse(access_token=new_access_token, refresh_token=new_refresh_token)
+
+    async def logout_user(self, access_payload: dict, refresh_token: Optional[str] = None):
+        """로그아웃 (access token과 함께 보낸 refresh token 폐기)"""
+        if refresh_token:
+            refresh_payload = JWTHandler.verify_refresh_token(refresh_token)
+            if refresh_payload.get("email") != access_payload.get("email"):
+                raise HTTPException(status_code=401, detail="Invalid refresh token")
+            revoke_token(refresh_payload, "logout")
+        revoke_token(access_payload, "logout")
+        return UserLogOutResponse(message="Logout successful")
+
 
-        return UserLoginResponse(access_token=new_access_token, refresh_token=refresh_token)
\ No newline at end of file
+get_auth_controller = controller_provider(AuthController)
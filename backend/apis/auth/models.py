@@ -1,6 +1,7 @@
 from database.engine import Base
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Integer, String, Boolean, event
 from sqlalchemy.orm import relationship
+from common.principal import invalidate_user
 
 class User(Base):
     __tablename__ = "users"
@@ -20,4 +21,11 @@ class User(Base):
     
     # [개선] Integer -> Boolean (의미가 명확함)
     is_active = Column(Boolean, default=True)
-    is_superuser = Column(Boolean, default=False)
\ No newline at end of file
+    is_superuser = Column(Boolean, default=False)
+
+
+# User 행이 바뀌면 인증 사용자 캐시에서 제거
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target):
+    invalidate_user(target.id, target.email)
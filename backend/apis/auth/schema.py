@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import BaseModel, EmailStr
 
 class UserCreate(BaseModel):
@@ -28,7 +29,7 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 class UserLogOut(BaseModel):
-    msg: str
+    refresh_token: Optional[str] = None  # 함께 폐기할 refresh token
 
 class UserLogOutResponse(BaseModel):
     message: str
@@ -1,31 +1,34 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from database.engine import get_db
-from apis.auth.schema import UserCreate, UserResponse, UserLogin, UserLoginResponse, RefreshTokenRequest
-from apis.auth.controller import AuthController
+from apis.auth.schema import UserCreate, UserResponse, UserLogin, UserLoginResponse, RefreshTokenRequest, UserLogOut, UserLogOutResponse
+from apis.auth.controller import get_auth_controller
 from common.utils import JWTHandler
 router = APIRouter(prefix="/auth", tags=["Auth"])  # noqa: F401
 
 @router.post("/login", response_model=UserLoginResponse)
-async def login(requests: UserLogin, controller: AuthController = Depends()):
-    response = controller.login_user(requests.email, requests.password)
+async def login(requests: UserLogin, controller = Depends(get_auth_controller)):
+    response = await controller.login_user(requests.email, requests.password)
     if not response:
         return {"message": "Invalid credentials"}
     return response
 
-@router.post("/logout")
-async def logout(token: str = Depends(JWTHandler.verify_token)):
-    return {"message": "Logout successful"}
+@router.post("/logout", response_model=UserLogOutResponse)
+async def logout(requests: Optional[UserLogOut] = None, payload: dict = Depends(JWTHandler.verify_token_payload), controller = Depends(get_auth_controller)):
+    """access token(과 body의 refresh token) 폐기"""
+    return await controller.logout_user(payload, requests.refresh_token if requests else None)
 
 @router.post("/me")
 async def get_current_user(token: str = Depends(JWTHandler.verify_token)):
     return {"message": "Current user data"}
 
-@router.post("/refresh")
-async def refresh_token(requests: RefreshTokenRequest, controller: AuthController = Depends()):
-    return controller.refresh_user_token(requests.refresh_token)
+@router.post("/refresh", response_model=UserLoginResponse)
+async def refresh_token(requests: RefreshTokenRequest, controller = Depends(get_auth_controller)):
+    return await controller.refresh_user_token(requests.refresh_token)
 
 @router.post("/register", response_model=UserResponse)
-async def register(requests: UserCreate, controller: AuthController = Depends()):
-    return controller.create_user(requests)
+async def register(requests: UserCreate, controller = Depends(get_auth_controller)):
+    return await controller.create_user(requests)
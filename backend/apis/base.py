@@ -4,10 +4,18 @@ from apis.posts.views import router as post_router
 from apis.profile.views import router as profile_router
 from apis.project.views import router as project_router
 from apis.dashboard.views import router as dashboard_router
+from apis.tag.views import router as tag_router
+from common.config import settings
+from common.rate_limit import RateLimitPolicy, rate_limit_dependencies
+
+# 라우터 prefix별 요청 제한 (컨트롤러/DB/bcrypt 실행 전에 거부)
+RATE_LIMIT_POLICIES = {
+    "/auth": (
+        RateLimitPolicy.parse("auth_ip", "ip", settings.RATE_LIMIT_AUTH_IP),
+        RateLimitPolicy.parse("auth_email", "email", settings.RATE_LIMIT_AUTH_EMAIL),
+    ),
+}
 
 router = APIRouter(prefix="/apis/v1")
-router.include_router(auth_router)
-router.include_router(post_router)
-router.include_router(profile_router)
-router.include_router(project_router)
-router.include_router(dashboard_router)
\ No newline at end of file
+for child in (auth_router, post_router, profile_router, project_router, dashboard_router, tag_router):
+    router.include_router(child, dependencies=rate_limit_dependencies(RATE_LIMIT_POLICIES.get(child.prefix, ())))
@@ -1,48 +1,73 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from fastapi import Depends
+from sqlalchemy.orm import Session, load_only, raiseload
+from fastapi import Depends, HTTPException
+from apis.auth.controller import AuthController
+from common.controller import controller_provider
+from common.principal import Principal
 from database.engine import get_db
 from apis.posts.models import Post
 from apis.project.models import Project
 from apis.dashboard import schema
+from apis.dashboard.models import DashboardStats
+from apis.dashboard.stats import STATS_ID, reconcile_dashboard_stats
 
 
 class DashboardController:
-    def __init__(self, db: Session = Depends(get_db)):
+    def __init__(self, db: Session = Depends(get_db), auth_controller: AuthController = Depends()):
         self.db = db
+        self.auth_controller = auth_controller
+
+    def _reconcile(self):
+        """요청 Session의 connection으로 집계 행 재계산 후 commit"""
+        reconcile_dashboard_stats(self.db.connection())
+        self.db.commit()
+        # AsyncSession은 expire_on_commit=False이므로 이미 로드된 집계 행을 직접 만료
+        self.db.expire_all()
 
     def get_dashboard_stats(self) -> schema.DashboardStatsResponse:
         """대시보드 통계 조회"""
 
-        # 총 게시글 수 (삭제되지 않은 것만)
-        total_posts = self.db.query(Post).filter(Post.is_deleted == False).count()
-
-        # 총 프로젝트 수 (삭제되지 않은 것만)
-        total_projects = self.db.query(Project).filter(Project.is_deleted == False).count()
+        # 총 게시글/프로젝트/조회수: 미리 집계된 단일 행 (PK 조회)
+        stats = self.db.get(DashboardStats, STATS_ID)
+        if stats is None:
+            # 아직 집계 행이 없으면 한 번 전체 계산
+            self._reconcile()
+            stats = self.db.get(DashboardStats, STATS_ID)
 
-        # 총 조회수 (모든 게시글의 view_count 합계)
-        total_views = self.db.query(func.sum(Post.view_count))\
-            .filter(Post.is_deleted == False)\
-            .scalar() or 0
-
-        # 최근 게시글 5개
+        # 최근 게시글 5개 (요약 컬럼만, 태그는 로드하지 않음)
         recent_posts = self.db.query(Post)\
+            .options(load_only(Post.id, Post.title, Post.category, Post.view_count, Post.created_at), raiseload(Post.tags))\
             .filter(Post.is_deleted == False, Post.is_published == True)\
-            .order_by(Post.created_at.desc())\
+            .order_by(Post.created_at.desc(), Post.id.desc())\
             .limit(5)\
             .all()
 
-        # 최근 프로젝트 5개
+        # 최근 프로젝트 5개 (요약 컬럼만, 기술 스택은 로드하지 않음)
         recent_projects = self.db.query(Project)\
+            .options(load_only(Project.id, Project.title, Project.status, Project.featured, Project.created_at), raiseload(Project.tech_stacks))\
             .filter(Project.is_deleted == False)\
-            .order_by(Project.created_at.desc())\
+            .order_by(Project.created_at.desc(), Project.id.desc())\
             .limit(5)\
             .all()
 
         return schema.DashboardStatsResponse(
-            total_posts=total_posts,
-            total_projects=total_projects,
-            total_views=total_views,
+            total_posts=stats.total_posts,
+            total_projects=stats.total_projects,
+            total_views=stats.total_views,
             recent_posts=recent_posts,
             recent_projects=recent_projects
         )
+
+    def reconcile_stats(self, principal: Principal) -> schema.DashboardStatsResponse:
+        """집계 행 전체 재계산 후 결과 반환 (관리자 전용)"""
+        user = self.auth_controller.resolve_user(principal)
+        if not user or not user.is_superuser:
+            raise HTTPException(status_code=403, detail="Not authorized to reconcile dashboard stats")
+        self._reconcile()
+        return self.get_dashboard_stats()
+
+
+def build_dashboard_controller(db: Session) -> DashboardController:
+    return DashboardController(db, AuthController(db))
+
+
+get_dashboard_controller = controller_provider(build_dashboard_controller)
@@ -0,0 +1,18 @@
+from database.engine import Base
+from sqlalchemy import Column, Integer, BigInteger, DateTime
+from sqlalchemy.sql import func
+
+class DashboardStats(Base):
+    """대시보드 집계 (단일 행, id=1)
+
+    게시글/프로젝트 생성·삭제, 조회수 flush 시 같은 트랜잭션에서 증분 갱신되고
+    reconcile 작업이 주기적으로 전체 재계산해 오차를 바로잡는다.
+    """
+    __tablename__ = "dashboard_stats"
+    id = Column(Integer, primary_key=True)
+    total_posts = Column(Integer, nullable=False, default=0, server_default="0")
+    total_projects = Column(Integer, nullable=False, default=0, server_default="0")
+    total_views = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+    # 마지막 전체 재계산 시각
+    reconciled_at = Column(DateTime(timezone=True), nullable=True)
@@ -34,3 +34,23 @@ class DashboardStatsResponse(BaseModel):
     total_views: int
     recent_posts: list[RecentPostSummary]
     recent_projects: list[RecentProjectSummary]
+
+
+class PoolStatus(BaseModel):
+    """DB 커넥션 풀 현황"""
+    pool_class: str
+    status: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    checkouts: Optional[int] = None
+    wait_avg_ms: Optional[float] = None
+    wait_max_ms: Optional[float] = None
+    timeouts: Optional[int] = None
+
+
+class PoolStatsResponse(BaseModel):
+    """DB 커넥션 풀 현황 응답 (동기/비동기 엔진)"""
+    sync_engine: PoolStatus
+    async_engine: Optional[PoolStatus] = None
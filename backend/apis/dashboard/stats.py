@@ -0,0 +1,150 @@
+"""대시보드 집계 유지
+
+- 증분: Post/Project insert·soft delete(ORM 이벤트), 조회수 flush(ViewCounter listener)가
+  변경과 같은 트랜잭션에서 dashboard_stats 행을 +/- 갱신한다.
+- 재계산: reconcile_dashboard_stats()가 COUNT/SUM을 한 번의 UPDATE로 다시 계산해 오차를 바로잡는다.
+  (앱 시작 시 + DASHBOARD_RECONCILE_SECONDS 주기, 관리자 API)
+"""
+import asyncio
+import logging
+
+from sqlalchemy import event, func, inspect, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
+
+from apis.dashboard.models import DashboardStats
+from apis.posts.models import Post
+from apis.posts.view_counter import view_counter
+from apis.project.models import Project
+from database.engine import engine
+
+logger = logging.getLogger(__name__)
+
+STATS_ID = 1
+
+stats_table = DashboardStats.__table__
+posts_table = Post.__table__
+projects_table = Project.__table__
+
+
+def adjust_stats(connection, **deltas):
+    """total_* 컬럼에 증분 반영 (행이 없으면 무시, reconcile이 생성)"""
+    values = {name: stats_table.c[name] + delta for name, delta in deltas.items() if delta is not None}
+    if values:
+        connection.execute(update(stats_table).where(stats_table.c.id == STATS_ID).values(values))
+
+
+def _post_views(post_id: int):
+    return select(posts_table.c.view_count).where(posts_table.c.id == post_id).scalar_subquery()
+
+
+def _deleted_changed(target):
+    """is_deleted가 이번 flush에서 바뀌었으면 새 값, 아니면 None"""
+    history = inspect(target).attrs.is_deleted.history
+    if not history.has_changes() or not history.added:
+        return None
+    return bool(history.added[0])
+
+
+# ===== Post =====
+
+@event.listens_for(Post, "after_insert")
+def _post_inserted(mapper, connection, target):
+    if not target.is_deleted:
+        adjust_stats(connection, total_posts=1, total_views=target.view_count or 0)
+
+
+@event.listens_for(Post, "after_update")
+def _post_updated(mapper, connection, target):
+    deleted = _deleted_changed(target)
+    if deleted is None:
+        return
+    sign = -1 if deleted else 1
+    adjust_stats(connection, total_posts=sign, total_views=sign * _post_views(target.id))
+
+
+@event.listens_for(Post, "after_delete")
+def _post_deleted(mapper, connection, target):
+    if not target.is_deleted:
+        adjust_stats(connection, total_posts=-1, total_views=-(target.view_count or 0))
+
+
+# ===== Project =====
+
+@event.listens_for(Project, "after_insert")
+def _project_inserted(mapper, connection, target):
+    if not target.is_deleted:
+        adjust_stats(connection, total_projects=1)
+
+
+@event.listens_for(Project, "after_update")
+def _project_updated(mapper, connection, target):
+    deleted = _deleted_changed(target)
+    if deleted is not None:
+        adjust_stats(connection, total_projects=-1 if deleted else 1)
+
+
+@event.listens_for(Project, "after_delete")
+def _project_deleted(mapper, connection, target):
+    if not target.is_deleted:
+        adjust_stats(connection, total_projects=-1)
+
+
+# ===== 조회수 =====
+
+def _views_flushed(connection, applied: dict[int, int]):
+    # ViewCounter가 실제 UPDATE한(존재하고 삭제되지 않은) Post의 증가분만 전달한다
+    adjust_stats(connection, total_views=sum(applied.values()))
+
+
+view_counter.add_flush_listener(_views_flushed)
+
+
+# ===== 재계산 =====
+
+def _ensure_stats_row(connection):
+    """집계 행이 없으면 생성 (다른 워커와 동시에 만들면 SAVEPOINT만 되돌린다)"""
+    if connection.execute(select(stats_table.c.id).where(stats_table.c.id == STATS_ID)).first() is not None:
+        return
+    try:
+        with connection.begin_nested():
+            connection.execute(insert(stats_table).values(id=STATS_ID))
+    except IntegrityError:
+        # 다른 워커가 먼저 생성한 경우
+        pass
+
+
+def reconcile_dashboard_stats(connection=None):
+    """
+    전체 COUNT/SUM으로 집계 행을 다시 계산 (증분 갱신 오차 보정)
+
+    connection을 넘기면 그 트랜잭션에서 실행하고 commit은 호출자가 한다.
+    (요청 경로에서는 요청 Session의 connection을 넘겨 DB_ASYNC일 때도 run_sync로 실행)
+    """
+    if connection is None:
+        with engine.begin() as connection:
+            return reconcile_dashboard_stats(connection)
+
+    _ensure_stats_row(connection)
+    # 한 문장으로 갱신해 증분 갱신과 섞이지 않도록 한다
+    connection.execute(
+        update(stats_table).where(stats_table.c.id == STATS_ID).values(
+            total_posts=select(func.count(posts_table.c.id))
+                .where(posts_table.c.is_deleted == False).scalar_subquery(),
+            total_projects=select(func.count(projects_table.c.id))
+                .where(projects_table.c.is_deleted == False).scalar_subquery(),
+            total_views=select(func.coalesce(func.sum(posts_table.c.view_count), 0))
+                .where(posts_table.c.is_deleted == False).scalar_subquery(),
+            reconciled_at=func.now(),
+        )
+    )
+
+
+async def run_reconcile_loop(interval: float):
+    """interval초마다 재계산 (lifespan에서 task로 실행)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(reconcile_dashboard_stats)
+        except Exception:
+            logger.exception("Dashboard stats reconciliation failed")
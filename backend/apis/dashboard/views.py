@@ -1,15 +1,42 @@
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from common.utils import JWTHandler
+from common.principal import Principal
+from common.responses import json_response
 from apis.dashboard import schema
-from apis.dashboard.controller import DashboardController
+from apis.dashboard.controller import get_dashboard_controller
+from database import engine as database
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
+# controller가 DashboardStatsResponse를 직접 만들므로 다시 검증하지 않고 바로 직렬화
+stats_adapter = TypeAdapter(schema.DashboardStatsResponse)
+pool_adapter = TypeAdapter(schema.PoolStatsResponse)
+
 
 @router.get("/stats", response_model=schema.DashboardStatsResponse)
 async def get_dashboard_stats(
     email: str = Depends(JWTHandler.verify_token),
-    controller: DashboardController = Depends()
+    controller = Depends(get_dashboard_controller)
 ):
     """대시보드 통계 조회 (관리자용)"""
-    return controller.get_dashboard_stats()
+    return json_response(stats_adapter, await controller.get_dashboard_stats(), trusted=True)
+
+
+@router.post("/stats/reconcile", response_model=schema.DashboardStatsResponse)
+async def reconcile_dashboard_stats(
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_dashboard_controller)
+):
+    """대시보드 집계 전체 재계산 (관리자 전용)"""
+    return json_response(stats_adapter, await controller.reconcile_stats(principal), trusted=True)
+
+
+@router.get("/pool", response_model=schema.PoolStatsResponse)
+async def get_pool_stats(email: str = Depends(JWTHandler.verify_token)):
+    """DB 커넥션 풀 현황 조회 (관리자용)"""
+    stats = schema.PoolStatsResponse(
+        sync_engine=database.pool_status(database.engine),
+        async_engine=database.pool_status(database.async_engine) if database.async_engine else None
+    )
+    return json_response(pool_adapter, stats, trusted=True)
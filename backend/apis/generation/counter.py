@@ -0,0 +1,82 @@
+"""목록 변경 세대 (posts, projects, tags, profiles)
+
+- 증가: Post/Project insert·update·delete(ORM 이벤트), 조회수 flush(ViewCounter listener)가
+  변경과 같은 트랜잭션에서 해당 목록의 generation을 +1 한다.
+  (태그/기술 스택 변경은 부모 행의 updated_at을 갱신하므로 update 이벤트로 함께 잡힌다)
+  tags는 post_count 갱신(apis.tag.counts), profiles는 ProfileController의 쓰기가 직접 올린다.
+- 조회: 목록 ETag는 필터와 상관없이 (generation) + query string으로 만든다.
+  세대가 같으면 어떤 필터의 결과도 바뀌지 않았으므로 304/응답 캐시 재사용이 안전하다.
+
+DB에 저장하므로 여러 워커가 같은 ETag를 내보내고, 다른 워커의 쓰기도 바로 반영된다.
+"""
+from sqlalchemy import bindparam, event, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from apis.generation.models import CollectionGeneration
+from apis.posts.models import Post
+from apis.posts.view_counter import view_counter
+from apis.project.models import Project
+from database.engine import engine
+
+COLLECTIONS = ("posts", "projects", "tags", "profiles")
+
+generations_table = CollectionGeneration.__table__
+
+BUMP_STATEMENT = update(generations_table)\
+    .where(generations_table.c.name == bindparam("b_name"))\
+    .values(generation=generations_table.c.generation + 1, updated_at=func.now())
+
+GENERATION_STATE = select(CollectionGeneration.generation, CollectionGeneration.updated_at)\
+    .where(CollectionGeneration.name == bindparam("name"))
+
+
+def bump_generation(connection, name: str):
+    """name 목록의 세대 +1 (행이 없으면 무시, ensure_generations가 생성)"""
+    connection.execute(BUMP_STATEMENT, {"b_name": name})
+
+
+def get_generation_state(db, name: str):
+    """목록 ETag용 (state, last_modified). 행이 없으면 ((0,), None)"""
+    row = db.execute(GENERATION_STATE, {"name": name}).first()
+    if row is None:
+        return (0,), None
+    return (row.generation,), row.updated_at
+
+
+def ensure_generations():
+    """목록별 행 생성 (앱 시작 시, 이미 있으면 그대로)"""
+    for name in COLLECTIONS:
+        try:
+            with engine.begin() as connection:
+                exists = connection.execute(
+                    select(generations_table.c.name).where(generations_table.c.name == name)
+                ).first()
+                if exists is None:
+                    connection.execute(insert(generations_table).values(name=name))
+        except IntegrityError:
+            # 다른 워커가 먼저 생성한 경우
+            pass
+
+
+# ===== Post / Project =====
+
+def _listen(model, name: str):
+    def bump(mapper, connection, target):
+        bump_generation(connection, name)
+
+    for identifier in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, identifier, bump)
+
+
+_listen(Post, "posts")
+_listen(Project, "projects")
+
+
+# ===== 조회수 =====
+
+def _views_flushed(connection, applied: dict[int, int]):
+    # 목록 응답에 view_count가 포함되므로 반영된 증가분이 있으면 세대를 올린다
+    bump_generation(connection, "posts")
+
+
+view_counter.add_flush_listener(_views_flushed)
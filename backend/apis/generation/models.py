@@ -0,0 +1,14 @@
+from database.engine import Base
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+
+class CollectionGeneration(Base):
+    """목록(posts, projects)별 변경 세대 (목록 ETag/Last-Modified용)
+
+    목록에 보이는 값이 바뀌는 쓰기(생성·수정·삭제, 조회수 flush)와 같은 트랜잭션에서 1씩 증가한다.
+    목록 요청은 전체 집계 대신 이 행 하나를 PK로 읽는다.
+    """
+    __tablename__ = "collection_generations"
+    name = Column(String, primary_key=True)
+    generation = Column(BigInteger, nullable=False, default=1, server_default="1")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,62 @@
+"""기존 Post의 파생 필드(read_time, content_html) 다시 계산
+
+작성/수정 경로(process_content)와 같은 코드로 계산하므로 현재 설정(POST_RENDER_HTML)을 따른다.
+id 순서로 batch만큼 읽고 batch마다 커밋해 전체 글을 한 번에 메모리에 올리지 않는다.
+excerpt는 직접 작성한 요약일 수 있어 건드리지 않는다.
+ORM 이벤트를 거치지 않으므로 version과 posts 목록 세대를 직접 올려 ETag/응답 캐시가 새 값을 내보내게 한다.
+
+    uv run python -m apis.posts.backfill --batch-size 500
+"""
+import argparse
+
+from sqlalchemy import bindparam, select, update
+
+from apis.generation.counter import bump_generation
+from apis.posts.content import process_content
+from apis.posts.models import Post
+from database.engine import engine
+
+posts_table = Post.__table__
+
+BATCH_STATEMENT = select(posts_table.c.id, posts_table.c.content)\
+    .where(posts_table.c.id > bindparam("after_id"))\
+    .order_by(posts_table.c.id)\
+    .limit(bindparam("batch_size"))
+
+UPDATE_STATEMENT = update(posts_table)\
+    .where(posts_table.c.id == bindparam("b_post_id"))\
+    .values(read_time=bindparam("b_read_time"), content_html=bindparam("b_content_html"),
+            version=posts_table.c.version + 1, updated_at=posts_table.c.updated_at)
+
+
+def backfill_post_content(batch_size: int = 500) -> int:
+    """전체 Post 재계산, 갱신한 행 수 반환"""
+    after_id, total = 0, 0
+    while True:
+        with engine.begin() as connection:
+            rows = connection.execute(BATCH_STATEMENT, {"after_id": after_id, "batch_size": batch_size}).all()
+            if not rows:
+                return total
+            params = []
+            for row in rows:
+                processed = process_content(row.content)
+                params.append({
+                    "b_post_id": row.id,
+                    "b_read_time": processed["read_time"],
+                    "b_content_html": processed["content_html"],
+                })
+            connection.execute(UPDATE_STATEMENT, params)
+            bump_generation(connection, "posts")
+        after_id = rows[-1].id
+        total += len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute read_time/content_html for existing posts")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    print(f"updated {backfill_post_content(args.batch_size)} posts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Post 본문 처리 (작성/수정 시 한 번만 실행, 조회 시에는 저장된 값만 사용)
+
+- strip_markdown: 마크다운 문법 제거 → 평문
+- estimate_read_time: 단어 수(라틴 등) + CJK 글자 수 기반 읽는 시간(분)
+- make_excerpt: 평문 앞부분으로 요약 생성 (Post.excerpt String(150) 이내)
+- render_html: POST_RENDER_HTML이 켜져 있으면 markdown → HTML → allowlist 정제 (선택 의존성 markdown, nh3)
+"""
+import math
+import re
+from typing import Optional
+
+from common.config import settings
+
+WORDS_PER_MINUTE = 200
+CJK_CHARS_PER_MINUTE = 500
+EXCERPT_MAX_LENGTH = 150
+
+# 한글(자모 포함), 히라가나/가타카나, 한자
+CJK_CHARS = re.compile(r"[ᄀ-ᇿ぀-ヿ㄰-㆏㐀-䶿一-鿿가-힯豈-﫿]")
+WORD = re.compile(r"[^\W_]+(?:['’-][^\W_]+)*")
+
+_MARKDOWN_RULES = [
+    (re.compile(r"^\s*(```|~~~).*$", re.M), ""),                    # 코드 펜스 (내용은 유지)
+    (re.compile(r"<!--.*?-->", re.S), ""),                           # HTML 주석
+    (re.compile(r"!\[[^\]]*\]\([^)]*\)"), ""),                       # 이미지
+    (re.compile(r"\[([^\]]*)\]\([^)]*\)"), r"\1"),                   # 링크 → 텍스트
+    (re.compile(r"\[([^\]]*)\]\[[^\]]*\]"), r"\1"),                  # 참조 링크
+    (re.compile(r"^\s*\[[^\]]+\]:\s*\S+.*$", re.M), ""),             # 참조 정의
+    (re.compile(r"<[^>\n]+>"), ""),                                  # HTML 태그
+    (re.compile(r"^\s{0,3}#{1,6}\s*", re.M), ""),                    # 제목
+    (re.compile(r"^\s*>\s?", re.M), ""),                             # 인용
+    (re.compile(r"^\s*([-*+]|\d+[.)])\s+(\[[ xX]\]\s+)?", re.M), ""),  # 목록, 체크박스
+    (re.compile(r"^\s*([-*_]\s*){3,}$", re.M), ""),                  # 구분선
+    (re.compile(r"^\s*\|?(\s*:?-+:?\s*\|)+\s*:?-*:?\s*$", re.M), ""),  # 표 구분 행
+    (re.compile(r"\|"), " "),                                        # 표 셀
+    (re.compile(r"(?<!\w)(\*\*|__|~~|\*|_|`)(?=\S)(.+?)(?<=\S)\1(?!\w)"), r"\2"),  # 강조, 인라인 코드 (단어 안의 _ * 제외)
+    (re.compile(r"`+"), ""),
+]
+
+
+def strip_markdown(content: str) -> str:
+    """마크다운 → 평문 (줄 구조 유지)"""
+    text = content
+    for pattern, replacement in _MARKDOWN_RULES:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def estimate_read_time(plain: str) -> int:
+    """읽는 시간(분, 최소 1): 단어는 WORDS_PER_MINUTE, CJK 글자는 CJK_CHARS_PER_MINUTE 기준"""
+    cjk_chars = len(CJK_CHARS.findall(plain))
+    words = len(WORD.findall(CJK_CHARS.sub(" ", plain)))
+    return max(1, math.ceil(words / WORDS_PER_MINUTE + cjk_chars / CJK_CHARS_PER_MINUTE))
+
+
+def make_excerpt(plain: str, max_length: int = EXCERPT_MAX_LENGTH) -> str:
+    """평문 앞부분 요약 (max_length 이내, 잘리면 단어 경계에서 자르고 '…')"""
+    text = " ".join(plain.split())
+    if len(text) <= max_length:
+        return text
+
+    cut = text[:max_length - 1]
+    # 공백으로 구분되는 글이면 단어 중간에서 자르지 않는다 (CJK처럼 공백이 드물면 글자 단위)
+    boundary = cut.rfind(" ")
+    if boundary > max_length * 0.6:
+        cut = cut[:boundary]
+    return cut.rstrip(" ,.;:!?·-") + "…"
+
+
+def render_html(content: str) -> Optional[str]:
+    """
+    미리 렌더링한 HTML (POST_RENDER_HTML이 꺼져 있으면 None)
+
+    markdown은 본문의 raw HTML을 그대로 통과시키므로, 응답에 그대로 넣을 수 있도록
+    허용한 태그/속성만 남긴다 (<script>, on* 속성, javascript: URL 제거).
+    """
+    if not settings.POST_RENDER_HTML:
+        return None
+    # 선택 의존성: HTML 사전 렌더링을 쓸 때만 필요
+    import markdown
+    import nh3
+
+    html = markdown.markdown(content, extensions=["fenced_code", "tables", "sane_lists"])
+    return nh3.clean(html, attributes=_allowed_attributes(nh3))
+
+
+def _allowed_attributes(nh3) -> dict:
+    # 기본 allowlist + 코드 블록 언어 class (fenced_code: <code class="language-python">)
+    attributes = {tag: set(names) for tag, names in nh3.ALLOWED_ATTRIBUTES.items()}
+    attributes.setdefault("code", set()).add("class")
+    return attributes
+
+
+def process_content(content: str, excerpt: Optional[str] = None) -> dict:
+    """본문 → 함께 저장할 파생 필드 (excerpt를 지정하지 않으면 자동 생성)"""
+    plain = strip_markdown(content)
+    return {
+        "read_time": estimate_read_time(plain),
+        "excerpt": excerpt or make_excerpt(plain),
+        "content_html": render_html(content),
+    }
+
+
+def is_auto_excerpt(content: str, excerpt: str) -> bool:
+    """excerpt가 content에서 자동 생성된 값인지 (본문 수정 시 다시 생성할지 판단)"""
+    return excerpt == make_excerpt(strip_markdown(content))
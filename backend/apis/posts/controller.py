@@ -1,97 +1,209 @@
 from typing import Optional
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session, load_only, selectinload
 from sqlalchemy.exc import IntegrityError
 from fastapi import Depends, HTTPException
 from apis.auth.controller import AuthController
+from common.principal import Principal
 from apis.posts.models import Post, PostTags
+from apis.posts.content import is_auto_excerpt, make_excerpt, process_content, strip_markdown
 from apis.posts.schema import PostUpdate
+from apis.posts.search import search_index
+from apis.posts.view_counter import view_counter
+from apis.generation.counter import get_generation_state
+from apis.tag.controller import TagController
+from apis.tag.models import Tag
+from common.controller import controller_provider
+from common.pagination import paginate_keyset
+from common.response_cache import invalidate_tags
 from database.engine import get_db
 
+# 목록 응답(PostResponse)에 필요한 컬럼만 로드 (content, content_html 같은 큰 TEXT 컬럼 제외)
+# 태그는 selectinload: 페이지의 Post id를 먼저 조회한 뒤 IN 쿼리 한 번으로 로드
+# (joinedload는 LIMIT 쿼리를 서브쿼리로 감싸고 태그 수만큼 행이 늘어난다)
+POST_LIST_COLUMNS = (
+    Post.id, Post.title, Post.excerpt, Post.cover_image, Post.category,
+    Post.created_at, Post.read_time, Post.view_count, Post.is_published,
+)
+
+# 상세/ETag/조회수 경로는 미리 만든 statement 재사용 (값은 bound parameter)
+POST_STATE = select(Post.version, Post.view_count, Post.updated_at)\
+    .where(Post.id == bindparam("post_id"), Post.is_deleted == False)
+POST_AUTHOR_ID = select(Post.author_id).where(Post.id == bindparam("post_id"), Post.is_deleted == False)
+# 태그는 selectinload: Post PK 조회 + post_id 인덱스로 IN 쿼리 한 번
+# (joinedload는 post_tags JOIN tags를 중첩 조인으로 만들어 SQLite가 post_tags 전체를 스캔한다)
+POST_BY_ID = select(Post).options(selectinload(Post.tags))\
+    .where(Post.id == bindparam("post_id"), Post.is_deleted == False)
+
+
 class PostController:
-    def __init__(self, db: Session = Depends(get_db), auth_controller: AuthController = Depends()):
+    def __init__(self, db: Session = Depends(get_db), auth_controller: AuthController = Depends(), tag_controller: TagController = Depends()):
         self.db = db
         self.auth_controller = auth_controller
+        self.tag_controller = tag_controller
 
-    def get_all_posts(self, email: str):
+    def get_all_posts(self, principal: Principal):
         """모든 Posts 조회 (관리자용)"""
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user or not user.is_superuser:
             raise HTTPException(status_code=403, detail="Not authorized to view all posts")
-        query = self.db.query(Post).options(joinedload(Post.tags)).filter(Post.is_deleted == False)
+        query = self.db.query(Post)\
+            .options(load_only(*POST_LIST_COLUMNS), selectinload(Post.tags))\
+            .filter(Post.is_deleted == False)
         return query.order_by(Post.created_at.desc()).all()
 
-    def get_posts(self, category: Optional[str] = None, search: Optional[str] = None, skip: int = 0, limit: int = 10):
-        """Posts 조회 with 필터링 및 페이징"""
-        query = self.db.query(Post).options(joinedload(Post.tags)).filter(Post.is_deleted == False, Post.is_published == True)
-
+    def _published_conditions(self, category: Optional[str] = None, tag: Optional[str] = None) -> list:
+        """공개 Posts 조건 (삭제 제외, 발행만, 카테고리/태그 필터)"""
+        conditions = [Post.is_deleted == False, Post.is_published == True]
         if category:
-            query = query.filter(Post.category == category)
+            conditions.append(Post.category == category)
+        if tag:
+            # (tag_id, post_id) 인덱스로 해당 태그의 Post id만 조회
+            conditions.append(Post.id.in_(select(PostTags.post_id).join(Tag).where(Tag.name == tag)))
+        return conditions
 
+    def _published_posts_query(self, category: Optional[str] = None, tag: Optional[str] = None):
+        """공개 Posts 목록 쿼리 (목록 컬럼만)"""
+        return self.db.query(Post)\
+            .options(load_only(*POST_LIST_COLUMNS), selectinload(Post.tags))\
+            .filter(*self._published_conditions(category, tag))
+
+    def get_posts(self, category: Optional[str] = None, search: Optional[str] = None, skip: int = 0, limit: int = 10, tag: Optional[str] = None):
+        """Posts 조회 with 필터링 및 페이징"""
+        query = self._published_posts_query(category, tag)
+
+        # 검색어가 있으면 전문 검색 인덱스로 조회 (관련도 순 정렬)
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(Post.title.ilike(search_term) | Post.content.ilike(search_term))
-        query = query.order_by(Post.created_at.desc())
+            return search_index.search(self.db, query, search, skip, limit)
+
+        query = query.order_by(Post.created_at.desc(), Post.id.desc())
         posts = query.offset(skip).limit(limit).all()
         
         return posts
 
+    def get_posts_page(self, category: Optional[str] = None, cursor: str = "", limit: int = 10, tag: Optional[str] = None):
+        """Posts cursor 페이징 조회 (created_at, id 기준) → (posts, next_cursor)"""
+        return paginate_keyset(self._published_posts_query(category, tag), Post, cursor, limit)
+
+    def get_posts_state(self):
+        """목록 ETag용 변경 세대 (PK 조회 한 번, 필터는 ETag의 query string으로 구분) → (state, last_modified)"""
+        return get_generation_state(self.db, "posts")
+
+    def get_post_state(self, post_id: int):
+        """상세 ETag용 버전 조회 → (state, last_modified), 없으면 None"""
+        row = self.db.execute(POST_STATE, {"post_id": post_id}).first()
+        if row is None:
+            return None
+        return (row.version, row.view_count), row.updated_at
+
     def get_post_by_id(self, post_id: int):
         """ID로 Post 조회"""
-        return self.db.query(Post).options(joinedload(Post.tags)).filter(Post.id == post_id).first()
+        return self.db.scalars(POST_BY_ID, {"post_id": post_id}).first()
     
-    def create_post(self, post_create, email: str):
+    def create_post(self, post_create, principal: Principal):
         """Post creation - Step 1"""
         post_data = post_create.dict(exclude={"tags"})
-        author_id = self.auth_controller.get_user_by_email(email).id
+        # 읽는 시간, 요약, HTML은 작성 시 한 번만 계산
+        post_data.update(process_content(post_create.content, post_create.excerpt))
+        user = self.auth_controller.resolve_user(principal)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        author_id = user.id
         post_data["author_id"] = author_id
-        post_data["read_time"] = max(1, len(post_create.content) // 200)
 
         # 1. Post 객체 생성
         db_post = Post(**post_data)
         try:
             self.db.add(db_post)
             self.db.flush()
-            if post_create.tags:
-                for tag_name in post_create.tags:
-                    tag = PostTags(post_id=db_post.id, tag_name=tag_name)
-                    self.db.add(tag)
+            # 태그는 중복 제거 후 INSERT 한 번으로 저장 (새 Post라 기존 연결 없음)
+            self.tag_controller.set_post_tags(db_post, post_create.tags, existing=[])
 
+            search_index.index_post(self.db, db_post)
             self.db.commit()
             self.db.refresh(db_post)
+            invalidate_tags("posts", "tags")
             return db_post
         
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(status_code=400, detail="Post creation failed due to integrity error.")
 
-    def increment_view_count(self, post_id: int, email: Optional[str] = None):
-        """Increase the view count of a post"""
-        post = self.db.query(Post).options(joinedload(Post.tags)).filter(Post.id == post_id).first()
-        if not post:
+    def increment_view_count(self, post_id: int, principal: Optional[Principal] = None):
+        """Increase the view count of a post (메모리 버퍼에 적재, 주기적으로 일괄 반영)"""
+        # 없는/삭제된 Post는 버퍼에 넣지 않는다 (대시보드 total_views 부풀림 방지)
+        author_id = self.db.execute(POST_AUTHOR_ID, {"post_id": post_id}).scalar()
+        if author_id is None:
             raise HTTPException(status_code=404, detail="Post not found")
-        if email:
-            user = self.auth_controller.get_user_by_email(email)
-            if user and post.author_id == user.id:
+
+        if principal:
+            user = self.auth_controller.resolve_user(principal)
+            if user and author_id == user.id:
                 return {"message": "Authors cannot increment view count on their own posts"}
-        post.view_count += 1
 
-        self.db.commit()
-        self.db.refresh(post)
-        return post
+        view_counter.increment(post_id)
+        return {"message": "View counted"}
 
-    def update_post(self, post_id: int, post_update: PostUpdate, email: str):
+    def update_post(self, post_id: int, post_update: PostUpdate, principal: Principal):
         """Update a Post"""
-        post = self.db.query(Post).options(joinedload(Post.tags)).filter(Post.id == post_id).first()
+        post = self.db.query(Post).options(selectinload(Post.tags)).filter(Post.id == post_id).first()
         if not post:
             raise HTTPException(status_code=404, detail="Post not found")
 
-        user = self.auth_controller.get_user_by_email(email)
-        if post.author_id != user.id:
+        user = self.auth_controller.resolve_user(principal)
+        if not user or post.author_id != user.id:
             raise HTTPException(status_code=403, detail="Not authorized to update this post")
 
-        for key, value in post_update.dict(exclude_unset=True).items():
+        update_data = post_update.dict(exclude_unset=True)
+        tags = update_data.pop("tags", None)
+        if update_data.get("content") is not None:
+            # 본문이 바뀌면 파생 필드 재계산 (직접 작성한 요약은 유지)
+            excerpt = update_data.get("excerpt")
+            if not excerpt and "excerpt" not in update_data and not is_auto_excerpt(post.content, post.excerpt):
+                excerpt = post.excerpt
+            update_data.update(process_content(update_data["content"], excerpt))
+        elif "excerpt" in update_data and not update_data["excerpt"]:
+            # 요약을 비우면 현재 본문으로 다시 생성
+            update_data["excerpt"] = make_excerpt(strip_markdown(post.content))
+        for key, value in update_data.items():
             setattr(post, key, value)
 
-        self.db.commit()
+        try:
+            # 태그는 기존 행과 비교해 바뀐 것만 반영, 변경 시 Post 버전도 갱신 (ETag 변경)
+            if tags is not None and self.tag_controller.set_post_tags(post, tags):
+                post.updated_at = func.now()
+
+            # 제목/본문이 바뀐 경우에만 검색 인덱스 갱신
+            if post_update.title is not None or post_update.content is not None:
+                search_index.index_post(self.db, post)
+
+            self.db.commit()
+        except IntegrityError:
+            # 같은 Post의 태그를 동시에 수정해 (tag_id, post_id) 유니크 인덱스에 걸린 경우
+            self.db.rollback()
+            raise HTTPException(status_code=409, detail="Post tags were modified concurrently, please retry")
         self.db.refresh(post)
-        return post
\ No newline at end of file
+        invalidate_tags("posts", "tags", f"post:{post.id}")
+        return post
+
+    def delete_post(self, post_id: int, principal: Principal):
+        """Delete a Post (soft delete)"""
+        post = self.db.query(Post).filter(Post.id == post_id, Post.is_deleted == False).first()
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+
+        user = self.auth_controller.resolve_user(principal)
+        if not user or post.author_id != user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to delete this post")
+
+        post.is_deleted = True
+        self.db.commit()
+        invalidate_tags("posts", "tags", f"post:{post_id}")
+        return {"message": "Post deleted successfully"}
+
+
+def build_post_controller(db: Session) -> PostController:
+    return PostController(db, AuthController(db), TagController(db))
+
+
+get_post_controller = controller_provider(build_post_controller)
@@ -1,6 +1,7 @@
 from database.engine import Base
-from sqlalchemy import Column, ForeignKey, Integer, String, Text, Boolean, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import event, Column, ForeignKey, Index, Integer, String, Text, Boolean, DateTime
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred, object_session
 from sqlalchemy.sql import func  # ★서버 시간 사용을 위해 임포트
 
 class Post(Base):
@@ -12,7 +13,10 @@ class Post(Base):
     # [수정] String -> Text (긴 글)
     content = Column(Text, nullable=False) 
 
-    # [추가] Excerpt (요약)
+    # [추가] 미리 렌더링한 HTML (POST_RENDER_HTML 설정 시 작성/수정 때 생성)
+    content_html = Column(Text, nullable=True)
+
+    # [추가] Excerpt (요약, 비워서 보내면 본문에서 자동 생성)
     excerpt = Column(String(150), nullable=False)
 
     # category 
@@ -21,7 +25,7 @@ class Post(Base):
     # cover image URL
     cover_image = Column(String, nullable=True)
 
-    # 읽는 시간 (분 단위, 프론트에서 계산해서 전달 또는 백엔드에서 자동 계산)
+    # 읽는 시간 (분 단위, 작성/수정 시 본문에서 계산)
     read_time = Column(Integer, nullable=True)
 
     # 조회수
@@ -32,6 +36,9 @@ class Post(Base):
 
     # Post의 작성자(User)
     author = relationship("User", back_populates="posts")
+    # 태그 연결은 selectin으로 함께 로드 (AsyncSession에서 지연 로딩 I/O 방지)
+    # backref 대신 여기서 선언해 모듈 수준 statement의 로더 옵션에서 바로 쓸 수 있게 한다
+    tags = relationship("PostTags", back_populates="post", lazy="selectin")
     
     # [수정] 의미/로직 정상화 (기본: 삭제 안 됨)
     is_deleted = Column(Boolean, nullable=False, default=False) 
@@ -45,6 +52,18 @@ class Post(Base):
     # [수정] Integer -> DateTime (업데이트 시각 자동 갱신)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    # [추가] 수정 버전 (ORM UPDATE마다 1씩 증가, ETag 계산용, 낙관적 잠금 아님 → _bump_post_version)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    # [추가] 전문 검색용 tsvector (PostgreSQL 전용, 조회 시 로드하지 않음)
+    search_vector = deferred(Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True))
+
+    __table_args__ = (
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+        # keyset(cursor) 페이징용 복합 인덱스
+        Index("ix_posts_created_at_id", "created_at", "id"),
+    )
+
     @property
     def tag_names(self) -> list[str]:
         """태그 이름 리스트 반환"""
@@ -55,10 +74,27 @@ class Post(Base):
         """Frontend에서 published로 사용"""
         return self.is_published
 
+@event.listens_for(Post, "before_update")
+def _bump_post_version(mapper, connection, target):
+    # 컬럼이 바뀐 UPDATE만 증가 (SQL 식이라 동시 수정도 각각 반영, StaleDataError 없음)
+    if object_session(target).is_modified(target, include_collections=False):
+        target.version = Post.version + 1
+
 class PostTags(Base):
     __tablename__ = "post_tags"
 
     id = Column(Integer, primary_key=True, index=True)
-    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False)
-    tag_name = Column(String, nullable=False)
-    post = relationship("Post", backref="tags")
\ No newline at end of file
+    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False, index=True)
+    tag_id = Column(Integer, ForeignKey("tags.id"), nullable=False)
+    post = relationship("Post", back_populates="tags")
+    # 태그 이름은 같은 쿼리에서 join으로 로드
+    tag = relationship("Tag", back_populates="post_tags", lazy="joined", innerjoin=True)
+
+    __table_args__ = (
+        # 태그 → Post 조회 (?tag= 필터), 같은 태그 중복 연결 방지
+        Index("ix_post_tags_tag_id_post_id", "tag_id", "post_id", unique=True),
+    )
+
+    @property
+    def tag_name(self) -> str:
+        return self.tag.name
@@ -1,15 +1,15 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Any, Optional
+from pydantic import AliasChoices, BaseModel, Field
+from typing import Optional
 from datetime import datetime
 
 
 # ===== Request Schemas =====
 
 class PostCreate(BaseModel):
-    """Post 생성"""
+    """Post 생성 (excerpt를 비우면 본문에서 자동 생성)"""
     title: str
     content: str
-    excerpt: str
+    excerpt: Optional[str] = Field(None, max_length=150)
     category: str
     cover_image: Optional[str] = None
     tags: list[str] = []
@@ -20,7 +20,7 @@ class PostUpdate(BaseModel):
     """Post 수정"""
     title: Optional[str] = None
     content: Optional[str] = None
-    excerpt: Optional[str] = None
+    excerpt: Optional[str] = Field(None, max_length=150)
     category: Optional[str] = None
     cover_image: Optional[str] = None
     tags: Optional[list[str]] = None
@@ -35,38 +35,28 @@ class PostResponse(BaseModel):
     excerpt: str
     cover_image: Optional[str]
     category: str
-    tag_names: list[str] = Field(alias="tags")  # Post.tag_names → response["tags"]
+    # Post.tag_names(property)에서 바로 읽음 → response["tags"]
+    tag_names: list[str] = Field(alias="tags", validation_alias=AliasChoices("tag_names", "tags"))
     created_at: datetime
     read_time: Optional[int]
     view_count: int
     published: bool  # Post.published property 사용
 
-    @field_validator("tag_names", mode='before')
-    @classmethod
-    def flatten_tags_list(cls, v: Any) -> list[str]:
-        """
-        ORM에서 읽어온 'tags' 관계(객체 리스트)를
-        문자열('tag_name') 리스트로 변환합니다.
-        """
-        if isinstance(v, list):
-            # v는 [<PostTags object>, <PostTags object>, ...] 리스트입니다.
-            # 이 객체들에서 .tag_name 속성만 뽑아서 새 리스트를 만듭니다.
-            return [tag.tag_name for tag in v]
-        return v
-
     class Config:
         from_attributes = True
         populate_by_name = True
 
 class PostDetailResponse(BaseModel):
-    """Post 상세 (content 포함)"""
+    """Post 상세 (content, 미리 렌더링한 content_html 포함)"""
     id: int
     title: str
     content: str
+    content_html: Optional[str] = None
     excerpt: str
     cover_image: Optional[str]
     category: str
-    tag_names: list[str] = Field(alias="tags")  # Post.tag_names → response["tags"]
+    # Post.tag_names(property)에서 바로 읽음 → response["tags"]
+    tag_names: list[str] = Field(alias="tags", validation_alias=AliasChoices("tag_names", "tags"))
     created_at: datetime
     updated_at: datetime
     read_time: Optional[int]
@@ -74,19 +64,6 @@ class PostDetailResponse(BaseModel):
     published: bool  # Post.published property 사용
     author_id: int
 
-    @field_validator("tag_names", mode='before')
-    @classmethod
-    def flatten_tags_list(cls, v: Any) -> list[str]:
-        """
-        ORM에서 읽어온 'tags' 관계(객체 리스트)를
-        문자열('tag_name') 리스트로 변환합니다.
-        """
-        if isinstance(v, list):
-            # v는 [<PostTags object>, <PostTags object>, ...] 리스트입니다.
-            # 이 객체들에서 .tag_name 속성만 뽑아서 새 리스트를 만듭니다.
-            return [tag.tag_name for tag in v]
-        return v
-    
     class Config:
         from_attributes = True
         populate_by_name = True
@@ -99,3 +76,8 @@ class PostListResponse(BaseModel):
     per_page: int
     posts: list[PostResponse]
 
+
+class PostCursorPage(BaseModel):
+    """Post 목록 (cursor 페이징)"""
+    posts: list[PostResponse]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,168 @@
+"""게시글 전문 검색 인덱스
+
+- PostgreSQL: posts.search_vector(tsvector) + GIN 인덱스, ts_rank 순으로 정렬
+- 그 외(SQLite 등): 프로세스 내 역색인(inverted index)으로 대체
+"""
+import bisect
+import math
+import re
+import threading
+from collections import defaultdict
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from apis.posts.models import Post
+from common.config import settings
+from database.engine import engine
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# 제목에 등장한 단어는 본문보다 가중치를 높게 준다
+TITLE_WEIGHT = 3
+
+
+def tokenize(text: str) -> list[str]:
+    """소문자 단어 토큰 리스트 (한글 포함 유니코드 단어 단위)"""
+    return [token.lower() for token in TOKEN_PATTERN.findall(text or "")]
+
+
+class PostgresSearchIndex:
+    """tsvector/GIN 기반 검색 (DB가 색인과 랭킹을 모두 처리)"""
+
+    def __init__(self, config: str = settings.SEARCH_CONFIG):
+        self.config = config
+
+    def index_post(self, db: Session, post: Post):
+        """commit 전에 호출: 같은 트랜잭션에서 search_vector 갱신"""
+        post.search_vector = func.setweight(func.to_tsvector(self.config, post.title or ""), "A").op("||")(
+            func.setweight(func.to_tsvector(self.config, post.content or ""), "B")
+        )
+
+    def search(self, db: Session, query, text: str, skip: int, limit: int) -> list[Post]:
+        ts_query = func.websearch_to_tsquery(self.config, text)
+        return query.filter(Post.search_vector.op("@@")(ts_query))\
+            .order_by(func.ts_rank(Post.search_vector, ts_query).desc(), Post.created_at.desc())\
+            .offset(skip).limit(limit).all()
+
+
+class InMemorySearchIndex:
+    """프로세스 내 역색인 (SQLite 개발 환경용)
+
+    token -> {post_id: 가중 빈도} 형태로 보관하고, 첫 검색 시 DB에서 한 번 빌드한 뒤
+    create_post/update_post에서 해당 게시글만 증분 갱신한다.
+    검색어의 각 토큰은 접두어로 매칭한다 ("파이썬" → "파이썬을").
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._built = False
+        self._changes = 0
+        self._postings: dict[str, dict[int, int]] = defaultdict(dict)
+        self._doc_terms: dict[int, dict[str, int]] = {}
+        self._vocabulary: list[str] = []
+        self._vocabulary_dirty = False
+
+    def _term_frequencies(self, title: str, content: str) -> dict[str, int]:
+        frequencies: dict[str, int] = defaultdict(int)
+        for token in tokenize(title):
+            frequencies[token] += TITLE_WEIGHT
+        for token in tokenize(content):
+            frequencies[token] += 1
+        return frequencies
+
+    def _remove(self, post_id: int):
+        for term in self._doc_terms.pop(post_id, {}):
+            postings = self._postings[term]
+            postings.pop(post_id, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+
+    def _add(self, post_id: int, title: str, content: str):
+        frequencies = self._term_frequencies(title, content)
+        self._doc_terms[post_id] = frequencies
+        for term, frequency in frequencies.items():
+            if term not in self._postings:
+                self._vocabulary_dirty = True
+            self._postings[term][post_id] = frequency
+
+    def _build(self, db: Session):
+        """요청의 Session으로 전체 색인 (DB_ASYNC면 run_sync 안에서 비동기 I/O)"""
+        while not self._built:
+            # 조회는 락 밖에서: run_sync 중 I/O 대기 시 이벤트 루프로 양보하므로
+            # 락을 쥔 채 기다리면 같은 루프의 다른 검색이 루프 스레드를 막는다
+            changes = self._changes
+            rows = db.execute(select(Post.id, Post.title, Post.content)).all()
+            with self._lock:
+                if self._built or self._changes != changes:
+                    # 조회 도중 색인된 게시글이 있으면 다시 조회
+                    continue
+                for post_id, title, content in rows:
+                    self._add(post_id, title, content)
+                self._built = True
+
+    def index_post(self, db: Session, post: Post):
+        """게시글 하나만 다시 색인 (빌드 전이면 첫 검색 때 함께 반영됨)"""
+        with self._lock:
+            if not self._built:
+                self._changes += 1
+                return
+            self._remove(post.id)
+            self._add(post.id, post.title, post.content)
+
+    def _matching_terms(self, prefix: str) -> list[str]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def rank(self, db: Session, text: str) -> dict[int, float]:
+        """검색어의 모든 토큰을 포함하는 post_id -> TF-IDF 점수"""
+        tokens = tokenize(text)
+        if not tokens:
+            return {}
+
+        self._build(db)
+        with self._lock:
+            total_docs = max(len(self._doc_terms), 1)
+            scores: dict[int, float] = {}
+            for index, token in enumerate(tokens):
+                token_scores: dict[int, float] = defaultdict(float)
+                for term in self._matching_terms(token):
+                    postings = self._postings[term]
+                    idf = math.log(1 + total_docs / len(postings))
+                    for post_id, frequency in postings.items():
+                        token_scores[post_id] += (1 + math.log(frequency)) * idf
+
+                if index == 0:
+                    scores = dict(token_scores)
+                else:
+                    scores = {post_id: score + token_scores[post_id] for post_id, score in scores.items() if post_id in token_scores}
+                if not scores:
+                    break
+            return scores
+
+    def search(self, db: Session, query, text: str, skip: int, limit: int) -> list[Post]:
+        scores = self.rank(db, text)
+        if not scores:
+            return []
+        posts = query.filter(Post.id.in_(scores.keys())).all()
+        posts.sort(key=lambda post: (scores[post.id], post.created_at), reverse=True)
+        return posts[skip:skip + limit]
+
+
+def create_search_index():
+    """DB 방언에 맞는 검색 인덱스 선택"""
+    if engine.dialect.name == "postgresql":
+        return PostgresSearchIndex()
+    return InMemorySearchIndex()
+
+
+search_index = create_search_index()
@@ -0,0 +1,117 @@
+"""조회수 write-behind 버퍼
+
+요청마다 Post를 읽고 commit 하는 대신 메모리(post_id 기준 샤드)에 증가분을 모아두고,
+백그라운드 스레드가 주기적으로 `UPDATE posts SET view_count = view_count + n`을
+한 번의 executemany로 반영한다. 종료 시 남은 증가분을 모두 flush 한다.
+그 사이 삭제된 Post의 증가분은 버린다 (flush listener에는 실제 반영된 증가분만 전달).
+"""
+import logging
+import threading
+
+from sqlalchemy import bindparam, select, update
+
+from apis.posts.models import Post
+from common.config import settings
+from database.engine import engine
+
+logger = logging.getLogger(__name__)
+
+posts_table = Post.__table__
+
+# 반영 대상: 존재하고 삭제되지 않은 Post (행 잠금으로 UPDATE까지 삭제와 섞이지 않게 함)
+LIVE_POSTS_STATEMENT = select(posts_table.c.id)\
+    .where(posts_table.c.id.in_(bindparam("post_ids", expanding=True)), posts_table.c.is_deleted == False)\
+    .with_for_update()
+
+# updated_at은 그대로 유지 (조회수 증가는 글 수정이 아님)
+FLUSH_STATEMENT = update(posts_table)\
+    .where(posts_table.c.id == bindparam("b_post_id"), posts_table.c.is_deleted == False)\
+    .values(view_count=posts_table.c.view_count + bindparam("b_increment"), updated_at=posts_table.c.updated_at)
+
+
+class ViewCounter:
+    def __init__(self, shards: int = 16, flush_interval: float = 5.0, max_pending_per_shard: int = 1000):
+        self.flush_interval = flush_interval
+        self.max_pending_per_shard = max_pending_per_shard
+        self._shards = [({}, threading.Lock()) for _ in range(shards)]
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._flush_listeners = []
+
+    def add_flush_listener(self, listener):
+        """flush 트랜잭션 안에서 listener(connection, {post_id: 반영된 증가분}) 호출"""
+        self._flush_listeners.append(listener)
+
+    def increment(self, post_id: int, amount: int = 1):
+        """조회수 증가분 적재 (DB 접근 없음)"""
+        counts, lock = self._shards[post_id % len(self._shards)]
+        with lock:
+            counts[post_id] = counts.get(post_id, 0) + amount
+            pending = len(counts)
+
+        # 버퍼가 너무 커지면 주기를 기다리지 않고 flush
+        if pending > self.max_pending_per_shard:
+            self._wake.set()
+
+    def _drain(self) -> dict[int, int]:
+        drained = {}
+        for counts, lock in self._shards:
+            with lock:
+                drained.update(counts)
+                counts.clear()
+        return drained
+
+    def flush(self) -> int:
+        """버퍼의 증가분을 DB에 일괄 반영, 반영한 post 수 반환 (없거나 삭제된 Post는 제외)"""
+        with self._flush_lock:
+            pending = self._drain()
+            if not pending:
+                return 0
+
+            try:
+                with engine.begin() as connection:
+                    live = connection.scalars(LIVE_POSTS_STATEMENT, {"post_ids": list(pending)}).all()
+                    applied = {post_id: pending[post_id] for post_id in live}
+                    if applied:
+                        params = [{"b_post_id": post_id, "b_increment": increment} for post_id, increment in applied.items()]
+                        connection.execute(FLUSH_STATEMENT, params)
+                        for listener in self._flush_listeners:
+                            listener(connection, applied)
+            except Exception:
+                # 실패한 증가분은 버리지 않고 다시 적재
+                logger.exception("View count flush failed, re-queueing %d posts", len(pending))
+                for post_id, increment in pending.items():
+                    self.increment(post_id, increment)
+                return 0
+            return len(applied)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def start(self):
+        """백그라운드 flush 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="view-counter-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """flush 스레드 종료 후 남은 증가분까지 반영 (graceful shutdown)"""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+view_counter = ViewCounter(
+    shards=settings.VIEW_COUNTER_SHARDS,
+    flush_interval=settings.VIEW_COUNTER_FLUSH_SECONDS,
+)
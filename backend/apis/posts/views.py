@@ -1,51 +1,100 @@
-from typing import Optional
-from fastapi import APIRouter
+from typing import Optional, Union
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from fastapi import Depends
 
 from common.utils import JWTHandler
+from common.principal import Principal
+from common.conditional import make_etag, not_modified_response, with_validators
+from common.response_cache import cached_json
 from database.engine import get_db
-from apis.posts.schema import PostCreate, PostUpdate, PostResponse
-from apis.posts.controller import PostController
+from apis.posts.schema import PostCreate, PostUpdate, PostResponse, PostDetailResponse, PostCursorPage
+from apis.posts.controller import get_post_controller
 router = APIRouter(prefix="/posts", tags=["Posts"])  # noqa: F401
 
-@router.get("/", response_model=list[PostResponse])
+post_list_adapter = TypeAdapter(list[PostResponse])
+post_page_adapter = TypeAdapter(PostCursorPage)
+post_adapter = TypeAdapter(PostDetailResponse)
+
+@router.get("/", response_model=Union[list[PostResponse], PostCursorPage])
 async def get_posts(
+    request: Request,
     category: Optional[str] = None,
+    tag: Optional[str] = None,
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 10,
-    controller: PostController = Depends()
+    cursor: Optional[str] = Query(None, description="cursor 페이징 (첫 페이지는 빈 값, 이후 next_cursor 전달)"),
+    controller = Depends(get_post_controller)
 ):
     """
     /posts → 전체 포스트
     /posts?category=React → 카테고리 필터
+    /posts?tag=fastapi → 태그 필터
     /posts?search=typescript → 검색
     /posts?category=React&search=hook → 복합 필터
+    /posts?cursor= → cursor 페이징 ({posts, next_cursor} 반환)
     """
-    return controller.get_posts(category=category, search=search, skip=skip, limit=limit)
+    if cursor is not None and search:
+        raise HTTPException(status_code=400, detail="Cursor pagination is not supported with search")
+
+    # 변경이 없으면 목록을 읽지 않고 304
+    state, last_modified = await controller.get_posts_state()
+    etag = make_etag("posts", request.url.query, *state)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    if cursor is not None:
+        async def load_page():
+            posts, next_cursor = await controller.get_posts_page(category=category, cursor=cursor, limit=limit, tag=tag)
+            return {"posts": posts, "next_cursor": next_cursor}
+        response = await cached_json(request, ("posts",), load_page, post_page_adapter, version=etag)
+    else:
+        async def load_posts():
+            return await controller.get_posts(category=category, search=search, skip=skip, limit=limit, tag=tag)
+        response = await cached_json(request, ("posts",), load_posts, post_list_adapter, version=etag)
+    return with_validators(response, etag, last_modified)
+
 @router.get("/all", response_model=list[PostResponse])
-async def get_all_posts(controller: PostController = Depends(), email: str = Depends(JWTHandler.verify_token)):
-    return controller.get_all_posts(email=email)
+async def get_all_posts(controller = Depends(get_post_controller), principal: Principal = Depends(JWTHandler.verify_principal)):
+    return await controller.get_all_posts(principal=principal)
+
+@router.post("/create", response_model=PostDetailResponse)
+async def create_post(requests: PostCreate, controller = Depends(get_post_controller), principal: Principal = Depends(JWTHandler.verify_principal)):
+    return await controller.create_post(requests, principal=principal)
+
+@router.get("/{post_id}", response_model=PostDetailResponse)
+async def get_post(post_id: int, request: Request, controller = Depends(get_post_controller)):
+    post_state = await controller.get_post_state(post_id)
+    if not post_state:
+        raise HTTPException(status_code=404, detail="Post not found")
 
-@router.post("/create")
-async def create_post(requests: PostCreate, controller: PostController = Depends(), email: str = Depends(JWTHandler.verify_token)):
-    return controller.create_post(requests, email=email)
+    state, last_modified = post_state
+    etag = make_etag("post", post_id, *state)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified:
+        return not_modified
 
-@router.get("/{post_id}", response_model=PostResponse)
-async def get_post(post_id: int, controller: PostController = Depends()):
-    return controller.get_post_by_id(post_id)
+    async def load_post():
+        post = await controller.get_post_by_id(post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+        return post
+    response = await cached_json(request, (f"post:{post_id}",), load_post, post_adapter, version=etag)
+    return with_validators(response, etag, last_modified)
 
 # 조회수 증가
 @router.post("/{post_id}/view")
-async def view_post(post_id: int, controller: PostController = Depends(), email: Optional[str] = Depends(JWTHandler.verify_token_optional)):
-    return controller.increment_view_count(post_id, email=email)
+async def view_post(post_id: int, controller = Depends(get_post_controller), principal: Optional[Principal] = Depends(JWTHandler.verify_principal_optional)):
+    return await controller.increment_view_count(post_id, principal=principal)
 
-@router.put("/{post_id}")
-async def update_post(post_id: int, requests: PostUpdate, controller: PostController = Depends(), email: str = Depends(JWTHandler.verify_token)):
-    return controller.update_post(post_id, requests, email=email)
+@router.put("/{post_id}", response_model=PostDetailResponse)
+async def update_post(post_id: int, requests: PostUpdate, controller = Depends(get_post_controller), principal: Principal = Depends(JWTHandler.verify_principal)):
+    return await controller.update_post(post_id, requests, principal=principal)
 
 @router.delete("/{post_id}")
-async def delete_post(post_id: int, controller: PostController = Depends(), email: str = Depends(JWTHandler.verify_token)):
-    return controller.delete_post(post_id, email=email)
+async def delete_post(post_id: int, controller = Depends(get_post_controller), principal: Principal = Depends(JWTHandler.verify_principal)):
+    return await controller.delete_post(post_id, principal=principal)
 
@@ -1,30 +1,47 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from fastapi import Depends, HTTPException
 from apis.auth.controller import AuthController
+from common.principal import Principal
 from apis.profile.models import Profile, Profile_skills, Profile_timeline
 from apis.profile import schema
+from apis.generation.counter import bump_generation, get_generation_state
+from common.bulk import bulk_insert, unique_names
+from common.controller import controller_provider
+from common.response_cache import invalidate_tags
 from database.engine import get_db
 
+# 공개 프로필 조회는 미리 만든 statement 재사용 (skills × timeline 행 곱을 피하려고 컬렉션마다 IN 쿼리)
+PROFILE_BY_USER_ID = select(Profile)\
+    .options(selectinload(Profile.skills), selectinload(Profile.timeline))\
+    .where(Profile.user_id == bindparam("user_id"))\
+    .limit(1)
+
 
 class ProfileController:
     def __init__(self, db: Session = Depends(get_db), auth_controller: AuthController = Depends()):
         self.db = db
         self.auth_controller = auth_controller
 
+    def _touch(self):
+        """commit 전에 호출: profiles 세대 +1 (bulk INSERT는 ORM 이벤트를 거치지 않으므로 직접 올린다)"""
+        bump_generation(self.db.connection(), "profiles")
+
+    def get_profiles_state(self):
+        """프로필 조회 ETag용 변경 세대 → (state, last_modified)"""
+        return get_generation_state(self.db, "profiles")
+
     # ===== Profile CRUD =====
 
     def get_profile_by_user_id(self, user_id: int):
         """User ID로 프로필 조회"""
-        return self.db.query(Profile)\
-            .options(joinedload(Profile.skills), joinedload(Profile.timeline))\
-            .filter(Profile.user_id == user_id)\
-            .first()
+        return self.db.scalars(PROFILE_BY_USER_ID, {"user_id": user_id}).first()
 
-    def create_profile(self, profile_create: schema.ProfileCreate, email: str):
+    def create_profile(self, profile_create: schema.ProfileCreate, principal: Principal):
         """프로필 생성"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -41,17 +58,19 @@ class ProfileController:
 
         try:
             self.db.add(db_profile)
+            self._touch()
             self.db.commit()
             self.db.refresh(db_profile)
+            invalidate_tags(f"profile:{user.id}")
             return db_profile
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(status_code=400, detail="Profile creation failed")
 
-    def update_profile(self, profile_update: schema.ProfileUpdate, email: str):
+    def update_profile(self, profile_update: schema.ProfileUpdate, principal: Principal):
         """프로필 수정"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -65,8 +84,10 @@ class ProfileController:
             setattr(profile, key, value)
 
         try:
+            self._touch()
             self.db.commit()
             self.db.refresh(profile)
+            invalidate_tags(f"profile:{user.id}")
             return profile
         except IntegrityError:
             self.db.rollback()
@@ -74,10 +95,10 @@ class ProfileController:
 
     # ===== Skills =====
 
-    def add_skill(self, skill_create: schema.SkillCreate, email: str):
+    def add_skill(self, skill_create: schema.SkillCreate, principal: Principal):
         """기술 스택 추가 (사용자 이메일 기반)"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -95,17 +116,51 @@ class ProfileController:
 
         try:
             self.db.add(skill)
+            self._touch()
             self.db.commit()
             self.db.refresh(skill)
+            invalidate_tags(f"profile:{user.id}")
             return skill
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(status_code=400, detail="Skill creation failed")
 
-    def delete_skill(self, skill_id: int, email: str):
+    def add_skills(self, skill_bulk: schema.SkillBulkCreate, principal: Principal):
+        """기술 스택 일괄 추가 (INSERT 한 번, 중복/기존 이름 제외)"""
+        # 1. 사용자 조회
+        user = self.auth_controller.resolve_user(principal)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        # 2. 프로필 조회
+        profile = self.get_profile_by_user_id(user.id)
+        if not profile:
+            raise HTTPException(status_code=404, detail="Profile not found. Create profile first.")
+
+        # 3. 기술 스택 일괄 추가 (같은 이름은 처음 것만)
+        categories = {}
+        for skill in skill_bulk.skills:
+            categories.setdefault(skill.skill_name.strip(), skill.category)
+        skill_names = unique_names(categories, exclude=(skill.skill_name for skill in profile.skills))
+        if not skill_names:
+            return []
+
+        try:
+            skills = bulk_insert(self.db, Profile_skills, [
+                {"profile_id": profile.id, "skill_name": name, "category": categories[name]} for name in skill_names
+            ], returning=True)
+            self._touch()
+            self.db.commit()
+            invalidate_tags(f"profile:{user.id}")
+            return skills
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(status_code=400, detail="Skill creation failed")
+
+    def delete_skill(self, skill_id: int, principal: Principal):
         """기술 스택 삭제 (사용자 이메일 기반)"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -125,15 +180,17 @@ class ProfileController:
 
         # 4. 삭제
         self.db.delete(skill)
+        self._touch()
         self.db.commit()
+        invalidate_tags(f"profile:{user.id}")
         return {"message": "Skill deleted successfully"}
 
     # ===== Timeline =====
 
-    def add_timeline_event(self, timeline_create: schema.TimelineCreate, email: str):
+    def add_timeline_event(self, timeline_create: schema.TimelineCreate, principal: Principal):
         """타임라인 생성 (사용자 이메일 기반)"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -152,17 +209,44 @@ class ProfileController:
 
         try:
             self.db.add(timeline)
+            self._touch()
             self.db.commit()
             self.db.refresh(timeline)
+            invalidate_tags(f"profile:{user.id}")
             return timeline
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(status_code=400, detail="Timeline event creation failed")
 
-    def delete_timeline_event(self, timeline_id: int, email: str):
+    def add_timeline_events(self, timeline_bulk: schema.TimelineBulkCreate, principal: Principal):
+        """타임라인 일괄 생성 (INSERT 한 번)"""
+        # 1. 사용자 조회
+        user = self.auth_controller.resolve_user(principal)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        # 2. 프로필 조회
+        profile = self.get_profile_by_user_id(user.id)
+        if not profile:
+            raise HTTPException(status_code=404, detail="Profile not found. Create profile first.")
+
+        # 3. 타임라인 이벤트 일괄 생성
+        try:
+            events = bulk_insert(self.db, Profile_timeline, [
+                {"profile_id": profile.id, **event.dict()} for event in timeline_bulk.events
+            ], returning=True)
+            self._touch()
+            self.db.commit()
+            invalidate_tags(f"profile:{user.id}")
+            return events
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(status_code=400, detail="Timeline event creation failed")
+
+    def delete_timeline_event(self, timeline_id: int, principal: Principal):
         """타임라인 삭제 (사용자 이메일 기반)"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -182,5 +266,14 @@ class ProfileController:
 
         # 4. 삭제
         self.db.delete(timeline)
+        self._touch()
         self.db.commit()
+        invalidate_tags(f"profile:{user.id}")
         return {"message": "Timeline event deleted successfully"}
+
+
+def build_profile_controller(db: Session) -> ProfileController:
+    return ProfileController(db, AuthController(db))
+
+
+get_profile_controller = controller_provider(build_profile_controller)
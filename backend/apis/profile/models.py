@@ -11,10 +11,10 @@ class Profile(Base):
 
     # Profile이 속한 User
     user = relationship("User", back_populates="profile")
-    # Profile의 타임라인 이벤트 목록
-    timeline = relationship("Profile_timeline", back_populates="profile")
+    # Profile의 타임라인 이벤트 목록 (selectin: 응답 직렬화 시 지연 로딩 방지)
+    timeline = relationship("Profile_timeline", back_populates="profile", lazy="selectin")
     # Profile의 스킬 목록
-    skills = relationship("Profile_skills", back_populates="profile")
+    skills = relationship("Profile_skills", back_populates="profile", lazy="selectin")
     # [개선] Integer -> Boolean (의미가 명확함)
     is_public = Column(Boolean, default=True)
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 
 
@@ -10,6 +10,11 @@ class SkillCreate(BaseModel):
     category: Optional[str] = None
 
 
+class SkillBulkCreate(BaseModel):
+    """기술 스택 일괄 추가 (중복/기존 이름은 제외)"""
+    skills: list[SkillCreate] = Field(min_length=1, max_length=100)
+
+
 class SkillResponse(BaseModel):
     """기술 스택 조회"""
     id: int
@@ -29,6 +34,11 @@ class TimelineCreate(BaseModel):
     event_date: str  # "2024", "2024-01" 형식
 
 
+class TimelineBulkCreate(BaseModel):
+    """타임라인 일괄 생성"""
+    events: list[TimelineCreate] = Field(min_length=1, max_length=100)
+
+
 class TimelineResponse(BaseModel):
     """타임라인 조회"""
     id: int
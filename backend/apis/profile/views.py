@@ -1,67 +1,93 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from database.engine import get_db
 from common.utils import JWTHandler
+from common.principal import Principal
+from common.conditional import make_etag, not_modified_response, with_validators
+from common.response_cache import cached_json
 from apis.profile import schema
-from apis.profile.controller import ProfileController
+from apis.profile.controller import get_profile_controller
 
 router = APIRouter(prefix="/profile", tags=["Profile"])
 
+profile_adapter = TypeAdapter(schema.ProfileResponse)
+
 
 # ===== Profile API =====
 
 @router.get("/{user_id}", response_model=schema.ProfileResponse)
-async def get_profile(user_id: int, controller: ProfileController = Depends()):
+async def get_profile(user_id: int, request: Request, controller = Depends(get_profile_controller)):
     """프로필 조회 """
-    profile = controller.get_profile_by_user_id(user_id)
-    if not profile:
-        raise HTTPException(status_code=404, detail="Profile not found")
-
-    # is_public 체크
-    if not profile.is_public:
-        raise HTTPException(status_code=403, detail="This profile is private")
-
-    return profile
+    # 세대가 같으면 304, 응답 캐시 키에도 포함해 다른 워커의 변경 후 이전 본문을 내보내지 않는다
+    state, last_modified = await controller.get_profiles_state()
+    etag = make_etag("profile", user_id, *state)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    async def load_profile():
+        profile = await controller.get_profile_by_user_id(user_id)
+        if not profile:
+            raise HTTPException(status_code=404, detail="Profile not found")
+
+        # is_public 체크 (비공개 프로필은 캐시되지 않음)
+        if not profile.is_public:
+            raise HTTPException(status_code=403, detail="This profile is private")
+
+        return profile
+    response = await cached_json(request, (f"profile:{user_id}",), load_profile, profile_adapter, version=etag)
+    return with_validators(response, etag, last_modified)
 
 @router.post("/", response_model=schema.ProfileResponse)
 async def create_profile(
     profile_create: schema.ProfileCreate,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProfileController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_profile_controller)
 ):
     """프로필 생성 (사용자 이메일 기반)"""
-    return controller.create_profile(profile_create, email)
+    return await controller.create_profile(profile_create, principal)
 
 @router.put("/", response_model=schema.ProfileResponse)
 async def update_profile(
     profile_update: schema.ProfileUpdate,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProfileController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_profile_controller)
 ):
     """프로필 수정 (사용자 이메일 기반)"""
-    return controller.update_profile(profile_update, email)
+    return await controller.update_profile(profile_update, principal)
 
 # ===== Skills API =====
 
 @router.post("/skills", response_model=schema.SkillResponse)
 async def add_skill(
     skill_create: schema.SkillCreate,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProfileController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_profile_controller)
 ):
     """기술 스택 추가 (사용자 이메일 기반)"""
-    return controller.add_skill(skill_create, email)
+    return await controller.add_skill(skill_create, principal)
+
+
+@router.post("/skills/bulk", response_model=list[schema.SkillResponse])
+async def add_skills(
+    skill_bulk: schema.SkillBulkCreate,
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_profile_controller)
+):
+    """기술 스택 일괄 추가 (추가된 항목만 반환)"""
+    return await controller.add_skills(skill_bulk, principal)
 
 
 @router.delete("/skills/{skill_id}")
 async def delete_skill(
     skill_id: int,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProfileController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_profile_controller)
 ):
     """기술 스택 삭제 (사용자 이메일 기반)"""
-    return controller.delete_skill(skill_id, email)
+    return await controller.delete_skill(skill_id, principal)
 
 
 # ===== Timeline API =====
@@ -69,18 +95,28 @@ async def delete_skill(
 @router.post("/timeline", response_model=schema.TimelineResponse)
 async def add_timeline_event(
     timeline_create: schema.TimelineCreate,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProfileController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_profile_controller)
 ):
     """타임라인 생성 (사용자 이메일 기반)"""
-    return controller.add_timeline_event(timeline_create, email)
+    return await controller.add_timeline_event(timeline_create, principal)
+
+
+@router.post("/timeline/bulk", response_model=list[schema.TimelineResponse])
+async def add_timeline_events(
+    timeline_bulk: schema.TimelineBulkCreate,
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_profile_controller)
+):
+    """타임라인 일괄 생성"""
+    return await controller.add_timeline_events(timeline_bulk, principal)
 
 
 @router.delete("/timeline/{timeline_id}")
 async def delete_timeline_event(
     timeline_id: int,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProfileController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_profile_controller)
 ):
     """타임라인 삭제 (사용자 이메일 기반)"""
-    return controller.delete_timeline_event(timeline_id, email)
+    return await controller.delete_timeline_event(timeline_id, principal)
@@ -1,13 +1,34 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
 from sqlalchemy.exc import IntegrityError
 from fastapi import Depends, HTTPException
 from typing import Optional
 from apis.auth.controller import AuthController
+from common.principal import Principal
 from apis.project.models import Project, Project_tech_stack
 from apis.project import schema
+from apis.generation.counter import get_generation_state
+from common.bulk import bulk_insert, unique_names
+from common.controller import controller_provider
+from common.pagination import paginate_keyset
+from common.response_cache import invalidate_tags
 from database.engine import get_db
 
 
+# 목록 응답(ProjectListResponse)에 필요한 컬럼만 로드 (detail_content, images 제외)
+# 기술 스택은 selectinload (페이지 id로 IN 쿼리 한 번)
+PROJECT_LIST_COLUMNS = (
+    Project.id, Project.title, Project.description, Project.thumbnail, Project.role,
+    Project.start_date, Project.end_date, Project.status, Project.featured, Project.created_at,
+)
+
+# 상세/ETag 경로는 미리 만든 statement 재사용 (값은 bound parameter)
+PROJECT_BY_ID = select(Project).options(joinedload(Project.tech_stacks))\
+    .where(Project.id == bindparam("project_id"), Project.is_deleted == False)
+PROJECT_STATE = select(Project.version, Project.updated_at)\
+    .where(Project.id == bindparam("project_id"), Project.is_deleted == False)
+
+
 class ProjectController:
     def __init__(self, db: Session = Depends(get_db), auth_controller: AuthController = Depends()):
         self.db = db
@@ -15,16 +36,10 @@ class ProjectController:
 
     # ===== Project CRUD =====
 
-    def get_projects(
-        self,
-        status: Optional[str] = None,
-        featured: Optional[bool] = None,
-        skip: int = 0,
-        limit: int = 10
-    ):
-        """프로젝트 목록 조회 (필터링 가능)"""
+    def _projects_query(self, status: Optional[str] = None, featured: Optional[bool] = None):
+        """프로젝트 목록 쿼리 (삭제 제외, 필터 적용, 목록 컬럼만)"""
         query = self.db.query(Project)\
-            .options(joinedload(Project.tech_stacks))\
+            .options(load_only(*PROJECT_LIST_COLUMNS), selectinload(Project.tech_stacks))\
             .filter(Project.is_deleted == False)
 
         if status:
@@ -32,24 +47,53 @@ class ProjectController:
 
         if featured is not None:
             query = query.filter(Project.featured == featured)
+        return query
+
+    def get_projects(
+        self,
+        status: Optional[str] = None,
+        featured: Optional[bool] = None,
+        skip: int = 0,
+        limit: int = 10
+    ):
+        """프로젝트 목록 조회 (필터링 가능)"""
+        query = self._projects_query(status, featured)
 
         # 최신순 정렬
-        query = query.order_by(Project.created_at.desc())
+        query = query.order_by(Project.created_at.desc(), Project.id.desc())
 
         projects = query.offset(skip).limit(limit).all()
         return projects
 
+    def get_projects_page(
+        self,
+        status: Optional[str] = None,
+        featured: Optional[bool] = None,
+        cursor: str = "",
+        limit: int = 10
+    ):
+        """프로젝트 cursor 페이징 조회 (created_at, id 기준) → (projects, next_cursor)"""
+        return paginate_keyset(self._projects_query(status, featured), Project, cursor, limit)
+
+    def get_projects_state(self):
+        """목록 ETag용 변경 세대 (PK 조회 한 번, 필터는 ETag의 query string으로 구분) → (state, last_modified)"""
+        return get_generation_state(self.db, "projects")
+
+    def get_project_state(self, project_id: int):
+        """상세 ETag용 버전 조회 → (state, last_modified), 없으면 None"""
+        row = self.db.execute(PROJECT_STATE, {"project_id": project_id}).first()
+        if row is None:
+            return None
+        return (row.version,), row.updated_at
+
     def get_project_by_id(self, project_id: int):
         """ID로 프로젝트 조회"""
-        return self.db.query(Project)\
-            .options(joinedload(Project.tech_stacks))\
-            .filter(Project.id == project_id, Project.is_deleted == False)\
-            .first()
+        return self.db.scalars(PROJECT_BY_ID, {"project_id": project_id}).unique().first()
 
-    def create_project(self, project_create: schema.ProjectCreate, email: str):
+    def create_project(self, project_create: schema.ProjectCreate, principal: Principal):
         """프로젝트 생성"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -63,15 +107,16 @@ class ProjectController:
             self.db.add(db_project)
             self.db.commit()
             self.db.refresh(db_project)
+            invalidate_tags("projects")
             return db_project
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(status_code=400, detail="Project creation failed")
 
-    def update_project(self, project_id: int, project_update: schema.ProjectUpdate, email: str):
+    def update_project(self, project_id: int, project_update: schema.ProjectUpdate, principal: Principal):
         """프로젝트 수정"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -91,15 +136,16 @@ class ProjectController:
         try:
             self.db.commit()
             self.db.refresh(project)
+            invalidate_tags("projects", f"project:{project.id}")
             return project
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(status_code=400, detail="Project update failed")
 
-    def delete_project(self, project_id: int, email: str):
+    def delete_project(self, project_id: int, principal: Principal):
         """프로젝트 삭제 (soft delete)"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -115,14 +161,15 @@ class ProjectController:
         # 4. Soft delete
         project.is_deleted = True
         self.db.commit()
+        invalidate_tags("projects", f"project:{project_id}")
         return {"message": "Project deleted successfully"}
 
     # ===== Tech Stack =====
 
-    def add_tech_stack(self, project_id: int, tech_create: schema.TechStackCreate, email: str):
+    def add_tech_stack(self, project_id: int, tech_create: schema.TechStackCreate, principal: Principal):
         """기술 스택 추가"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -141,19 +188,56 @@ class ProjectController:
             tech_name=tech_create.tech_name
         )
 
+        # 상위 프로젝트 버전 갱신 (ETag 변경)
+        project.updated_at = func.now()
+
         try:
             self.db.add(tech_stack)
             self.db.commit()
             self.db.refresh(tech_stack)
+            invalidate_tags("projects", f"project:{project.id}")
             return tech_stack
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(status_code=400, detail="Tech stack creation failed")
 
-    def delete_tech_stack(self, tech_id: int, email: str):
+    def add_tech_stacks(self, project_id: int, tech_bulk: schema.TechStackBulkCreate, principal: Principal):
+        """기술 스택 일괄 추가 (INSERT 한 번, 중복/기존 이름 제외)"""
+        # 1. 사용자 조회
+        user = self.auth_controller.resolve_user(principal)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        # 2. 기존 프로젝트 조회
+        project = self.get_project_by_id(project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        # 3. 권한 체크
+        if project.owner_id != user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to modify this project")
+
+        # 4. 기술 스택 일괄 추가
+        tech_names = unique_names(tech_bulk.tech_names, exclude=(tech.tech_name for tech in project.tech_stacks))
+        if not tech_names:
+            return []
+
+        try:
+            tech_stacks = bulk_insert(self.db, Project_tech_stack, [
+                {"project_id": project.id, "tech_name": tech_name} for tech_name in tech_names
+            ], returning=True)
+            project.updated_at = func.now()
+            self.db.commit()
+            invalidate_tags("projects", f"project:{project.id}")
+            return tech_stacks
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(status_code=400, detail="Tech stack creation failed")
+
+    def delete_tech_stack(self, tech_id: int, principal: Principal):
         """기술 스택 삭제"""
         # 1. 사용자 조회
-        user = self.auth_controller.get_user_by_email(email)
+        user = self.auth_controller.resolve_user(principal)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -176,5 +260,14 @@ class ProjectController:
 
         # 5. 기술 스택 삭제
         self.db.delete(tech_stack)
+        project.updated_at = func.now()
         self.db.commit()
+        invalidate_tags("projects", f"project:{project.id}")
         return {"message": "Tech stack deleted successfully"}
+
+
+def build_project_controller(db: Session) -> ProjectController:
+    return ProjectController(db, AuthController(db))
+
+
+get_project_controller = controller_provider(build_project_controller)
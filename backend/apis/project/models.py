@@ -1,6 +1,6 @@
 from database.engine import Base
-from sqlalchemy import JSON, DateTime, Text, Column, Integer, String, Boolean, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import event, JSON, DateTime, Text, Column, Index, Integer, String, Boolean, ForeignKey
+from sqlalchemy.orm import object_session, relationship
 from sqlalchemy.sql import func  # ★서버 시간 사용을 위해 임포트
 
 class Project(Base):
@@ -52,7 +52,7 @@ class Project(Base):
     owner = relationship("User", back_populates="projects")
 
     # Project의 기술 스택 목록 (Post의 tags와 동일한 방식)
-    tech_stacks = relationship("Project_tech_stack", back_populates="project")
+    tech_stacks = relationship("Project_tech_stack", back_populates="project", lazy="selectin")
 
     # 삭제 여부 (Post와 동일)
     is_deleted = Column(Boolean, nullable=False, default=False)
@@ -63,6 +63,25 @@ class Project(Base):
     # 업데이트 시각 자동 갱신
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    # 수정 버전 (ORM UPDATE마다 1씩 증가, ETag 계산용, 낙관적 잠금 아님 → _bump_project_version)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    __table_args__ = (
+        # keyset(cursor) 페이징용 복합 인덱스
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
+
+    @property
+    def tech_stack_names(self) -> list[str]:
+        """기술 스택 이름 리스트 반환"""
+        return [tech.tech_name for tech in self.tech_stacks]
+
+@event.listens_for(Project, "before_update")
+def _bump_project_version(mapper, connection, target):
+    # 컬럼이 바뀐 UPDATE만 증가 (SQL 식이라 동시 수정도 각각 반영, StaleDataError 없음)
+    if object_session(target).is_modified(target, include_collections=False):
+        target.version = Project.version + 1
+
 class Project_tech_stack(Base):
     __tablename__ = "project_tech_stack"
 
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Any, Optional
+from pydantic import AliasChoices, BaseModel, Field
+from typing import Optional
 from datetime import datetime
 
 
@@ -10,6 +10,11 @@ class TechStackCreate(BaseModel):
     tech_name: str
 
 
+class TechStackBulkCreate(BaseModel):
+    """기술 스택 일괄 추가 (중복/기존 이름은 제외)"""
+    tech_names: list[str] = Field(min_length=1, max_length=100)
+
+
 class TechStackResponse(BaseModel):
     """기술 스택 조회 응답"""
     id: int
@@ -72,18 +77,11 @@ class ProjectResponse(BaseModel):
     status: str
     featured: bool
     owner_id: int
-    tech_stack_names: list[str] = Field(alias="tech_stacks")
+    # Project.tech_stack_names(property)에서 바로 읽음 → response["tech_stacks"]
+    tech_stack_names: list[str] = Field(alias="tech_stacks", validation_alias=AliasChoices("tech_stack_names", "tech_stacks"))
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("tech_stack_names", mode='before')
-    @classmethod
-    def flatten_tech_stacks(cls, v: Any) -> list[str]:
-        """ORMX tech_stacks 기술 스택 배열 전환"""
-        if isinstance(v, list):
-            return [tech.tech_name for tech in v]
-        return v
-
     class Config:
         from_attributes = True
         populate_by_name = True
@@ -100,18 +98,16 @@ class ProjectListResponse(BaseModel):
     end_date: Optional[str]
     status: str
     featured: bool
-    tech_stack_names: list[str] = Field(alias="tech_stacks")
+    # Project.tech_stack_names(property)에서 바로 읽음 → response["tech_stacks"]
+    tech_stack_names: list[str] = Field(alias="tech_stacks", validation_alias=AliasChoices("tech_stack_names", "tech_stacks"))
     created_at: datetime
 
-    @field_validator("tech_stack_names", mode='before')
-    @classmethod
-    def flatten_tech_stacks(cls, v: Any) -> list[str]:
-        """ORMX tech_stacks 기술 스택 배열 전환"""
-
-        if isinstance(v, list):
-            return [tech.tech_name for tech in v]
-        return v
-
     class Config:
         from_attributes = True
         populate_by_name = True
+
+
+class ProjectCursorPage(BaseModel):
+    """프로젝트 목록 조회 응답 (cursor 페이징)"""
+    projects: list[ProjectListResponse]
+    next_cursor: Optional[str] = None
@@ -1,64 +1,103 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import Optional, Union
+from pydantic import TypeAdapter
 from common.utils import JWTHandler
+from common.principal import Principal
+from common.conditional import make_etag, not_modified_response, with_validators
+from common.response_cache import cached_json
 from apis.project import schema
-from apis.project.controller import ProjectController
+from apis.project.controller import get_project_controller
 
 router = APIRouter(prefix="/project", tags=["Project"])
 
+project_list_adapter = TypeAdapter(list[schema.ProjectListResponse])
+project_page_adapter = TypeAdapter(schema.ProjectCursorPage)
+project_adapter = TypeAdapter(schema.ProjectResponse)
+
 
 # ===== Project API =====
 
-@router.get("/", response_model=list[schema.ProjectListResponse])
+@router.get("/", response_model=Union[list[schema.ProjectListResponse], schema.ProjectCursorPage])
 async def get_projects(
+    request: Request,
     status: Optional[str] = Query(None, description="Filter by status: completed, in-progress, archived"),
     featured: Optional[bool] = Query(None, description="Filter by featured"),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    controller: ProjectController = Depends()
+    cursor: Optional[str] = Query(None, description="Cursor pagination (empty for first page, then next_cursor)"),
+    controller = Depends(get_project_controller)
 ):
-    """프로젝트 목록 조회 (필터링 가능)"""
-    return controller.get_projects(status=status, featured=featured, skip=skip, limit=limit)
+    """프로젝트 목록 조회 (필터링 가능, cursor 지정 시 {projects, next_cursor} 반환)"""
+    # 변경이 없으면 목록을 읽지 않고 304
+    state, last_modified = await controller.get_projects_state()
+    etag = make_etag("projects", request.url.query, *state)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    if cursor is not None:
+        async def load_page():
+            projects, next_cursor = await controller.get_projects_page(status=status, featured=featured, cursor=cursor, limit=limit)
+            return {"projects": projects, "next_cursor": next_cursor}
+        response = await cached_json(request, ("projects",), load_page, project_page_adapter, version=etag)
+    else:
+        async def load_projects():
+            return await controller.get_projects(status=status, featured=featured, skip=skip, limit=limit)
+        response = await cached_json(request, ("projects",), load_projects, project_list_adapter, version=etag)
+    return with_validators(response, etag, last_modified)
 
 
 @router.get("/{project_id}", response_model=schema.ProjectResponse)
-async def get_project(project_id: int, controller: ProjectController = Depends()):
+async def get_project(project_id: int, request: Request, controller = Depends(get_project_controller)):
     """프로젝트 조회"""
-    project = controller.get_project_by_id(project_id)
-    if not project:
+    project_state = await controller.get_project_state(project_id)
+    if not project_state:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+
+    state, last_modified = project_state
+    etag = make_etag("project", project_id, *state)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    async def load_project():
+        project = await controller.get_project_by_id(project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return project
+    response = await cached_json(request, (f"project:{project_id}",), load_project, project_adapter, version=etag)
+    return with_validators(response, etag, last_modified)
 
 
 @router.post("/", response_model=schema.ProjectResponse)
 async def create_project(
     project_create: schema.ProjectCreate,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProjectController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_project_controller)
 ):
     """프로젝트 생성"""
-    return controller.create_project(project_create, email)
+    return await controller.create_project(project_create, principal)
 
 
 @router.put("/{project_id}", response_model=schema.ProjectResponse)
 async def update_project(
     project_id: int,
     project_update: schema.ProjectUpdate,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProjectController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_project_controller)
 ):
     """프로젝트 수정 (x-user-email)"""
-    return controller.update_project(project_id, project_update, email)
+    return await controller.update_project(project_id, project_update, principal)
 
 
 @router.delete("/{project_id}")
 async def delete_project(
     project_id: int,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProjectController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_project_controller)
 ):
     """프로젝트 삭제 (x-user-email)"""
-    return controller.delete_project(project_id, email)
+    return await controller.delete_project(project_id, principal)
 
 
 # ===== Tech Stack API =====
@@ -67,18 +106,29 @@ async def delete_project(
 async def add_tech_stack(
     project_id: int,
     tech_create: schema.TechStackCreate,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProjectController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_project_controller)
 ):
     """기술 스택 추가 (x-user-email)"""
-    return controller.add_tech_stack(project_id, tech_create, email)
+    return await controller.add_tech_stack(project_id, tech_create, principal)
+
+
+@router.post("/{project_id}/tech-stack/bulk", response_model=list[schema.TechStackResponse])
+async def add_tech_stacks(
+    project_id: int,
+    tech_bulk: schema.TechStackBulkCreate,
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_project_controller)
+):
+    """기술 스택 일괄 추가 (추가된 항목만 반환)"""
+    return await controller.add_tech_stacks(project_id, tech_bulk, principal)
 
 
 @router.delete("/tech-stack/{tech_id}")
 async def delete_tech_stack(
     tech_id: int,
-    email: str = Depends(JWTHandler.verify_token),
-    controller: ProjectController = Depends()
+    principal: Principal = Depends(JWTHandler.verify_principal),
+    controller = Depends(get_project_controller)
 ):
     """기술 스택 삭제 (x-user-email)"""
-    return controller.delete_tech_stack(tech_id, email)
+    return await controller.delete_tech_stack(tech_id, principal)
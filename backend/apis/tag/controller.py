@@ -0,0 +1,86 @@
+from typing import Optional
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from fastapi import Depends
+from apis.generation.counter import get_generation_state
+from apis.posts.models import Post, PostTags
+from apis.tag.counts import adjust_tag_counts, is_visible
+from apis.tag.models import Tag
+from common.bulk import bulk_insert, unique_names
+from common.controller import controller_provider
+from database.engine import get_db
+
+
+class TagController:
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+
+    def get_tags(self, limit: int = 100):
+        """공개 Post가 있는 태그 목록 (Post 수 많은 순)"""
+        return self.db.execute(
+            select(Tag).where(Tag.post_count > 0).order_by(Tag.post_count.desc(), Tag.name).limit(limit)
+        ).scalars().all()
+
+    def get_tags_state(self):
+        """태그 목록 ETag용 변경 세대 → (state, last_modified)"""
+        return get_generation_state(self.db, "tags")
+
+    def _insert_missing(self):
+        """이미 있는 이름은 무시하는 INSERT (동시 생성 대비)"""
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(Tag).on_conflict_do_nothing(index_elements=["name"])
+        if dialect == "sqlite":
+            return sqlite.insert(Tag).on_conflict_do_nothing(index_elements=["name"])
+        return insert(Tag)
+
+    def get_tag_ids(self, names: list[str], create: bool = False) -> dict[str, int]:
+        """이름 → tag id (create=True면 없는 태그를 INSERT 한 번으로 생성)"""
+        if not names:
+            return {}
+        tag_ids = dict(self.db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(names))).all())
+
+        missing = [name for name in names if name not in tag_ids]
+        if create and missing:
+            self.db.execute(self._insert_missing(), [{"name": name} for name in missing])
+            tag_ids.update(self.db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(missing))).all())
+        return tag_ids
+
+    def set_post_tags(self, post: Post, tag_names: list[str], existing: Optional[list[PostTags]] = None) -> bool:
+        """
+        Post 태그를 tag_names로 맞춤 (집합 diff: bulk DELETE 한 번 + bulk INSERT 한 번)
+
+        태그 개수와 상관없이 문장 수가 일정하고, 공개 Post면 post_count도 함께 갱신한다.
+        existing을 생략하면 post.tags를 기존 연결로 사용. 반환값: 변경 여부
+        """
+        existing = list(post.tags) if existing is None else existing
+        # 대기 중인 Post 변경(공개 여부 등)을 먼저 반영해 아래 증분이 현재 공개 상태 기준이 되도록 한다
+        self.db.flush()
+
+        desired = unique_names(tag_names)
+        kept, removed = set(), []
+        for post_tag in existing:
+            if post_tag.tag_name in desired and post_tag.tag_name not in kept:
+                kept.add(post_tag.tag_name)
+            else:
+                removed.append(post_tag)
+        added = [name for name in desired if name not in kept]
+
+        delta = 1 if is_visible(post) else 0
+        connection = self.db.connection()
+        if removed:
+            self.db.execute(delete(PostTags).where(PostTags.id.in_([post_tag.id for post_tag in removed])))
+            adjust_tag_counts(connection, [post_tag.tag_id for post_tag in removed], -delta)
+        if added:
+            tag_ids = self.get_tag_ids(added, create=True)
+            bulk_insert(self.db, PostTags, [{"post_id": post.id, "tag_id": tag_ids[name]} for name in added])
+            adjust_tag_counts(connection, list(tag_ids.values()), delta)
+        return bool(removed or added)
+
+
+def build_tag_controller(db: Session) -> TagController:
+    return TagController(db)
+
+
+get_tag_controller = controller_provider(build_tag_controller)
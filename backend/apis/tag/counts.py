@@ -0,0 +1,73 @@
+"""태그별 공개 Post 수(tags.post_count) 유지
+
+- 증분: 태그 연결/해제(TagController.set_post_tags)와 Post 공개 상태 변경(ORM 이벤트)이
+  변경과 같은 트랜잭션에서 post_count를 +/- 갱신한다.
+- 재계산: reconcile_tag_counts()가 한 번의 UPDATE로 다시 계산한다 (앱 시작 시).
+- 어느 쪽이든 같은 트랜잭션에서 "tags" 세대를 올려 태그 목록 ETag/응답 캐시 키가 바뀌게 한다.
+
+공개 = 발행(is_published) + 삭제 안 됨(is_deleted)
+"""
+from sqlalchemy import event, func, inspect, select, update
+
+from apis.generation.counter import bump_generation
+from apis.posts.models import Post, PostTags
+from apis.tag.models import Tag
+from database.engine import engine
+
+tags_table = Tag.__table__
+post_tags_table = PostTags.__table__
+posts_table = Post.__table__
+
+
+def is_visible(post) -> bool:
+    return bool(post.is_published) and not post.is_deleted
+
+
+def adjust_tag_counts(connection, tag_ids, delta: int):
+    """tag_ids(id 목록 또는 select)의 post_count에 delta 반영"""
+    if delta and tag_ids is not None:
+        connection.execute(
+            update(tags_table).where(tags_table.c.id.in_(tag_ids)).values(post_count=tags_table.c.post_count + delta)
+        )
+        bump_generation(connection, "tags")
+
+
+def _post_tag_ids(post_id: int):
+    return select(post_tags_table.c.tag_id).where(post_tags_table.c.post_id == post_id)
+
+
+def _previous(target, name: str):
+    """이번 flush 직전 값 (변경 없으면 현재 값)"""
+    history = inspect(target).attrs[name].history
+    return history.deleted[0] if history.deleted else getattr(target, name)
+
+
+@event.listens_for(Post, "after_update")
+def _post_updated(mapper, connection, target):
+    was_visible = bool(_previous(target, "is_published")) and not _previous(target, "is_deleted")
+    visible = is_visible(target)
+    if was_visible != visible:
+        adjust_tag_counts(connection, _post_tag_ids(target.id), 1 if visible else -1)
+
+
+@event.listens_for(Post, "after_delete")
+def _post_deleted(mapper, connection, target):
+    if is_visible(target):
+        adjust_tag_counts(connection, _post_tag_ids(target.id), -1)
+
+
+def reconcile_tag_counts():
+    """전체 재계산 (증분 갱신 오차 보정)"""
+    visible_count = (
+        select(func.count(post_tags_table.c.post_id))
+        .select_from(post_tags_table.join(posts_table, posts_table.c.id == post_tags_table.c.post_id))
+        .where(
+            post_tags_table.c.tag_id == tags_table.c.id,
+            posts_table.c.is_published == True,
+            posts_table.c.is_deleted == False,
+        )
+        .scalar_subquery()
+    )
+    with engine.begin() as connection:
+        connection.execute(update(tags_table).values(post_count=visible_count))
+        bump_generation(connection, "tags")
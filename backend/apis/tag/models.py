@@ -0,0 +1,17 @@
+from database.engine import Base
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import relationship
+
+class Tag(Base):
+    """태그 카탈로그 (이름 유일)
+
+    post_count는 공개(발행 + 삭제 안 됨) Post 수로, 태그 연결/해제와 Post 공개 상태 변경 시
+    같은 트랜잭션에서 증분 갱신된다 (apis/tag/counts.py).
+    """
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)
+    post_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    post_tags = relationship("PostTags", back_populates="tag")
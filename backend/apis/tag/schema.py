@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class TagResponse(BaseModel):
+    """태그 + 공개 Post 수"""
+    name: str
+    post_count: int
+
+    class Config:
+        from_attributes = True
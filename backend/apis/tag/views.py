@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import TypeAdapter
+
+from common.conditional import make_etag, not_modified_response, with_validators
+from common.response_cache import cached_json
+from apis.tag import schema
+from apis.tag.controller import get_tag_controller
+
+router = APIRouter(prefix="/tags", tags=["Tags"])
+
+tag_list_adapter = TypeAdapter(list[schema.TagResponse])
+
+
+@router.get("/", response_model=list[schema.TagResponse])
+async def get_tags(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000),
+    controller = Depends(get_tag_controller)
+):
+    """태그 목록 + 공개 Post 수 (태그 클라우드용, Post 수 많은 순)"""
+    # 세대가 같으면 304, 응답 캐시 키에도 포함해 다른 워커의 변경 후 이전 본문을 내보내지 않는다
+    state, last_modified = await controller.get_tags_state()
+    etag = make_etag("tags", request.url.query, *state)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    async def load_tags():
+        return await controller.get_tags(limit=limit)
+    response = await cached_json(request, ("tags",), load_tags, tag_list_adapter, version=etag)
+    return with_validators(response, etag, last_modified)
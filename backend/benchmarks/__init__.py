@@ -0,0 +1,14 @@
+"""API 부하 벤치마크
+
+    uv run python -m benchmarks seed --posts 2000 --reset
+    uv run python -m benchmarks run --mode inprocess --save benchmarks/baselines/local.json
+    uv run python -m benchmarks run --mode uvicorn --workers 2 --compare benchmarks/baselines/local.json
+    uv run python -m benchmarks loading --limit 20   # 목록 eager loading 비교 (loading.py)
+    uv run python -m benchmarks serialization --items 100  # 응답 직렬화 경로 비교 (serialization.py)
+    uv run python -m benchmarks jwt --iterations 20000  # 요청당 JWT 검증 비용 비교 (jwt_decode.py)
+    uv run python -m benchmarks hashing --target-ms 250  # 비밀번호 해싱 cost calibration (hashing.py)
+    uv run python -m benchmarks statements --iterations 2000  # 단건 조회 statement 재사용 (statements.py)
+
+DATABASE_URL을 지정하지 않으면 benchmarks/benchmark.db(SQLite)를 사용한다.
+baseline은 같은 장비/모드에서 만든 것과만 비교해야 의미가 있다.
+"""
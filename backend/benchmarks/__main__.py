@@ -0,0 +1,222 @@
+"""python -m benchmarks {seed,run,loading,serialization,jwt,hashing,statements} ..."""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _configure_environment(args):
+    # 앱 설정(common.config)은 import 시점에 읽히므로 먼저 지정
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{BACKEND_DIR / 'benchmarks' / 'benchmark.db'}")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-0123456789abcdef")  # HS256 권장 길이(32바이트) 이상
+    os.environ.setdefault("VIEW_COUNTER_FLUSH_SECONDS", "1")
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")  # 같은 IP/계정으로 반복 로그인하므로
+    os.environ.setdefault("QUERY_STATS_ENABLED", "true")  # 결과의 쿼리 수/DB 시간은 Server-Timing에서 읽는다
+    if getattr(args, "no_response_cache", False):
+        os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.chdir(BACKEND_DIR)
+
+
+def seed_command(args):
+    from benchmarks.seed import SeedConfig, seed_database
+    from database.engine import engine
+
+    config = SeedConfig(
+        users=args.users, posts=args.posts, tags_per_post=args.tags_per_post, tag_vocabulary=args.tags,
+        projects=args.projects, profiles=args.profiles, seed=args.seed,
+    )
+    counts = seed_database(engine, config, reset=args.reset)
+    print("seeded", ", ".join(f"{name}={count}" for name, count in counts.items()))
+
+
+def _print_row(name: str, result: dict):
+    print(f"{name:<24} {result['requests']:>6} {result['errors']:>6} "
+          f"{result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['rps']:>9.1f} {result['max_queries'] if result['max_queries'] is not None else '-':>8}", flush=True)
+
+
+def run_command(args):
+    from benchmarks.runner import RunConfig, compare, load_baseline, run, save_baseline
+    from benchmarks.scenarios import select_scenarios
+
+    scenarios = select_scenarios(args.only)
+    if not scenarios:
+        sys.exit("No scenarios matched --only")
+
+    config = RunConfig(
+        mode=args.mode, requests=args.requests, concurrency=args.concurrency, warmup=args.warmup,
+        seed=args.seed, port=args.port, workers=args.workers,
+    )
+    print(f"{'endpoint':<24} {'reqs':>6} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>9} {'queries':>8}")
+    result = run(scenarios, config, _print_row)
+
+    if args.save:
+        save_baseline(args.save, result)
+        print(f"saved {args.save}")
+
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        if baseline["meta"].get("mode") != result["meta"]["mode"]:
+            print(f"warning: baseline mode {baseline['meta'].get('mode')} != current mode {result['meta']['mode']}")
+        regressions = compare(baseline, result, args.threshold)
+        if regressions:
+            print(f"\nREGRESSIONS vs {args.compare} (threshold {args.threshold:.0%}):")
+            for regression in regressions:
+                print(f"  {regression['endpoint']:<24} {regression['metric']:<7} {regression['baseline']} -> {regression['current']}")
+            sys.exit(1)
+        print(f"\nno regressions vs {args.compare}")
+
+
+def loading_command(args):
+    from benchmarks.loading import run_loading
+    from database.engine import engine
+
+    print(f"{'query':<16} {'strategy':<9} {'parents':>8} {'queries':>8} {'rows':>8} {'values':>8} {'p50 ms':>9} {'p95 ms':>9}")
+
+    def report(name, strategy, result):
+        print(f"{name:<16} {strategy:<9} {result['parents']:>8} {result['queries']:>8} {result['rows']:>8} {result['values']:>8} "
+              f"{result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f}", flush=True)
+
+    run_loading(engine, args.limit, args.iterations, args.seed, report)
+
+
+def serialization_command(args):
+    from benchmarks.serialization import run_serialization
+
+    print(f"{'response':<16} {'path':<12} {'bytes':>8} {'p50 us':>10} {'p95 us':>10}")
+
+    def report(name, case, result):
+        print(f"{name:<16} {case:<12} {result['bytes']:>8} {result['p50_us']:>10.1f} {result['p95_us']:>10.1f}", flush=True)
+
+    run_serialization(args.items, args.tags_per_item, args.iterations, args.seed, report)
+
+
+def jwt_command(args):
+    from benchmarks.jwt_decode import run_jwt
+    from common.config import settings
+
+    print(f"JWT_BACKEND={settings.JWT_BACKEND} TOKEN_REVOCATION_BACKEND={settings.TOKEN_REVOCATION_BACKEND} revoked={args.revoked}")
+    print(f"{'path':<16} {'p50 us':>9} {'p95 us':>9} {'mean us':>9}")
+
+    def report(name, result):
+        print(f"{name:<16} {result['p50_us']:>9.2f} {result['p95_us']:>9.2f} {result['mean_us']:>9.2f}", flush=True)
+
+    run_jwt(args.iterations, args.revoked, report)
+
+
+def statements_command(args):
+    from benchmarks.statements import run_statements
+
+    print(f"{'lookup':<28} {'variant':<9} {'p50 us':>9} {'p95 us':>9} {'cache hit':>10}")
+
+    def report(name, variant, result):
+        if result is None:
+            print(f"{name:<28} {'-':<9} no rows (run seed first)", flush=True)
+            return
+        ratio = "-" if result["cache_hit_ratio"] is None else f"{result['cache_hit_ratio']:.1%}"
+        print(f"{name:<28} {variant:<9} {result['p50_us']:>9.1f} {result['p95_us']:>9.1f} {ratio:>10}", flush=True)
+
+    run_statements(args.iterations, args.seed, report)
+
+
+def hashing_command(args):
+    from benchmarks.hashing import calibrate
+    from common.config import settings
+
+    print(f"target {args.target_ms:.0f} ms per login, PASSWORD_HASH_WORKERS={settings.PASSWORD_HASH_WORKERS}")
+    print(f"{'scheme':<8} {'cost':<44} {'memory':>9} {'verify ms':>10}  result")
+
+    def report(scheme, cost, elapsed, result):
+        if cost is None:
+            print(f"{scheme:<8} {'-':<44} {'-':>9} {'-':>10}  {result}", flush=True)
+            return
+        options = ",".join(f"{name}={value}" for name, value in cost.options.items())
+        memory = f"{cost.memory_kib // 1024} MiB" if cost.memory_kib else "-"
+        print(f"{scheme:<8} {options:<44} {memory:>9} {elapsed:>10.1f}  {result}", flush=True)
+
+    recommendations = calibrate(args.schemes, args.target_ms, args.samples, report)
+
+    print("\nrecommended (highest cost within target):")
+    for scheme, best in recommendations.items():
+        if best is None:
+            print(f"  {scheme}: no setting within {args.target_ms:.0f} ms")
+            continue
+        cost, elapsed = best
+        # 해싱 스레드 풀이 동시에 처리할 수 있는 로그인 수
+        throughput = settings.PASSWORD_HASH_WORKERS * 1000 / elapsed
+        env = " ".join(f"{name}={value}" for name, value in cost.env.items())
+        print(f"  {scheme}: {env}  ({elapsed:.0f} ms, ~{throughput:.0f} logins/s per process)")
+    print("\nto switch schemes: PASSWORD_SCHEMES=<new>,<old> (old hashes are rehashed on next login)")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Blog API benchmark harness")
+    parser.add_argument("--database-url", help="기본값: DATABASE_URL 또는 benchmarks/benchmark.db")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    seed = subparsers.add_parser("seed", help="벤치마크 데이터 생성")
+    seed.add_argument("--users", type=int, default=20)
+    seed.add_argument("--posts", type=int, default=1000)
+    seed.add_argument("--tags", type=int, default=50, help="태그 종류 수")
+    seed.add_argument("--tags-per-post", type=int, default=3)
+    seed.add_argument("--projects", type=int, default=100)
+    seed.add_argument("--profiles", type=int, default=20)
+    seed.add_argument("--seed", type=int, default=42)
+    seed.add_argument("--reset", action="store_true", help="테이블을 모두 삭제 후 다시 생성 (주의)")
+    seed.set_defaults(handler=seed_command)
+
+    bench = subparsers.add_parser("run", help="벤치마크 실행")
+    bench.add_argument("--mode", choices=["inprocess", "uvicorn"], default="inprocess")
+    bench.add_argument("--requests", type=int, default=200, help="엔드포인트별 요청 수")
+    bench.add_argument("--concurrency", type=int, default=10)
+    bench.add_argument("--warmup", type=int, default=10)
+    bench.add_argument("--workers", type=int, default=1, help="uvicorn worker 수")
+    bench.add_argument("--port", type=int, default=8765)
+    bench.add_argument("--seed", type=int, default=42)
+    bench.add_argument("--only", nargs="*", default=[], help="엔드포인트 이름/접두어 (예: posts auth.login)")
+    bench.add_argument("--no-response-cache", action="store_true", help="응답 캐시 끄고 측정")
+    bench.add_argument("--save", help="결과를 JSON baseline으로 저장")
+    bench.add_argument("--compare", help="baseline JSON과 비교해 회귀 시 exit 1")
+    bench.add_argument("--threshold", type=float, default=0.15, help="회귀 판정 비율 (기본 15%%)")
+    bench.set_defaults(handler=run_command)
+
+    loading = subparsers.add_parser("loading", help="목록 쿼리 eager loading 비교 (joinedload vs selectinload)")
+    loading.add_argument("--limit", type=int, default=20, help="페이지 크기")
+    loading.add_argument("--iterations", type=int, default=200)
+    loading.add_argument("--seed", type=int, default=42)
+    loading.set_defaults(handler=loading_command)
+
+    serialization = subparsers.add_parser("serialization", help="응답 직렬화 경로 비교 (DB 불필요)")
+    serialization.add_argument("--items", type=int, default=100, help="목록 크기")
+    serialization.add_argument("--tags-per-item", type=int, default=5, help="Post 태그 / 프로젝트 기술 스택 수")
+    serialization.add_argument("--iterations", type=int, default=500)
+    serialization.add_argument("--seed", type=int, default=42)
+    serialization.set_defaults(handler=serialization_command)
+
+    jwt = subparsers.add_parser("jwt", help="요청당 JWT 검증 비용 비교 (DB 불필요)")
+    jwt.add_argument("--iterations", type=int, default=20000)
+    jwt.add_argument("--revoked", type=int, default=100000, help="미리 채워 둘 폐기 목록 크기")
+    jwt.set_defaults(handler=jwt_command)
+
+    hashing = subparsers.add_parser("hashing", help="비밀번호 해싱 cost calibration (DB 불필요)")
+    hashing.add_argument("--target-ms", type=float, default=250, help="로그인 1회 목표 해싱 시간")
+    hashing.add_argument("--samples", type=int, default=5, help="cost별 측정 횟수 (중앙값 사용)")
+    hashing.add_argument("--schemes", nargs="*", default=["bcrypt", "scrypt", "argon2"], choices=["bcrypt", "scrypt", "argon2"])
+    hashing.set_defaults(handler=hashing_command)
+
+    statements = subparsers.add_parser("statements", help="단건 조회: 매번 만드는 Query vs 미리 만든 statement")
+    statements.add_argument("--iterations", type=int, default=2000)
+    statements.add_argument("--seed", type=int, default=42)
+    statements.set_defaults(handler=statements_command)
+
+    args = parser.parse_args()
+    _configure_environment(args)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""비밀번호 해싱 cost calibration (DB 불필요, 배포할 서버에서 실행)
+
+scheme별로 cost를 올려 가며 검증(= 로그인 1회) 시간을 재고, 목표 지연시간(--target-ms) 안에서
+가장 높은 cost를 추천한다. 추천값은 common/config.py의 환경 변수 형태로 출력한다.
+
+- bcrypt: BCRYPT_ROUNDS (2^rounds)
+- scrypt: SCRYPT_ROUNDS (log2 N, 메모리 = 2^rounds * 8 * 128 bytes)
+- argon2: ARGON2_TIME_COST / ARGON2_MEMORY_COST (argon2-cffi 설치 시)
+
+    uv run python -m benchmarks hashing --target-ms 250
+"""
+import statistics
+import time
+from dataclasses import dataclass
+
+SAMPLE_PASSWORD = "calibration-password-1234"
+
+
+@dataclass(frozen=True)
+class Cost:
+    scheme: str
+    options: dict  # passlib 설정
+    env: dict  # 같은 설정의 환경 변수
+    memory_kib: int = 0
+
+
+def _bcrypt_costs():
+    return [Cost("bcrypt", {"rounds": rounds}, {"BCRYPT_ROUNDS": rounds}) for rounds in range(10, 16)]
+
+
+def _scrypt_costs():
+    return [
+        Cost("scrypt", {"rounds": rounds}, {"SCRYPT_ROUNDS": rounds}, memory_kib=2 ** rounds * 8 * 128 // 1024)
+        for rounds in range(14, 19)
+    ]
+
+
+def _argon2_costs():
+    # OWASP 권장 조합(m=19MiB,t=2 … m=64MiB+)부터 메모리/반복을 늘려 간다
+    grid = [(2, 19456), (3, 32768), (3, 65536), (4, 65536), (4, 131072), (6, 131072)]
+    return [
+        Cost("argon2", {"time_cost": time_cost, "memory_cost": memory_cost, "parallelism": 1},
+             {"ARGON2_TIME_COST": time_cost, "ARGON2_MEMORY_COST": memory_cost, "ARGON2_PARALLELISM": 1},
+             memory_kib=memory_cost)
+        for time_cost, memory_cost in grid
+    ]
+
+
+COSTS = {"bcrypt": _bcrypt_costs, "scrypt": _scrypt_costs, "argon2": _argon2_costs}
+
+
+def measure(cost: Cost, samples: int) -> float:
+    """검증 1회 중앙값(ms)"""
+    from common.hashing import create_password_context
+
+    context = create_password_context([cost.scheme], **{cost.scheme: cost.options})
+    hashed = context.hash(SAMPLE_PASSWORD)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.verify(SAMPLE_PASSWORD, hashed)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def available(scheme: str) -> bool:
+    from common.hashing import create_password_context
+
+    try:
+        create_password_context([scheme]).hash(SAMPLE_PASSWORD)
+    except Exception:  # passlib MissingBackendError 등 (선택 의존성 없음)
+        return False
+    return True
+
+
+def calibrate(schemes: list[str], target_ms: float, samples: int, report) -> dict:
+    """scheme별 측정 후 목표 이내 최고 cost 추천 {scheme: (Cost, ms) | None}"""
+    recommendations = {}
+    for scheme in schemes:
+        if not available(scheme):
+            report(scheme, None, None, "unavailable (backend not installed)")
+            continue
+        best = None
+        for cost in COSTS[scheme]():
+            elapsed = measure(cost, samples)
+            within = elapsed <= target_ms
+            report(scheme, cost, elapsed, "ok" if within else "over target")
+            if within:
+                best = (cost, elapsed)
+            else:
+                break  # cost가 올라갈수록 느려지므로 더 재지 않는다
+        recommendations[scheme] = best
+    return recommendations
@@ -0,0 +1,69 @@
+"""요청당 access token 검증 비용 비교 (DB 불필요)
+
+- jose / pyjwt: backend 디코드만 (서명 검증 + claim 파싱)
+- verify (miss): JWTHandler.verify_access_token, 캐시를 비운 상태 (이전 동작과 같음)
+- verify (hit): JWTHandler.verify_access_token, 같은 토큰 반복 (검증된 토큰 캐시)
+- revocation check: 폐기 목록 조회만 (폐기되지 않은 jti)
+
+모든 verify 경로는 폐기 목록 확인을 포함하며, 폐기 목록에 --revoked 개 항목을 미리 채워 둔다.
+
+    uv run python -m benchmarks jwt --iterations 20000 --revoked 100000
+"""
+import time
+import uuid
+from typing import Callable
+
+from benchmarks.runner import percentile
+
+
+def measure(verify: Callable[[], object], iterations: int) -> dict:
+    verify()  # warmup
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        verify()
+        latencies.append(time.perf_counter() - started)
+
+    ordered = sorted(latencies)
+    return {
+        "p50_us": round(percentile(ordered, 0.50) * 1_000_000, 2),
+        "p95_us": round(percentile(ordered, 0.95) * 1_000_000, 2),
+        "mean_us": round(sum(latencies) / len(latencies) * 1_000_000, 2),
+    }
+
+
+def run_jwt(iterations: int, revoked: int, report) -> dict:
+    from common.config import settings
+    from common.jwt_backend import BACKENDS, verified_tokens
+    from common.revocation import revocation_store
+    from common.utils import JWTHandler
+
+    expires_at = time.time() + 3600
+    for _ in range(revoked):
+        revocation_store.revoke(uuid.uuid4().hex, expires_at)
+
+    token = JWTHandler.create_access_token("bench@example.com", user_id=1, is_superuser=True)
+    jti = JWTHandler.decode(token)["jti"]
+
+    cases = {}
+    for name, backend_class in BACKENDS.items():
+        try:
+            backend = backend_class()
+        except ImportError:
+            continue
+        cases[name] = lambda backend=backend: backend.decode(token, settings.SECRET_KEY, settings.ALGORITHM)
+
+    def verify_miss():
+        verified_tokens.clear()
+        return JWTHandler.verify_access_token(token)
+
+    cases["verify (miss)"] = verify_miss
+    cases["verify (hit)"] = lambda: JWTHandler.verify_access_token(token)
+    cases["revocation check"] = lambda: revocation_store.is_revoked(jti)
+
+    results = {}
+    for name, verify in cases.items():
+        result = measure(verify, iterations)
+        results[name] = result
+        report(name, result)
+    return results
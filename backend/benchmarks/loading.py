@@ -0,0 +1,129 @@
+"""목록 쿼리의 컬렉션 eager loading 비교 (joinedload vs selectinload)
+
+API 목록 쿼리와 같은 조건(목록 컬럼, 정렬, offset/limit)으로 두 전략을 실행해
+쿼리 수, DB에서 가져온 행/값 수, 지연시간을 비교한다. 태그가 많을수록 차이가 커진다.
+
+    uv run python -m benchmarks seed --reset --tags-per-post 20
+    uv run python -m benchmarks loading --limit 20 --iterations 200
+"""
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import joinedload, load_only, selectinload
+
+from benchmarks.runner import percentile
+
+STRATEGIES = {"joined": joinedload, "selectin": selectinload}
+
+
+@dataclass(frozen=True)
+class LoadingCase:
+    name: str
+    build: Callable  # (session, loader, offset, limit) -> Query
+
+
+def _posts_query(session, loader, offset: int, limit: int):
+    from apis.posts.controller import POST_LIST_COLUMNS
+    from apis.posts.models import Post
+
+    return session.query(Post)\
+        .options(load_only(*POST_LIST_COLUMNS), loader(Post.tags))\
+        .filter(Post.is_deleted == False, Post.is_published == True)\
+        .order_by(Post.created_at.desc(), Post.id.desc())\
+        .offset(offset).limit(limit)
+
+
+def _projects_query(session, loader, offset: int, limit: int):
+    from apis.project.controller import PROJECT_LIST_COLUMNS
+    from apis.project.models import Project
+
+    return session.query(Project)\
+        .options(load_only(*PROJECT_LIST_COLUMNS), loader(Project.tech_stacks))\
+        .filter(Project.is_deleted == False)\
+        .order_by(Project.created_at.desc(), Project.id.desc())\
+        .offset(offset).limit(limit)
+
+
+CASES = [LoadingCase("posts.list", _posts_query), LoadingCase("project.list", _projects_query)]
+
+
+class _StatementRecorder:
+    """실행된 SQL과 파라미터 기록 (행 수는 같은 SQL을 다시 실행해 센다)"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: list[tuple[str, object]] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters))
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def fetched(self) -> tuple[int, int]:
+        """(행 수, 값 개수 = 행 × 컬럼) - join은 부모 컬럼이 자식 행마다 반복된다"""
+        rows = values = 0
+        with self.engine.connect() as connection:
+            for statement, parameters in self.statements:
+                for row in connection.exec_driver_sql(statement, parameters):
+                    rows += 1
+                    values += len(row)
+        return rows, values
+
+
+def measure(engine, case: LoadingCase, strategy: str, limit: int, iterations: int, max_offset: int, seed: int) -> dict:
+    from database.engine import SessionLocal
+
+    loader = STRATEGIES[strategy]
+
+    # 첫 페이지 한 번으로 쿼리 수/행 수 측정
+    with SessionLocal() as session, _StatementRecorder(engine) as recorder:
+        parents = len(case.build(session, loader, 0, limit).all())
+    queries = len(recorder.statements)
+    rows, values = recorder.fetched()
+
+    rng = random.Random(seed)
+    latencies = []
+    for _ in range(iterations):
+        offset = rng.randrange(max(max_offset - limit, 1))
+        with SessionLocal() as session:
+            started = time.perf_counter()
+            case.build(session, loader, offset, limit).all()
+            latencies.append(time.perf_counter() - started)
+
+    ordered = sorted(latencies)
+    return {
+        "parents": parents,
+        "queries": queries,
+        "rows": rows,
+        "values": values,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+    }
+
+
+def run_loading(engine, limit: int, iterations: int, seed: int, report) -> dict:
+    from apis.posts.models import Post
+    from apis.project.models import Project
+    from sqlalchemy import func, select
+
+    with engine.connect() as connection:
+        sizes = {
+            "posts.list": connection.execute(select(func.count(Post.id))).scalar() or 0,
+            "project.list": connection.execute(select(func.count(Project.id))).scalar() or 0,
+        }
+
+    results = {}
+    for case in CASES:
+        for strategy in STRATEGIES:
+            result = measure(engine, case, strategy, limit, iterations, sizes[case.name], seed)
+            results[f"{case.name}:{strategy}"] = result
+            report(case.name, strategy, result)
+    return results
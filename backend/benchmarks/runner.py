@@ -0,0 +1,230 @@
+"""시나리오 실행, 지연시간 통계, baseline 비교"""
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from benchmarks.scenarios import PREFIX, Scenario
+from benchmarks.seed import BENCH_PASSWORD, bench_email
+from common.query_stats import parse_server_timing
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class RunConfig:
+    mode: str = "inprocess"  # inprocess | uvicorn
+    requests: int = 200
+    concurrency: int = 10
+    warmup: int = 10
+    seed: int = 42
+    port: int = 8765
+    workers: int = 1
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float, max_queries: Optional[int] = None) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "max_queries": max_queries,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+async def _send(client: httpx.AsyncClient, request: dict) -> httpx.Response:
+    return await client.request(request["method"], request["url"], json=request.get("json"), headers=request.get("headers"))
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, context: dict, config: RunConfig) -> dict:
+    """concurrency개의 worker가 나눠서 requests번 호출"""
+    warmup_rng = random.Random(config.seed)
+    for _ in range(config.warmup):
+        await _send(client, scenario.build(warmup_rng, context))
+
+    latencies: list[float] = []
+    errors = 0
+    max_queries = None
+    remaining = config.requests
+
+    async def worker(worker_id: int):
+        nonlocal remaining, errors, max_queries
+        rng = random.Random(f"{config.seed}:{scenario.name}:{worker_id}")
+        while remaining > 0:
+            remaining -= 1
+            request = scenario.build(rng, context)
+            started = time.perf_counter()
+            response = await _send(client, request)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code not in scenario.expected_status:
+                errors += 1
+            # QueryStatsMiddleware가 켜져 있으면 요청당 쿼리 수도 기록
+            timing = parse_server_timing(response.headers.get("server-timing"))
+            if timing:
+                max_queries = max(max_queries or 0, timing[0])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(worker_id) for worker_id in range(config.concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started, max_queries)
+
+
+async def build_context(client: httpx.AsyncClient) -> dict:
+    """seed 크기 조회 + 관리자(bench0) 로그인"""
+    from apis.auth.models import User
+    from apis.posts.models import Post
+    from apis.profile.models import Profile
+    from apis.project.models import Project
+    from apis.tag.models import Tag
+    from common.utils import JWTHandler
+    from database.engine import SessionLocal
+    from sqlalchemy import func, select
+
+    with SessionLocal() as db:
+        context = {
+            "users": db.execute(select(func.count(User.id))).scalar(),
+            "posts": db.execute(select(func.max(Post.id))).scalar() or 1,
+            "projects": db.execute(select(func.max(Project.id))).scalar() or 1,
+            "profiles": db.execute(select(func.max(Profile.user_id))).scalar() or 1,
+            "tags": db.execute(select(func.count(Tag.id))).scalar() or 1,
+        }
+    if not context["users"]:
+        raise RuntimeError("No users found, run `python -m benchmarks seed` first")
+
+    response = await client.post(PREFIX + "/auth/login", json={"email": bench_email(0), "password": BENCH_PASSWORD})
+    response.raise_for_status()
+    context["access_token"] = response.json()["access_token"]
+    context["refresh_token"] = response.json()["refresh_token"]
+    context["user_id"] = JWTHandler.decode(context["access_token"])["uid"]
+    return context
+
+
+async def _run_all(client: httpx.AsyncClient, scenarios: list[Scenario], config: RunConfig, report) -> dict:
+    context = await build_context(client)
+    results = {}
+    for scenario in scenarios:
+        results[scenario.name] = await run_scenario(client, scenario, context, config)
+        report(scenario.name, results[scenario.name])
+    return results
+
+
+async def run_inprocess(scenarios: list[Scenario], config: RunConfig, report) -> dict:
+    """ASGI 앱을 프로세스 안에서 직접 호출 (네트워크/서버 오버헤드 제외)"""
+    from main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            return await _run_all(client, scenarios, config, report)
+
+
+def _wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            if httpx.get(base_url + "/openapi.json", timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("uvicorn did not become ready")
+
+
+async def run_uvicorn(scenarios: list[Scenario], config: RunConfig, report) -> dict:
+    """별도 프로세스의 uvicorn에 실제 HTTP로 요청"""
+    base_url = f"http://127.0.0.1:{config.port}"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(config.port),
+         "--workers", str(config.workers), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR,
+        env=os.environ.copy(),
+    )
+    try:
+        _wait_until_ready(base_url, process)
+        limits = httpx.Limits(max_connections=config.concurrency, max_keepalive_connections=config.concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+            return await _run_all(client, scenarios, config, report)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def run(scenarios: list[Scenario], config: RunConfig, report) -> dict:
+    runner = run_uvicorn if config.mode == "uvicorn" else run_inprocess
+    results = asyncio.run(runner(scenarios, config, report))
+
+    from common.config import settings
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "mode": config.mode,
+            "requests": config.requests,
+            "concurrency": config.concurrency,
+            "workers": config.workers if config.mode == "uvicorn" else None,
+            "database": settings.DATABASE_URL.split(":", 1)[0],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+# ===== baseline =====
+
+def save_baseline(path: str, run_result: dict):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(run_result, indent=2, ensure_ascii=False) + "\n")
+
+
+def load_baseline(path: str) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[dict]:
+    """
+    baseline 대비 회귀 목록
+
+    p95/p99가 (1 + threshold)배를 넘거나 rps가 (1 - threshold)배 아래로 떨어지면 회귀.
+    요청당 최대 쿼리 수와 에러 수는 늘어나기만 해도 회귀.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        previous: Optional[dict] = baseline["results"].get(name)
+        if not previous:
+            continue
+        for metric in ("p95_ms", "p99_ms"):
+            if previous[metric] and result[metric] > previous[metric] * (1 + threshold):
+                regressions.append({"endpoint": name, "metric": metric, "baseline": previous[metric], "current": result[metric]})
+        if previous["rps"] and result["rps"] < previous["rps"] * (1 - threshold):
+            regressions.append({"endpoint": name, "metric": "rps", "baseline": previous["rps"], "current": result["rps"]})
+        if previous.get("max_queries") is not None and (result.get("max_queries") or 0) > previous["max_queries"]:
+            regressions.append({"endpoint": name, "metric": "queries", "baseline": previous["max_queries"], "current": result["max_queries"]})
+        if result["errors"] > previous["errors"]:
+            regressions.append({"endpoint": name, "metric": "errors", "baseline": previous["errors"], "current": result["errors"]})
+    return regressions
@@ -0,0 +1,80 @@
+"""벤치마크 대상 엔드포인트 (apis/base.py의 모든 라우터)
+
+각 시나리오는 (rng, context) → 요청 인자 dict를 만든다. context에는 seed 크기와
+로그인으로 얻은 토큰이 들어 있다.
+"""
+from dataclasses import dataclass
+from typing import Callable
+
+from benchmarks.seed import BENCH_PASSWORD, CATEGORIES, bench_email
+
+PREFIX = "/apis/v1"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    router: str
+    build: Callable  # (rng, context) -> {"method", "url", "json", "headers"}
+    expected_status: tuple = (200,)
+
+
+def _auth(context) -> dict:
+    return {"Authorization": f"Bearer {context['access_token']}"}
+
+
+def _fresh_refresh_token(context) -> str:
+    # refresh token은 한 번 쓰면 폐기되므로(rotation) 요청마다 새로 발급
+    from common.utils import JWTHandler
+
+    return JWTHandler.create_refresh_token(bench_email(0), user_id=context["user_id"])
+
+
+def _get(path_builder, auth: bool = False):
+    def build(rng, context):
+        return {"method": "GET", "url": PREFIX + path_builder(rng, context), "headers": _auth(context) if auth else {}}
+    return build
+
+
+SCENARIOS = [
+    # ===== auth =====
+    Scenario("auth.login", "auth", lambda rng, context: {
+        "method": "POST", "url": PREFIX + "/auth/login",
+        "json": {"email": bench_email(rng.randrange(context["users"])), "password": BENCH_PASSWORD},
+    }),
+    Scenario("auth.me", "auth", lambda rng, context: {
+        "method": "POST", "url": PREFIX + "/auth/me", "headers": _auth(context),
+    }),
+    Scenario("auth.refresh", "auth", lambda rng, context: {
+        "method": "POST", "url": PREFIX + "/auth/refresh", "json": {"refresh_token": _fresh_refresh_token(context)},
+    }),
+    # ===== posts =====
+    Scenario("posts.list", "posts", _get(lambda rng, context: "/posts/?limit=10")),
+    Scenario("posts.list_category", "posts", _get(lambda rng, context: f"/posts/?category={rng.choice(CATEGORIES)}&limit=10")),
+    Scenario("posts.list_offset", "posts", _get(lambda rng, context: f"/posts/?skip={rng.randrange(max(context['posts'] - 10, 1))}&limit=10")),
+    Scenario("posts.cursor_first", "posts", _get(lambda rng, context: "/posts/?cursor=&limit=10")),
+    Scenario("posts.list_tag", "posts", _get(lambda rng, context: f"/posts/?tag=tag{rng.randrange(context['tags'])}&limit=10")),
+    Scenario("posts.search", "posts", _get(lambda rng, context: f"/posts/?search={rng.choice(['python', 'cache', '검색', 'fastapi index'])}&limit=10")),
+    Scenario("posts.detail", "posts", _get(lambda rng, context: f"/posts/{rng.randint(1, context['posts'])}"), (200, 404)),
+    Scenario("posts.all", "posts", _get(lambda rng, context: "/posts/all", auth=True)),
+    Scenario("posts.view", "posts", lambda rng, context: {
+        "method": "POST", "url": PREFIX + f"/posts/{rng.randint(1, context['posts'])}/view",
+    }),
+    # ===== project =====
+    Scenario("project.list", "project", _get(lambda rng, context: "/project/?limit=10")),
+    Scenario("project.detail", "project", _get(lambda rng, context: f"/project/{rng.randint(1, context['projects'])}")),
+    # ===== profile =====
+    Scenario("profile.detail", "profile", _get(lambda rng, context: f"/profile/{rng.randint(1, context['profiles'])}")),
+    # ===== tags =====
+    Scenario("tags.list", "tags", _get(lambda rng, context: "/tags/")),
+    # ===== dashboard =====
+    Scenario("dashboard.stats", "dashboard", _get(lambda rng, context: "/dashboard/stats", auth=True)),
+    Scenario("dashboard.pool", "dashboard", _get(lambda rng, context: "/dashboard/pool", auth=True)),
+]
+
+
+def select_scenarios(patterns: list[str]) -> list[Scenario]:
+    """이름 또는 라우터 접두어로 선택 (비어 있으면 전체)"""
+    if not patterns:
+        return list(SCENARIOS)
+    return [scenario for scenario in SCENARIOS if any(scenario.name.startswith(pattern) for pattern in patterns)]
@@ -0,0 +1,144 @@
+"""벤치마크용 데이터 생성
+
+고정 seed의 random.Random으로 매번 같은 데이터를 만들고, Core insert(executemany)로
+한 번에 적재한다. 모든 사용자의 비밀번호는 BENCH_PASSWORD (bcrypt 해시는 1회만 계산).
+"""
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, select
+
+BENCH_PASSWORD = "benchmark-password"
+
+CATEGORIES = ["dev", "react", "python", "database", "infra", "life"]
+WORDS = (
+    "fastapi sqlalchemy python react typescript postgres index query cache latency "
+    "throughput async thread pool token bcrypt benchmark profile project deploy docker "
+    "파이썬 데이터베이스 검색 성능 캐시 블로그 개발 서버 프론트엔드 백엔드"
+).split()
+TECH = ["Python", "FastAPI", "React", "TypeScript", "PostgreSQL", "Redis", "Docker", "AWS", "Go", "Rust"]
+
+
+@dataclass
+class SeedConfig:
+    users: int = 20
+    posts: int = 1000
+    tags_per_post: int = 3
+    tag_vocabulary: int = 50
+    projects: int = 100
+    tech_per_project: int = 4
+    profiles: int = 20
+    skills_per_profile: int = 6
+    timeline_per_profile: int = 4
+    content_words: int = 400
+    seed: int = 42
+
+
+def bench_email(index: int) -> str:
+    return f"bench{index}@example.com"
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def seed_database(engine, config: SeedConfig, reset: bool = False) -> dict:
+    """테이블 생성(또는 초기화) 후 데이터 적재, 생성한 행 수 반환"""
+    import apis  # noqa: F401  모든 모델 등록
+    from apis.auth.models import User
+    from apis.posts.models import Post, PostTags
+    from apis.tag.models import Tag
+    from apis.tag.counts import reconcile_tag_counts
+    from apis.project.models import Project, Project_tech_stack
+    from apis.profile.models import Profile, Profile_skills, Profile_timeline
+    from apis.dashboard.stats import reconcile_dashboard_stats
+    from common.utils import JWTHandler
+    from database.engine import Base
+
+    if reset:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    rng = random.Random(config.seed)
+    hashed_password = JWTHandler.create_password_hash(BENCH_PASSWORD)
+    now = datetime.now(timezone.utc)
+    tag_names = [f"tag{index}" for index in range(config.tag_vocabulary)]
+
+    with engine.begin() as connection:
+        if connection.execute(select(func.count(User.id))).scalar():
+            raise RuntimeError("Database is not empty, use --reset to recreate the tables")
+
+        connection.execute(insert(User.__table__), [
+            {"id": index + 1, "username": f"bench{index}", "email": bench_email(index),
+             "hashed_password": hashed_password, "is_active": True, "is_superuser": index == 0}
+            for index in range(config.users)
+        ])
+
+        if tag_names:
+            connection.execute(insert(Tag.__table__), [
+                {"id": index + 1, "name": tag_name} for index, tag_name in enumerate(tag_names)
+            ])
+
+        posts, post_tags = [], []
+        for index in range(config.posts):
+            post_id = index + 1
+            created_at = now - timedelta(minutes=config.posts - index)
+            content = _sentence(rng, config.content_words)
+            posts.append({
+                "id": post_id, "title": _sentence(rng, 6), "content": content, "excerpt": content[:150],
+                "category": rng.choice(CATEGORIES), "read_time": max(1, len(content) // 200),
+                "view_count": rng.randint(0, 5000), "author_id": rng.randint(1, config.users),
+                "is_deleted": False, "is_published": rng.random() < 0.9,
+                "created_at": created_at, "updated_at": created_at, "version": 1,
+            })
+            for tag_index in rng.sample(range(len(tag_names)), min(config.tags_per_post, len(tag_names))):
+                post_tags.append({"post_id": post_id, "tag_id": tag_index + 1})
+        if posts:
+            connection.execute(insert(Post.__table__), posts)
+        if post_tags:
+            connection.execute(insert(PostTags.__table__), post_tags)
+
+        projects, tech_stacks = [], []
+        for index in range(config.projects):
+            project_id = index + 1
+            created_at = now - timedelta(hours=config.projects - index)
+            projects.append({
+                "id": project_id, "title": _sentence(rng, 3), "description": _sentence(rng, 30),
+                "detail_content": _sentence(rng, 200), "thumbnail": f"https://example.com/{project_id}.png",
+                "images": [], "role": "Backend", "team_size": rng.randint(1, 6), "start_date": "2024-01",
+                "status": rng.choice(["completed", "in-progress", "archived"]), "featured": rng.random() < 0.2,
+                "owner_id": rng.randint(1, config.users), "is_deleted": False,
+                "created_at": created_at, "updated_at": created_at, "version": 1,
+            })
+            for tech_name in rng.sample(TECH, min(config.tech_per_project, len(TECH))):
+                tech_stacks.append({"project_id": project_id, "tech_name": tech_name})
+        if projects:
+            connection.execute(insert(Project.__table__), projects)
+        if tech_stacks:
+            connection.execute(insert(Project_tech_stack.__table__), tech_stacks)
+
+        profile_count = min(config.profiles, config.users)
+        skills, timeline = [], []
+        for index in range(profile_count):
+            for _ in range(config.skills_per_profile):
+                skills.append({"profile_id": index + 1, "skill_name": rng.choice(TECH), "category": "backend"})
+            for year in range(config.timeline_per_profile):
+                timeline.append({"profile_id": index + 1, "event_title": _sentence(rng, 4),
+                                 "event_description": _sentence(rng, 12), "event_date": str(2020 + year)})
+        if profile_count:
+            connection.execute(insert(Profile.__table__), [
+                {"id": index + 1, "user_id": index + 1, "bio": _sentence(rng, 20), "is_public": True}
+                for index in range(profile_count)
+            ])
+        if skills:
+            connection.execute(insert(Profile_skills.__table__), skills)
+        if timeline:
+            connection.execute(insert(Profile_timeline.__table__), timeline)
+
+    reconcile_dashboard_stats()
+    reconcile_tag_counts()
+    return {
+        "users": config.users, "posts": len(posts), "post_tags": len(post_tags),
+        "projects": len(projects), "tech_stacks": len(tech_stacks), "profiles": profile_count,
+    }
@@ -0,0 +1,169 @@
+"""응답 직렬화 경로 비교 (DB 없이 메모리의 ORM 객체 목록만 직렬화)
+
+- validator: 이전 스키마 (field_validator로 tags/tech_stacks 관계를 이름 목록으로 변환)
+- precomputed: 현재 스키마 (ORM property tag_names/tech_stack_names를 바로 읽음) + dump_json
+- trusted: 미리 만든 스키마 객체를 다시 검증하지 않고 dump_json
+- json.dumps: 검증 → dict(mode="json") → json.dumps (응답 클래스를 바꿨을 때 FastAPI 경로)
+- orjson: 검증 → dict(mode="json") → orjson.dumps (orjson 설치 시)
+
+    uv run python -m benchmarks serialization --items 100 --iterations 500
+"""
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from benchmarks.runner import percentile
+from common.responses import dump_json
+
+
+# ===== 이전 스키마 (비교용) =====
+class LegacyPostResponse(BaseModel):
+    id: int
+    title: str
+    excerpt: str
+    cover_image: Optional[str]
+    category: str
+    tag_names: list[str] = Field(alias="tags")
+    created_at: datetime
+    read_time: Optional[int]
+    view_count: int
+    published: bool
+
+    @field_validator("tag_names", mode='before')
+    @classmethod
+    def flatten_tags_list(cls, v: Any) -> list[str]:
+        if isinstance(v, list):
+            return [tag.tag_name for tag in v]
+        return v
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+
+
+class LegacyProjectListResponse(BaseModel):
+    id: int
+    title: str
+    description: str
+    thumbnail: str
+    role: str
+    start_date: str
+    end_date: Optional[str]
+    status: str
+    featured: bool
+    tech_stack_names: list[str] = Field(alias="tech_stacks")
+    created_at: datetime
+
+    @field_validator("tech_stack_names", mode='before')
+    @classmethod
+    def flatten_tech_stacks(cls, v: Any) -> list[str]:
+        if isinstance(v, list):
+            return [tech.tech_name for tech in v]
+        return v
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+
+
+def build_posts(count: int, tags_per_post: int, rng: random.Random) -> list:
+    from apis.posts.models import Post, PostTags
+    from apis.tag.models import Tag
+
+    vocabulary = [Tag(id=index + 1, name=f"tag-{index}") for index in range(max(tags_per_post * 3, 10))]
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        Post(
+            id=index + 1, title=f"Post {index}", excerpt="요약 " * 20, cover_image=None, category="dev",
+            created_at=created_at + timedelta(minutes=index), read_time=3, view_count=rng.randrange(1000),
+            is_published=True, tags=[PostTags(tag=tag) for tag in rng.sample(vocabulary, tags_per_post)],
+        )
+        for index in range(count)
+    ]
+
+
+def build_projects(count: int, tags_per_post: int, rng: random.Random) -> list:
+    from apis.project.models import Project, Project_tech_stack
+
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        Project(
+            id=index + 1, title=f"Project {index}", description="설명 " * 20, thumbnail="https://example.com/t.png",
+            role="backend", start_date="2024-01", end_date=None, status="completed", featured=bool(index % 5 == 0),
+            created_at=created_at + timedelta(days=index),
+            tech_stacks=[Project_tech_stack(tech_name=f"tech-{rng.randrange(50)}") for _ in range(tags_per_post)],
+        )
+        for index in range(count)
+    ]
+
+
+def _json_dumps(content) -> bytes:
+    # starlette JSONResponse.render와 같은 옵션
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def serializers(legacy: TypeAdapter, adapter: TypeAdapter, objects: list) -> dict[str, Callable[[], bytes]]:
+    validated = adapter.validate_python(objects, from_attributes=True)
+
+    def to_python():
+        return adapter.dump_python(adapter.validate_python(objects, from_attributes=True), mode="json", by_alias=True)
+
+    cases = {
+        "validator": lambda: dump_json(legacy, objects),
+        "precomputed": lambda: dump_json(adapter, objects),
+        "trusted": lambda: dump_json(adapter, validated, trusted=True),
+        "json.dumps": lambda: _json_dumps(to_python()),
+    }
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        cases["orjson"] = lambda: orjson.dumps(to_python())
+    return cases
+
+
+def measure(serialize: Callable[[], bytes], iterations: int) -> dict:
+    size = len(serialize())  # warmup
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        serialize()
+        latencies.append(time.perf_counter() - started)
+
+    ordered = sorted(latencies)
+    return {
+        "bytes": size,
+        "p50_us": round(percentile(ordered, 0.50) * 1_000_000, 1),
+        "p95_us": round(percentile(ordered, 0.95) * 1_000_000, 1),
+    }
+
+
+def run_serialization(items: int, tags_per_post: int, iterations: int, seed: int, report) -> dict:
+    from apis.posts.schema import PostResponse
+    from apis.project.schema import ProjectListResponse
+
+    rng = random.Random(seed)
+    datasets = {
+        "posts.list": (LegacyPostResponse, PostResponse, build_posts(items, tags_per_post, rng)),
+        "project.list": (LegacyProjectListResponse, ProjectListResponse, build_projects(items, tags_per_post, rng)),
+    }
+
+    results = {}
+    for name, (legacy, schema, objects) in datasets.items():
+        cases = serializers(TypeAdapter(list[legacy]), TypeAdapter(list[schema]), objects)
+        # 모든 경로가 같은 JSON을 만드는지 먼저 확인
+        expected = json.loads(cases["precomputed"]())
+        for case, serialize in cases.items():
+            if json.loads(serialize()) != expected:
+                raise RuntimeError(f"{name}:{case} output differs")
+
+        for case, serialize in cases.items():
+            result = measure(serialize, iterations)
+            results[f"{name}:{case}"] = result
+            report(name, case, result)
+    return results
@@ -0,0 +1,110 @@
+"""컨트롤러 단건 조회: 매번 만드는 Query vs 미리 만든 statement
+
+- query: 이전 코드처럼 호출마다 session.query(...).options(...).filter(...) 생성 (로더 옵션은 현재와 같게)
+- prebuilt: 현재 컨트롤러 메서드 (모듈 수준 select() + bindparam)
+
+호출당 지연시간과 그동안의 SQLAlchemy compiled cache hit ratio를 함께 출력한다.
+
+    uv run python -m benchmarks seed --reset
+    uv run python -m benchmarks statements --iterations 2000
+"""
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from benchmarks.runner import percentile
+
+
+@dataclass(frozen=True)
+class LookupCase:
+    name: str
+    query: Callable  # (session, key) -> 이전 방식 조회
+    prebuilt: Callable  # (session, key) -> 현재 컨트롤러 조회
+    keys: Callable  # (session) -> 조회할 key 목록
+
+
+def _cases() -> list[LookupCase]:
+    from sqlalchemy import select
+    from sqlalchemy.orm import joinedload, selectinload
+
+    from apis.auth.controller import AuthController
+    from apis.auth.models import User
+    from apis.posts.controller import PostController
+    from apis.posts.models import Post
+    from apis.profile.controller import ProfileController
+    from apis.profile.models import Profile
+    from apis.project.controller import ProjectController
+    from apis.project.models import Project
+
+    return [
+        LookupCase(
+            "auth.user_by_email",
+            lambda session, email: session.query(User).filter(User.email == email).first(),
+            lambda session, email: AuthController(session).get_user_by_email(email),
+            lambda session: list(session.scalars(select(User.email))),
+        ),
+        LookupCase(
+            "posts.post_by_id",
+            lambda session, post_id: session.query(Post).options(selectinload(Post.tags))
+            .filter(Post.id == post_id, Post.is_deleted == False).first(),
+            lambda session, post_id: PostController(session, None, None).get_post_by_id(post_id),
+            lambda session: list(session.scalars(select(Post.id).where(Post.is_deleted == False))),
+        ),
+        LookupCase(
+            "project.project_by_id",
+            lambda session, project_id: session.query(Project).options(joinedload(Project.tech_stacks))
+            .filter(Project.id == project_id, Project.is_deleted == False).first(),
+            lambda session, project_id: ProjectController(session, None).get_project_by_id(project_id),
+            lambda session: list(session.scalars(select(Project.id).where(Project.is_deleted == False))),
+        ),
+        LookupCase(
+            "profile.profile_by_user_id",
+            lambda session, user_id: session.query(Profile)
+            .options(selectinload(Profile.skills), selectinload(Profile.timeline))
+            .filter(Profile.user_id == user_id).first(),
+            lambda session, user_id: ProfileController(session, None).get_profile_by_user_id(user_id),
+            lambda session: list(session.scalars(select(Profile.user_id))),
+        ),
+    ]
+
+
+def measure(lookup: Callable, keys: list, iterations: int, seed: int) -> dict:
+    from common.query_stats import compiled_cache_stats
+    from database.engine import SessionLocal
+
+    rng = random.Random(seed)
+    latencies = []
+    with SessionLocal() as session:
+        lookup(session, keys[0])  # warmup (첫 컴파일)
+        compiled_cache_stats.reset()
+        for _ in range(iterations):
+            key = rng.choice(keys)
+            session.expunge_all()  # identity map 재사용 없이 매번 로드
+            started = time.perf_counter()
+            lookup(session, key)
+            latencies.append(time.perf_counter() - started)
+
+    ordered = sorted(latencies)
+    return {
+        "p50_us": round(percentile(ordered, 0.50) * 1_000_000, 1),
+        "p95_us": round(percentile(ordered, 0.95) * 1_000_000, 1),
+        "cache_hit_ratio": compiled_cache_stats.hit_ratio,
+    }
+
+
+def run_statements(iterations: int, seed: int, report) -> dict:
+    from database.engine import SessionLocal
+
+    results = {}
+    for case in _cases():
+        with SessionLocal() as session:
+            keys = case.keys(session)
+        if not keys:
+            report(case.name, "-", None)
+            continue
+        for variant in ("query", "prebuilt"):
+            result = measure(getattr(case, variant), keys, iterations, seed)
+            results[f"{case.name}:{variant}"] = result
+            report(case.name, variant, result)
+    return results
@@ -0,0 +1,36 @@
+"""자식 행 일괄 저장 (태그, 기술 스택, 스킬, 타임라인)
+
+행마다 db.add() 후 flush하면 INSERT가 행 수만큼 왕복한다. 여기서는 dict 목록을
+insert() 한 번(executemany / insertmanyvalues)으로 보낸다.
+ORM 이벤트를 거치지 않으므로 이벤트 listener가 필요한 모델(Post, Project)에는 쓰지 않는다.
+"""
+from typing import Iterable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+
+def unique_names(names: Iterable[str], exclude: Iterable[str] = ()) -> list[str]:
+    """앞뒤 공백 제거 후 빈 값/중복/exclude 제외 (입력 순서 유지)"""
+    seen = set(exclude)
+    result = []
+    for name in names:
+        name = name.strip()
+        if name and name not in seen:
+            seen.add(name)
+            result.append(name)
+    return result
+
+
+def bulk_insert(db: Session, model, rows: list[dict], returning: bool = False) -> list:
+    """
+    rows를 INSERT 한 번으로 저장
+
+    returning=True면 생성된 ORM 객체 목록을 돌려준다 (RETURNING 지원 DB: PostgreSQL, SQLite 3.35+).
+    """
+    if not rows:
+        return []
+    if returning:
+        return list(db.scalars(insert(model).returning(model), rows))
+    db.execute(insert(model), rows)
+    return []
@@ -0,0 +1,71 @@
+"""HTTP 조건부 요청 (ETag / Last-Modified / 304)
+
+컨트롤러의 가벼운 버전 조회(상세: 행의 version/updated_at, 목록: 변경 세대 행 하나)로 검증자를 만들고,
+If-None-Match / If-Modified-Since가 일치하면 본문 없이 304를 반환한다.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+# 브라우저/CDN이 저장은 하되 매번 재검증하도록
+CACHE_CONTROL = "public, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """버전 값들 → weak ETag"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite는 timezone 없이 UTC로 저장
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # weak 비교: W/ 접두어를 무시
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """If-None-Match가 있으면 그것만, 없을 때만 If-Modified-Since로 판단 (RFC 9110)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP 날짜는 초 단위
+        return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+    return False
+
+
+def not_modified_response(request: Request, etag: str, last_modified: Optional[datetime]) -> Optional[Response]:
+    """변경이 없으면 304 응답, 있으면 None"""
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=validator_headers(etag, last_modified))
+    return None
+
+
+def with_validators(response: Response, etag: str, last_modified: Optional[datetime]) -> Response:
+    response.headers.update(validator_headers(etag, last_modified))
+    return response
@@ -6,18 +6,104 @@ load_dotenv()  # .env 파일 로드
 class DevConfig:
     DEBUG = True
     DATABASE_URL = os.getenv("DATABASE_URL")
+    # true: AsyncEngine(asyncpg/aiosqlite) 경로, false: 동기 Session을 스레드풀에서 실행
+    DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() == "true"
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")  # 비어 있으면 DATABASE_URL에서 유도
+    # 커넥션 풀 (개발: 작게, 타임아웃 넉넉히)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 5))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))  # 커넥션 대기 최대 시간(초)
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # 초, -1이면 재활용 안 함
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0))  # 0이면 제한 없음 (PostgreSQL)
     ACCESS_EXPIRE_MINUTES = int(os.getenv("EXPIRE_MINUTES", 10))  # 10분
     SECRET_KEY = os.getenv("SECRET_KEY")
     REFRESH_EXPIRE_MINUTES = int(os.getenv("REFRESH_EXPIRE_MINUTES", 60))
     ALGORITHM = os.getenv("ALGORITHM", "HS256")
+    USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", 1024))  # 인증 사용자 LRU 크기
+    USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 30))
+    JWT_BACKEND = os.getenv("JWT_BACKEND", "jose")  # jose | pyjwt (PyJWT 패키지 필요)
+    JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", 1024))  # 검증된 토큰 캐시 크기 (0이면 끔)
+    JWT_CACHE_TTL_SECONDS = float(os.getenv("JWT_CACHE_TTL_SECONDS", 300))  # 토큰 exp를 넘기지 않음
+    TOKEN_REVOCATION_BACKEND = os.getenv("TOKEN_REVOCATION_BACKEND", "memory")  # memory | redis
+    TOKEN_REVOCATION_URL = os.getenv("TOKEN_REVOCATION_URL", "redis://localhost:6379/0")
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", 10000))  # bucket LRU 크기
+    RATE_LIMIT_AUTH_IP = os.getenv("RATE_LIMIT_AUTH_IP", "20/60")  # /auth: IP당 60초에 20회 (빈 값이면 끔)
+    RATE_LIMIT_AUTH_EMAIL = os.getenv("RATE_LIMIT_AUTH_EMAIL", "5/300")  # 로그인/가입: email당 300초에 5회
+    RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")  # memory | redis
+    RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "redis://localhost:6379/0")
+    RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 60))
+    RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+    SEARCH_CONFIG = os.getenv("SEARCH_CONFIG", "simple")  # PostgreSQL text search config
+    POST_RENDER_HTML = os.getenv("POST_RENDER_HTML", "false").lower() == "true"  # 작성 시 content_html 생성 (markdown 패키지 필요)
+    VIEW_COUNTER_SHARDS = int(os.getenv("VIEW_COUNTER_SHARDS", 16))
+    VIEW_COUNTER_FLUSH_SECONDS = float(os.getenv("VIEW_COUNTER_FLUSH_SECONDS", 5))
+    DASHBOARD_RECONCILE_SECONDS = float(os.getenv("DASHBOARD_RECONCILE_SECONDS", 3600))  # 0이면 주기 재계산 끔
+    QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "true").lower() == "true"  # Server-Timing 헤더
+    QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", 5))  # 같은 SQL 반복 시 N+1 경고
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"  # GET /metrics
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")  # 지정하면 /metrics에 Authorization: Bearer <token> 필요
+    PASSWORD_SCHEMES = os.getenv("PASSWORD_SCHEMES", "bcrypt")  # 첫 번째로 새 해시 생성, 나머지는 검증 후 로그인 시 재해싱
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))  # bcrypt cost factor (2^rounds)
+    SCRYPT_ROUNDS = int(os.getenv("SCRYPT_ROUNDS", 15))  # log2(N), 메모리 = 2^rounds * 8 * 128 bytes
+    ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", 2))  # argon2-cffi 패키지 필요
+    ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", 19456))  # KiB
+    ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", 1))
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", 16))  # 초과 시 503
 
 class ProdConfig:
     DEBUG = False
     DATABASE_URL = os.getenv("DATABASE_URL")
+    # true: AsyncEngine(asyncpg/aiosqlite) 경로, false: 동기 Session을 스레드풀에서 실행
+    DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() == "true"
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")  # 비어 있으면 DATABASE_URL에서 유도
+    # 커넥션 풀 (운영: 워커당 여유 있게, 대기/쿼리는 짧게 끊음)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 15000))
     ACCESS_EXPIRE_MINUTES = int(os.getenv("EXPIRE_MINUTES", 10))
     SECRET_KEY = os.getenv("SECRET_KEY")
     REFRESH_EXPIRE_MINUTES = int(os.getenv("REFRESH_EXPIRE_MINUTES", 60))
     ALGORITHM = os.getenv("ALGORITHM", "HS256")
+    USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", 1024))  # 인증 사용자 LRU 크기
+    USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 30))
+    JWT_BACKEND = os.getenv("JWT_BACKEND", "jose")  # jose | pyjwt (PyJWT 패키지 필요)
+    JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", 1024))  # 검증된 토큰 캐시 크기 (0이면 끔)
+    JWT_CACHE_TTL_SECONDS = float(os.getenv("JWT_CACHE_TTL_SECONDS", 300))  # 토큰 exp를 넘기지 않음
+    TOKEN_REVOCATION_BACKEND = os.getenv("TOKEN_REVOCATION_BACKEND", "memory")  # memory | redis
+    TOKEN_REVOCATION_URL = os.getenv("TOKEN_REVOCATION_URL", "redis://localhost:6379/0")
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", 10000))  # bucket LRU 크기
+    RATE_LIMIT_AUTH_IP = os.getenv("RATE_LIMIT_AUTH_IP", "20/60")  # /auth: IP당 60초에 20회 (빈 값이면 끔)
+    RATE_LIMIT_AUTH_EMAIL = os.getenv("RATE_LIMIT_AUTH_EMAIL", "5/300")  # 로그인/가입: email당 300초에 5회
+    RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")  # memory | redis
+    RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "redis://localhost:6379/0")
+    RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 60))
+    RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+    SEARCH_CONFIG = os.getenv("SEARCH_CONFIG", "simple")  # PostgreSQL text search config
+    POST_RENDER_HTML = os.getenv("POST_RENDER_HTML", "false").lower() == "true"  # 작성 시 content_html 생성 (markdown 패키지 필요)
+    VIEW_COUNTER_SHARDS = int(os.getenv("VIEW_COUNTER_SHARDS", 16))
+    VIEW_COUNTER_FLUSH_SECONDS = float(os.getenv("VIEW_COUNTER_FLUSH_SECONDS", 5))
+    DASHBOARD_RECONCILE_SECONDS = float(os.getenv("DASHBOARD_RECONCILE_SECONDS", 3600))  # 0이면 주기 재계산 끔
+    QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "false").lower() == "true"  # Server-Timing 헤더 (모든 클라이언트에 노출되므로 운영 기본 끔)
+    QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", 5))  # 같은 SQL 반복 시 N+1 경고
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"  # GET /metrics (운영 기본 끔)
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")  # 지정하면 /metrics에 Authorization: Bearer <token> 필요
+    PASSWORD_SCHEMES = os.getenv("PASSWORD_SCHEMES", "bcrypt")  # 첫 번째로 새 해시 생성, 나머지는 검증 후 로그인 시 재해싱
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))  # bcrypt cost factor (2^rounds)
+    SCRYPT_ROUNDS = int(os.getenv("SCRYPT_ROUNDS", 15))  # log2(N), 메모리 = 2^rounds * 8 * 128 bytes
+    ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", 2))  # argon2-cffi 패키지 필요
+    ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", 19456))  # KiB
+    ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", 1))
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", 16))  # 초과 시 503
 
 if os.getenv("ENV") == "PROD":
     settings = ProdConfig()
@@ -0,0 +1,81 @@
+"""
+컨트롤러 실행기
+
+컨트롤러의 비즈니스 로직은 동기 Session 기준으로 한 번만 작성하고,
+DB_ASYNC 설정에 따라 실행 방식을 고른다.
+
+- DB_ASYNC=false: 동기 Session 그대로, 메서드를 스레드풀에서 실행
+- DB_ASYNC=true: AsyncSession.run_sync()로 실행 (asyncpg/aiosqlite 비동기 I/O)
+
+어느 쪽이든 뷰에서는 `await controller.method(...)` 로 호출하며 이벤트 루프를 막지 않는다.
+"""
+import inspect
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from common.config import settings
+from database.engine import get_async_db, get_db
+
+
+class ThreadedController:
+    """동기 Session 컨트롤러: 메서드를 스레드풀에서 실행"""
+
+    def __init__(self, controller):
+        self._controller = controller
+
+    def __getattr__(self, name):
+        method = getattr(self._controller, name)
+        # 이미 async인 메서드(해싱 등)는 그대로 await
+        if inspect.iscoroutinefunction(method):
+            return method
+
+        async def call(*args, **kwargs):
+            return await run_in_threadpool(method, *args, **kwargs)
+        return call
+
+
+class AsyncSessionController:
+    """
+    AsyncSession 컨트롤러: 동기 컨트롤러 로직을 run_sync(greenlet)로 실행
+
+    run_sync는 항상 같은 sync_session을 넘기므로 컨트롤러는 요청마다 한 번만 만들어
+    호출 간 요청 내 상태(AuthController._resolved 등)를 유지한다.
+    async 메서드가 DB 작업을 _call_db()로 실행하는 컨트롤러는 그 경로도 run_sync로 바꾼다.
+    """
+
+    def __init__(self, db: AsyncSession, build):
+        self.db = db
+        self._controller = build(db.sync_session)
+        if hasattr(self._controller, "_call_db"):
+            self._controller._call_db = self.run
+
+    async def run(self, method, *args, **kwargs):
+        """동기 메서드를 run_sync로 실행"""
+        return await self.db.run_sync(lambda session: method(*args, **kwargs))
+
+    def __getattr__(self, name):
+        method = getattr(self._controller, name)
+        if inspect.iscoroutinefunction(method):
+            return method
+
+        async def call(*args, **kwargs):
+            return await self.run(method, *args, **kwargs)
+        return call
+
+
+def controller_provider(build):
+    """
+    컨트롤러 의존성 생성
+
+    build(session) → 동기 컨트롤러. DB_ASYNC 설정에 따라 실행기로 감싸 주입한다.
+    """
+    if settings.DB_ASYNC:
+        def provide(db: AsyncSession = Depends(get_async_db)):
+            return AsyncSessionController(db, build)
+    else:
+        def provide(db: Session = Depends(get_db)):
+            return ThreadedController(build(db))
+    return provide
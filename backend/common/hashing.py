@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from common.config import settings
+from common.metrics import Counter
+
+PASSWORD_HASH_REJECTED = Counter("password_hash_rejected_total", "Password hash jobs rejected because the pool was saturated")
+PASSWORD_REHASHES = Counter("password_rehash_total", "Password hashes upgraded on login", ("scheme",))
+
+# scheme → passlib 설정 (cost 값은 common/config.py, 측정은 `python -m benchmarks hashing`)
+SCHEME_SETTINGS = {
+    "bcrypt": lambda: {"rounds": settings.BCRYPT_ROUNDS},
+    "scrypt": lambda: {"rounds": settings.SCRYPT_ROUNDS},
+    "argon2": lambda: {
+        "time_cost": settings.ARGON2_TIME_COST,
+        "memory_cost": settings.ARGON2_MEMORY_COST,
+        "parallelism": settings.ARGON2_PARALLELISM,
+    },
+}
+
+
+def create_password_context(schemes=None, **overrides) -> CryptContext:
+    """
+    PASSWORD_SCHEMES 순서대로 CryptContext 생성
+
+    첫 번째 scheme/설정으로 새 해시를 만들고, 나머지 scheme이나 cost가 다른 해시는
+    검증만 한 뒤 needs_update()로 표시된다 (로그인 시 재해싱).
+    overrides: {"bcrypt": {"rounds": 13}} 처럼 설정값 대신 사용할 cost (calibration용)
+    """
+    if schemes is None:
+        schemes = [scheme.strip() for scheme in settings.PASSWORD_SCHEMES.split(",") if scheme.strip()]
+    unknown = [scheme for scheme in schemes if scheme not in SCHEME_SETTINGS]
+    if unknown:
+        raise ValueError(f"Unknown password scheme: {', '.join(unknown)} (choose from {', '.join(SCHEME_SETTINGS)})")
+
+    options = {}
+    for scheme in schemes:
+        for name, value in {**SCHEME_SETTINGS[scheme](), **overrides.get(scheme, {})}.items():
+            options[f"{scheme}__{name}"] = value
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+class PasswordHashPool:
+    """
+    bcrypt 해싱/검증 전용 스레드 풀
+
+    bcrypt는 GIL을 놓고 수백 ms 동안 CPU를 사용하므로 이벤트 루프가 아닌
+    별도 스레드에서 실행한다. 실행 중 + 대기 중 작업 수가 한도를 넘으면
+    즉시 503을 반환해 로그인 폭주가 서버 전체를 멈추지 않도록 한다.
+    """
+
+    def __init__(self, max_workers: int, queue_limit: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(max_workers + queue_limit)
+
+    async def run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            PASSWORD_HASH_REJECTED.inc()
+            raise HTTPException(
+                status_code=503,
+                detail="Too many authentication requests, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # 요청이 취소되더라도 스레드 작업이 실제로 끝난 뒤에 슬롯 반환
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+)
@@ -0,0 +1,276 @@
+"""Prometheus 텍스트 형식 메트릭
+
+외부 의존성 없이 Counter / Gauge / Histogram만 구현한다. 기록은 메트릭별 lock 하나와
+dict 조회(Histogram은 bisect 추가) 정도라 요청 경로에서 써도 부담이 적다.
+풀/캐시처럼 이미 다른 객체가 들고 있는 값은 수집 시점에 collector로 읽는다.
+
+    GET /metrics → render()
+"""
+import bisect
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+
+_metrics: list = []
+_collectors: list[Callable[[], Iterable[str]]] = []
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict = {}
+        self._lock = threading.Lock()
+        _metrics.append(self)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}" for labels, value in items
+        ]
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels):
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                # [버킷별 개수..., +Inf 개수, 합계]
+                state = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    def time(self, *labels):
+        """with histogram.time(...): 블록 실행 시간 기록"""
+        return _Timer(self, labels)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = [(labels, list(state)) for labels, state in self._values.items()]
+        lines = self._header()
+        for labels, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, *self.labels)
+
+
+def register_collector(collector: Callable[[], Iterable[str]]):
+    """수집 시점에 계산하는 메트릭 (이미 완성된 exposition 라인을 반환)"""
+    _collectors.append(collector)
+    return collector
+
+
+def gauge_lines(name: str, documentation: str, samples: Iterable[tuple[dict, Optional[float]]], type_name: str = "gauge") -> list[str]:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {type_name}"]
+    for labels, value in samples:
+        if value is not None:
+            lines.append(f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_value(value)}")
+    return lines
+
+
+def render() -> str:
+    lines: list[str] = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    for collector in _collectors:
+        lines.extend(collector())
+    return "\n".join(lines) + "\n"
+
+
+# ===== 공통 메트릭 =====
+
+HTTP_REQUESTS = Counter("http_requests_total", "HTTP requests by route and status", ("method", "route", "status"))
+HTTP_REQUEST_DURATION = Histogram("http_request_duration_seconds", "HTTP request latency by route", ("method", "route"))
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being processed")
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds", "Password hash/verify duration", ("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0),
+)
+JWT_DECODES = Counter("jwt_decode_total", "JWT decode attempts by result", ("result",))
+
+
+def route_template(scope) -> str:
+    """
+    요청 경로의 라우트 템플릿 (/apis/v1/posts/{post_id})
+
+    FastAPI 버전에 따라 scope["route"].path에 include_router prefix가 빠져 있을 수 있어,
+    실제 경로에서 라우트 부분을 뺀 나머지를 prefix로 붙인다.
+    매칭되지 않은 경로는 "unmatched" 하나로 묶어 label 폭증을 막는다.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return "unmatched"
+
+    path = scope["path"]
+    try:
+        rendered = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    if path.endswith(rendered):
+        return path[:len(path) - len(rendered)] + template
+    return template
+
+
+class MetricsMiddleware:
+    """라우트 템플릿(/posts/{post_id}) 단위 지연시간/요청 수, 처리 중 요청 수 (순수 ASGI middleware)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route_path = route_template(scope)
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, scope["method"], route_path)
+            HTTP_REQUESTS.inc(scope["method"], route_path, status)
+
+
+# ===== collector: DB 풀, 캐시 =====
+
+@register_collector
+def _pool_metrics() -> list[str]:
+    from database import engine as database
+
+    statuses = [("sync", database.pool_status(database.engine))]
+    if database.async_engine is not None:
+        statuses.append(("async", database.pool_status(database.async_engine)))
+
+    def samples(key):
+        return [({"engine": name}, status.get(key)) for name, status in statuses]
+
+    return (
+        gauge_lines("db_pool_size", "Configured pool size", samples("size"))
+        + gauge_lines("db_pool_checked_out", "Connections currently checked out", samples("checked_out"))
+        + gauge_lines("db_pool_checked_in", "Idle connections in the pool", samples("checked_in"))
+        + gauge_lines("db_pool_overflow", "Current overflow connections", samples("overflow"))
+        + gauge_lines("db_pool_checkouts_total", "Connection checkouts", samples("checkouts"), "counter")
+        + gauge_lines("db_pool_timeouts_total", "Checkout timeouts", samples("timeouts"), "counter")
+        + gauge_lines("db_pool_wait_avg_seconds", "Average checkout wait",
+                      [(labels, None if value is None else value / 1000) for labels, value in samples("wait_avg_ms")])
+        + gauge_lines("db_pool_wait_max_seconds", "Maximum checkout wait",
+                      [(labels, None if value is None else value / 1000) for labels, value in samples("wait_max_ms")])
+    )
+
+
+@register_collector
+def _cache_metrics() -> list[str]:
+    from common.jwt_backend import verified_tokens
+    from common.principal import user_cache
+    from common.query_stats import compiled_cache_stats
+    from common.response_cache import response_cache
+    from database import engine as database
+
+    caches = {"user": user_cache, "response": response_cache, "jwt": verified_tokens, "sql_compiled": compiled_cache_stats}
+    engines = [("sync", database.engine)]
+    if database.async_engine is not None:
+        engines.append(("async", database.async_engine.sync_engine))
+
+    def compiled_cache_size(engine) -> Optional[int]:
+        cache = getattr(engine, "_compiled_cache", None)
+        return None if cache is None else len(cache)
+
+    def ratio(cache) -> Optional[float]:
+        total = cache.hits + cache.misses
+        return cache.hits / total if total else None
+
+    return (
+        gauge_lines("cache_hits_total", "Cache hits", [({"cache": name}, cache.hits) for name, cache in caches.items()], "counter")
+        + gauge_lines("cache_misses_total", "Cache misses", [({"cache": name}, cache.misses) for name, cache in caches.items()], "counter")
+        + gauge_lines("cache_hit_ratio", "Cache hit ratio since start", [({"cache": name}, ratio(cache)) for name, cache in caches.items()])
+        + gauge_lines("sql_compiled_cache_uncached_total", "Executions without a compiled cache key (text SQL, DDL)",
+                      [({}, compiled_cache_stats.uncached)], "counter")
+        + gauge_lines("sql_compiled_cache_entries", "Compiled statements held in the engine cache",
+                      [({"engine": name}, compiled_cache_size(engine)) for name, engine in engines])
+    )
@@ -0,0 +1,56 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import literal, tuple_
+from sqlalchemy.dialects import sqlite
+
+# server_default(CURRENT_TIMESTAMP)로 들어간 SQLite 값은 초 단위까지만 저장된다
+SQLITE_SECONDS_FORMAT = "%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id)를 불투명한 cursor 문자열로 인코딩"""
+    raw = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """cursor 문자열 → (created_at, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _cursor_type(query, model, created_at: datetime):
+    """cursor 값을 저장된 값과 같은 포맷으로 바인딩할 컬럼 타입"""
+    if query.session.get_bind().dialect.name == "sqlite" and not created_at.microsecond:
+        # SQLite는 날짜를 문자열로 비교하므로 초 단위로 저장된 행과 같은 문자열로 맞춘다
+        return sqlite.DATETIME(storage_format=SQLITE_SECONDS_FORMAT)
+    return model.created_at.type
+
+
+def paginate_keyset(query, model, cursor: Optional[str], limit: int):
+    """
+    (created_at DESC, id DESC) 기준 keyset 페이지 조회
+
+    cursor가 빈 문자열이면 첫 페이지. 반환값: (rows, next_cursor)
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        value = literal(created_at, type_=_cursor_type(query, model, created_at))
+        query = query.filter(tuple_(model.created_at, model.id) < tuple_(value, row_id))
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    rows = query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return rows, next_cursor
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from common.cache import TTLCache
+from common.config import settings
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    인증된 사용자 정보 (ORM 객체가 아닌 불변 스냅샷)
+
+    JWT claims(uid, email, su)로 만들어지고, AuthController.resolve_user()를 거쳐
+    DB(또는 캐시)의 최신 값으로 확정된다. 이전 토큰은 uid가 없을 수 있다.
+    """
+    id: Optional[int]
+    email: str
+    is_superuser: bool = False
+    is_active: bool = True
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(id=user.id, email=user.email, is_superuser=bool(user.is_superuser), is_active=bool(user.is_active))
+
+
+# users 행 캐시: ("id", user_id) / ("email", email) → Principal
+user_cache = TTLCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+
+def cache_user(principal: Principal):
+    user_cache.set(("id", principal.id), principal)
+    user_cache.set(("email", principal.email), principal)
+
+
+def invalidate_user(user_id: Optional[int] = None, email: Optional[str] = None):
+    """사용자 변경 시 캐시 무효화"""
+    user_cache.delete(("id", user_id), ("email", email))
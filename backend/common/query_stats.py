@@ -0,0 +1,207 @@
+"""요청별 SQL 쿼리 수 / DB 시간 계측
+
+SQLAlchemy Engine 이벤트(before/after_cursor_execute)로 현재 요청의 QueryStats
+(contextvar)에 쿼리 수와 실행 시간을 누적한다. run_in_threadpool / AsyncSession.run_sync
+모두 contextvar를 복사해 실행하므로 스레드·greenlet 안의 쿼리도 같은 요청으로 집계된다.
+
+QueryStatsMiddleware는 결과를 Server-Timing 헤더로 내보내고, 같은 SQL이
+QUERY_REPEAT_THRESHOLD번 이상 반복되면 N+1 의심으로 경고 로그를 남긴다.
+
+compiled_cache_stats는 프로세스 전체의 SQLAlchemy compiled cache 재사용률을 센다
+(/metrics의 cache_hit_ratio{cache="sql_compiled"}).
+"""
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+
+from common.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    @property
+    def milliseconds(self) -> float:
+        return self.seconds * 1000
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold번 이상 실행된 동일 SQL (N+1 의심)"""
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    started = conn.info.get("query_started_at")
+    if started:
+        stats.seconds += time.perf_counter() - started.pop()
+    stats.count += 1
+    stats.statements[statement] += 1
+
+
+class CompiledCacheStats:
+    """
+    statement 실행별 compiled cache 결과 (프로세스 전체 누적)
+
+    hits: 컴파일된 SQL 재사용, misses: 새로 컴파일, uncached: 캐시 대상이 아닌 실행(문자열 SQL, DDL 등)
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+        self._lock = threading.Lock()
+
+    def record(self, cache_hit):
+        with self._lock:
+            if cache_hit is CACHE_HIT:
+                self.hits += 1
+            elif cache_hit is CACHE_MISS:
+                self.misses += 1
+            else:
+                self.uncached += 1
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = self.uncached = 0
+
+
+compiled_cache_stats = CompiledCacheStats()
+
+
+@event.listens_for(Engine, "after_execute")
+def _after_execute(conn, clauseelement, multiparams, params, execution_options, result):
+    context = getattr(result, "context", None)
+    if context is not None:
+        compiled_cache_stats.record(context.cache_hit)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 쿼리 집계 (중첩 시 안쪽 블록만 집계)"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _compact(statement: str, limit: int = 200) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+
+def server_timing(stats: QueryStats, elapsed: float) -> str:
+    return f'db;dur={stats.milliseconds:.3f};desc="{stats.count} queries", app;dur={elapsed * 1000:.3f}'
+
+
+class QueryStatsMiddleware:
+    """요청별 쿼리 수/DB 시간을 Server-Timing 헤더로 추가 (순수 ASGI middleware)"""
+
+    def __init__(self, app, repeat_threshold: int = settings.QUERY_REPEAT_THRESHOLD):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with count_queries() as stats:
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", server_timing(stats, time.perf_counter() - started).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                for statement, count in stats.repeated(self.repeat_threshold):
+                    logger.warning(
+                        "Possible N+1: %s %s executed the same statement %d times: %s",
+                        scope["method"], scope["path"], count, _compact(statement),
+                    )
+
+
+# ===== 테스트/벤치마크 helper =====
+
+SERVER_TIMING_DB = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+
+def parse_server_timing(header: str) -> Optional[tuple[int, float]]:
+    """Server-Timing 헤더 → (쿼리 수, DB 시간 ms)"""
+    match = SERVER_TIMING_DB.search(header or "")
+    if not match:
+        return None
+    return int(match.group(2)), float(match.group(1))
+
+
+def assert_query_budget(response, max_queries: int):
+    """
+    응답의 Server-Timing으로 쿼리 예산 검사
+
+        response = client.get("/apis/v1/posts/1")
+        assert_query_budget(response, 3)
+    """
+    parsed = parse_server_timing(response.headers.get("server-timing"))
+    if parsed is None:
+        raise AssertionError("Response has no db Server-Timing entry (is QueryStatsMiddleware installed?)")
+    count, _ = parsed
+    if count > max_queries:
+        raise AssertionError(
+            f"{response.request.method} {response.request.url.path} issued {count} queries (budget {max_queries})"
+        )
+
+
+@contextmanager
+def query_budget(max_queries: int, max_repeats: Optional[int] = None) -> Iterator[QueryStats]:
+    """
+    같은 스레드에서 실행되는 코드(컨트롤러 직접 호출 등)의 쿼리 예산 검사
+
+        with query_budget(2):
+            controller.get_dashboard_stats()
+    """
+    with count_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        statements = "\n".join(f"  {count}x {_compact(statement)}" for statement, count in stats.statements.most_common())
+        raise AssertionError(f"Issued {stats.count} queries (budget {max_queries}):\n{statements}")
+    if max_repeats is not None:
+        repeated = stats.repeated(max_repeats + 1)
+        if repeated:
+            raise AssertionError(f"Statement repeated {repeated[0][1]} times (max {max_repeats}): {_compact(repeated[0][0])}")
@@ -0,0 +1,131 @@
+"""Token bucket 요청 제한 (로그인/회원가입 bcrypt 보호)
+
+정책(RateLimitPolicy)마다 키(클라이언트 IP 또는 요청 body의 email)별 bucket을 두고,
+capacity개까지 연속 요청을 허용한 뒤 period초에 capacity개 속도로 다시 채운다.
+라우터 의존성으로 붙여 body 검증/컨트롤러/DB/bcrypt보다 먼저 실행되며,
+거부는 dict 조회 한 번으로 끝난다 (429 + Retry-After).
+
+bucket 저장소는 프로세스 내 LRU라 키 수(RATE_LIMIT_MAX_KEYS)를 넘으면 가장 오래 쓰지 않은
+bucket부터 버린다. 공격 중인 키는 계속 사용되므로 밀려나지 않는다.
+
+    apis/base.py: RATE_LIMIT_POLICIES (라우터 prefix → 정책) → include_router(dependencies=...)
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request
+
+from common.config import settings
+from common.metrics import Counter
+
+RATE_LIMIT_REJECTED = Counter("rate_limit_rejected_total", "Requests rejected by rate limit policy", ("policy",))
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    name: str
+    key: str  # "ip" | "email"
+    capacity: int  # 연속 허용 요청 수 (bucket 크기)
+    period: float  # capacity만큼 다시 채워지는 시간(초)
+
+    @property
+    def refill_rate(self) -> float:
+        return self.capacity / self.period
+
+    @classmethod
+    def parse(cls, name: str, key: str, rate: str) -> Optional["RateLimitPolicy"]:
+        """'10/60' → 60초에 10회 (빈 값이면 None = 정책 없음)"""
+        if not rate:
+            return None
+        capacity, period = rate.split("/")
+        return cls(name=name, key=key, capacity=int(capacity), period=float(period))
+
+
+class TokenBucketStore:
+    """키별 (남은 토큰, 마지막 갱신 시각) LRU (스레드 안전)"""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity: int, refill_rate: float, cost: float = 1) -> float:
+        """토큰 사용. 허용이면 0, 거부면 다시 시도할 수 있을 때까지의 초"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+            if tokens >= cost:
+                tokens -= cost
+                wait = 0.0
+            else:
+                wait = (cost - tokens) / refill_rate
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+bucket_store = TokenBucketStore(settings.RATE_LIMIT_MAX_KEYS)
+
+
+def client_ip(request: Request) -> str:
+    # 프록시 뒤라면 uvicorn --proxy-headers(--forwarded-allow-ips)로 실제 IP가 들어온다
+    return request.client.host if request.client else "unknown"
+
+
+async def request_email(request: Request) -> Optional[str]:
+    """JSON body의 email (없거나 JSON이 아니면 None). body는 Starlette가 캐시해 두므로 다시 읽지 않는다"""
+    if "json" not in request.headers.get("content-type", ""):
+        return None
+    try:
+        body = await request.json()
+    except ValueError:
+        return None
+    email = body.get("email") if isinstance(body, dict) else None
+    return email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+
+def rate_limit(*policies: RateLimitPolicy):
+    """정책들을 차례로 적용하는 의존성 (하나라도 초과하면 429)"""
+    async def dependency(request: Request):
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        email = None
+        for policy in policies:
+            if policy.key == "email":
+                email = email or await request_email(request)
+                if email is None:
+                    continue
+                key = (policy.name, email)
+            else:
+                key = (policy.name, client_ip(request))
+
+            wait = bucket_store.consume(key, policy.capacity, policy.refill_rate)
+            if wait:
+                RATE_LIMIT_REJECTED.inc(policy.name)
+                raise HTTPException(
+                    status_code=429,
+                    detail="Too many requests, please retry later",
+                    headers={"Retry-After": str(max(1, math.ceil(wait)))},
+                )
+
+    return dependency
+
+
+def rate_limit_dependencies(policies) -> list:
+    """include_router(dependencies=...)용 (적용할 정책이 없으면 빈 목록)"""
+    policies = [policy for policy in policies if policy is not None]
+    return [Depends(rate_limit(*policies))] if policies else []
@@ -0,0 +1,220 @@
+"""공개 조회 API 응답 캐시
+
+직렬화된 JSON bytes를 (경로 + 정렬된 query string) 키로 저장하고, 각 항목에
+태그("posts", "post:3", "projects", "profile:1" ...)를 붙여 둔다. 변경 API는
+commit 후 invalidate_tags()로 관련 태그의 항목만 정확히 제거한다.
+
+- memory: 프로세스 내 LRU (전체 bytes 크기 제한)
+- redis: 여러 워커/서버가 공유하는 캐시 (redis 패키지 필요)
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Awaitable, Callable, Iterable, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from common.config import settings
+from common.responses import dump_json
+
+logger = logging.getLogger(__name__)
+
+# 무효화 기록(태그 → 마지막 무효화 순번)을 유지할 최대 태그 수
+MAX_TAG_VERSIONS = 4096
+
+
+class MemoryResponseCache:
+    """bytes 크기 제한 LRU + TTL 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires_at, body, tags)
+        self._tag_keys: dict[str, set] = defaultdict(set)
+        # 무효화된 태그만 기록 (조회로는 늘지 않음). 오래된 기록을 버리면 floor를 그 순번까지 올려
+        # 기록이 없는 태그도 "그 이후에 무효화됐을 수 있음"으로 보이게 한다
+        self._tag_versions: OrderedDict = OrderedDict()
+        self._invalidations = 0
+        self._version_floor = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def versions(self, tags: Iterable[str]) -> tuple:
+        """조회 시작 시점의 태그 버전 (조회 중 무효화된 결과를 저장하지 않기 위함)"""
+        with self._lock:
+            return self._versions(tags)
+
+    def _versions(self, tags: Iterable[str]) -> tuple:
+        return tuple(self._tag_versions.get(tag, self._version_floor) for tag in tags)
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, body: bytes, tags: tuple, versions: Optional[tuple] = None):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if versions is not None and versions != self._versions(tags):
+                return
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, body, tags)
+            self._size += len(body)
+            for tag in tags:
+                self._tag_keys[tag].add(key)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        _, body, tags = entry
+        self._size -= len(body)
+        for tag in tags:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    def invalidate(self, *tags: str):
+        with self._lock:
+            for tag in tags:
+                self._invalidations += 1
+                self._tag_versions[tag] = self._invalidations
+                self._tag_versions.move_to_end(tag)
+                for key in list(self._tag_keys.get(tag, ())):
+                    self._remove(key)
+            while len(self._tag_versions) > MAX_TAG_VERSIONS:
+                _, version = self._tag_versions.popitem(last=False)
+                self._version_floor = max(self._version_floor, version)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tag_keys.clear()
+            self._size = 0
+
+
+class RedisResponseCache:
+    """Redis 공유 응답 캐시 (태그 → 키 목록을 Redis set으로 관리)"""
+
+    def __init__(self, url: str, ttl: float, prefix: str = "response-cache:"):
+        import redis  # 선택 의존성: redis 백엔드를 쓸 때만 필요
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = int(ttl)
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def versions(self, tags: Iterable[str]) -> None:
+        return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            body = self.client.get(self.prefix + key)
+        except Exception:
+            logger.exception("Response cache get failed")
+            body = None
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    def set(self, key: str, body: bytes, tags: tuple, versions: Optional[tuple] = None):
+        try:
+            pipeline = self.client.pipeline()
+            pipeline.set(self.prefix + key, body, ex=self.ttl)
+            for tag in tags:
+                pipeline.sadd(self.prefix + "tag:" + tag, key)
+                pipeline.expire(self.prefix + "tag:" + tag, self.ttl)
+            pipeline.execute()
+        except Exception:
+            logger.exception("Response cache set failed")
+
+    def invalidate(self, *tags: str):
+        try:
+            for tag in tags:
+                tag_key = self.prefix + "tag:" + tag
+                keys = [self.prefix + key.decode() for key in self.client.smembers(tag_key)]
+                self.client.delete(tag_key, *keys)
+        except Exception:
+            logger.exception("Response cache invalidation failed")
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + "*"):
+            self.client.delete(key)
+
+
+def create_response_cache():
+    """RESPONSE_CACHE_BACKEND 설정에 맞는 캐시 백엔드 선택"""
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return RedisResponseCache(settings.RESPONSE_CACHE_URL, settings.RESPONSE_CACHE_TTL_SECONDS)
+    return MemoryResponseCache(settings.RESPONSE_CACHE_MAX_BYTES, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+response_cache = create_response_cache()
+
+
+def invalidate_tags(*tags: str):
+    """데이터 변경 후(commit 이후) 호출"""
+    if settings.RESPONSE_CACHE_ENABLED:
+        response_cache.invalidate(*tags)
+
+
+def cache_key(request: Request) -> str:
+    """경로 + 정렬된 query parameter (값의 &, =, # 등이 키 구분자와 섞이지 않도록 인코딩)"""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def serialize(adapter: TypeAdapter, data) -> bytes:
+    """ORM 객체 → response_model 검증 → JSON bytes (FastAPI와 같이 alias 사용)"""
+    return dump_json(adapter, data)
+
+
+async def cached_json(
+    request: Request,
+    tags: tuple,
+    load: Callable[[], Awaitable],
+    adapter: TypeAdapter,
+    version: Optional[str] = None,
+) -> Response:
+    """
+    캐시된 JSON bytes를 반환, 없으면 load() 결과를 adapter로 직렬화해 저장
+
+    version(ETag 등)을 주면 키에 포함해 본문과 검증자가 어긋나지 않게 한다.
+    load()에서 발생한 HTTPException(404 등)은 캐시하지 않고 그대로 전달된다.
+    """
+    if not settings.RESPONSE_CACHE_ENABLED:
+        body = serialize(adapter, await load())
+        return Response(content=body, media_type="application/json")
+
+    key = cache_key(request)
+    if version:
+        key = f"{key}#{version}"
+    body = response_cache.get(key)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+    versions = response_cache.versions(tags)
+    body = serialize(adapter, await load())
+    response_cache.set(key, body, tags, versions)
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
@@ -0,0 +1,133 @@
+"""토큰 폐기 목록 (logout, refresh token rotation)
+
+access/refresh token에는 jti(토큰 고유 id) claim이 들어 있고, 폐기된 jti를 토큰 만료(exp)까지 보관한다.
+검증된 토큰 캐시(common.jwt_backend)를 통과한 요청도 매번 확인하므로 조회는 O(1)이어야 한다.
+
+- memory: 프로세스 내 dict(jti → exp) + exp 순서 heap (만료된 항목은 폐기 시점에 heap 앞에서부터 제거)
+- redis: 여러 워커/서버가 공유하는 폐기 목록 (redis 패키지 필요). 키 TTL = 토큰 남은 수명.
+  이 프로세스에서 폐기한 jti는 메모리에서 먼저 찾아 Redis 왕복을 줄인다.
+
+jti가 없는 이전 토큰은 폐기할 수 없고 만료까지 유효하다.
+"""
+import heapq
+import logging
+import math
+import threading
+import time
+from typing import Optional
+
+from common.config import settings
+from common.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+TOKEN_REVOCATIONS = Counter("token_revocations_total", "Revoked token ids by reason", ("reason",))
+
+
+def _expires_at(exp: Optional[float]) -> float:
+    # exp가 없으면 가장 긴 토큰 수명(refresh)만큼 보관
+    return float(exp) if exp is not None else time.time() + settings.REFRESH_EXPIRE_MINUTES * 60
+
+
+class MemoryRevocationStore:
+    """jti → exp dict (조회 O(1), 잠금 없음) + 만료 순 heap (스레드 안전)"""
+
+    def __init__(self):
+        self._revoked: dict[str, float] = {}
+        self._expiry: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti: str) -> bool:
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def revoke(self, jti: str, exp: Optional[float] = None) -> bool:
+        """jti 폐기. 이미 폐기된 jti면 False (refresh token 재사용 감지에 사용)"""
+        expires_at = _expires_at(exp)
+        now = time.time()
+        with self._lock:
+            self._evict(now)
+            current = self._revoked.get(jti)
+            if current is not None and current > now:
+                return False
+            self._revoked[jti] = expires_at
+            heapq.heappush(self._expiry, (expires_at, jti))
+            return True
+
+    def _evict(self, now: float):
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._expiry)
+            if self._revoked.get(jti) == expires_at:
+                del self._revoked[jti]
+
+    def clear(self):
+        with self._lock:
+            self._revoked.clear()
+            self._expiry.clear()
+
+    def __len__(self):
+        return len(self._revoked)
+
+
+class RedisRevocationStore:
+    """Redis 공유 폐기 목록 (SET NX EX로 폐기, EXISTS로 확인)
+
+    Redis 오류 시에는 로그를 남기고 이 프로세스의 메모리 목록만으로 판단한다.
+    """
+
+    def __init__(self, url: str, prefix: str = "revoked-token:"):
+        import redis  # 선택 의존성: redis 백엔드를 쓸 때만 필요
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.local = MemoryRevocationStore()
+
+    def is_revoked(self, jti: str) -> bool:
+        if self.local.is_revoked(jti):
+            return True
+        try:
+            return bool(self.client.exists(self.prefix + jti))
+        except Exception:
+            logger.exception("Revocation store lookup failed")
+            return False
+
+    def revoke(self, jti: str, exp: Optional[float] = None) -> bool:
+        expires_at = _expires_at(exp)
+        ttl = max(1, math.ceil(expires_at - time.time()))
+        revoked = self.local.revoke(jti, expires_at)
+        try:
+            return bool(self.client.set(self.prefix + jti, 1, nx=True, ex=ttl))
+        except Exception:
+            logger.exception("Revocation store update failed")
+            return revoked
+
+    def clear(self):
+        self.local.clear()
+        for key in self.client.scan_iter(self.prefix + "*"):
+            self.client.delete(key)
+
+
+def create_revocation_store():
+    """TOKEN_REVOCATION_BACKEND 설정에 맞는 폐기 목록 선택"""
+    if settings.TOKEN_REVOCATION_BACKEND == "redis":
+        return RedisRevocationStore(settings.TOKEN_REVOCATION_URL)
+    return MemoryRevocationStore()
+
+
+revocation_store = create_revocation_store()
+
+
+def revoke_token(payload: dict, reason: str) -> bool:
+    """검증된 payload의 jti 폐기 (jti가 없으면 False)"""
+    jti = payload.get("jti")
+    if not jti:
+        return False
+    revoked = revocation_store.revoke(jti, payload.get("exp"))
+    if revoked:
+        TOKEN_REVOCATIONS.inc(reason)
+    return revoked
+
+
+def is_revoked(payload: dict) -> bool:
+    jti = payload.get("jti")
+    return bool(jti) and revocation_store.is_revoked(jti)
@@ -1,35 +1,66 @@
+import uuid
 from typing import Optional
-from passlib.context import CryptContext
-from jose import JWTError, ExpiredSignatureError, jwt
+from jose import jwt
 from datetime import datetime, timedelta
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from common.config import settings
+from common.hashing import PASSWORD_REHASHES, create_password_context, password_hash_pool
+from common.jwt_backend import TokenExpired, TokenInvalid, cache_key, cache_ttl, jwt_backend, verified_tokens
+from common.metrics import JWT_DECODES, PASSWORD_HASH_DURATION
+from common.principal import Principal
+from common.revocation import is_revoked
 
 # HTTPBearer 인스턴스 (한 번만 생성)
 security = HTTPBearer()
+# 토큰이 없어도 되는 엔드포인트용 (없으면 None)
+optional_security = HTTPBearer(auto_error=False)
 
 class JWTHandler:
-    # 클래스 변수로 한 번만 생성 (성능 개선)
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # 클래스 변수로 한 번만 생성 (성능 개선), scheme/cost는 PASSWORD_SCHEMES, BCRYPT_ROUNDS 등
+    pwd_context = create_password_context()
 
     # ===== 비밀번호 관련 =====
 
     @staticmethod
     def create_password_hash(password: str) -> str:
         """비밀번호 해싱"""
-        print("Hashing password...", password, "Length:", len(password))
-
         # bcrypt는 72바이트 제한이 있음
-        if len(password) > 72:
+        if JWTHandler.pwd_context.default_scheme() == "bcrypt" and len(password) > 72:
             raise ValueError("Password is too long (max 72 characters)")
 
-        return JWTHandler.pwd_context.hash(password)
+        with PASSWORD_HASH_DURATION.time("hash"):
+            return JWTHandler.pwd_context.hash(password)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """비밀번호 검증"""
-        return JWTHandler.pwd_context.verify(plain_password, hashed_password)
+        with PASSWORD_HASH_DURATION.time("verify"):
+            return JWTHandler.pwd_context.verify(plain_password, hashed_password)
+
+    @staticmethod
+    def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """비밀번호 검증 + 재해싱 (scheme/cost가 현재 설정과 다르면 새 해시 반환, 아니면 None)"""
+        with PASSWORD_HASH_DURATION.time("verify"):
+            verified, new_hash = JWTHandler.pwd_context.verify_and_update(plain_password, hashed_password)
+        if new_hash:
+            PASSWORD_REHASHES.inc(JWTHandler.pwd_context.default_scheme())
+        return verified, new_hash
+
+    @staticmethod
+    async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """verify_and_update_password (해싱 스레드 풀에서 실행, 이벤트 루프 비차단)"""
+        return await password_hash_pool.run(JWTHandler.verify_and_update_password, plain_password, hashed_password)
+
+    @staticmethod
+    async def create_password_hash_async(password: str) -> str:
+        """비밀번호 해싱 (해싱 스레드 풀에서 실행, 이벤트 루프 비차단)"""
+        return await password_hash_pool.run(JWTHandler.create_password_hash, password)
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (해싱 스레드 풀에서 실행, 이벤트 루프 비차단)"""
+        return await password_hash_pool.run(JWTHandler.verify_password, plain_password, hashed_password)
 
     # ===== JWT 토큰 관련 =====
 
@@ -48,38 +79,75 @@ class JWTHandler:
 
     @staticmethod
     def decode(token: str, secret_key: str = settings.SECRET_KEY, algorithms: str = settings.ALGORITHM) -> dict:
-        """JWT 토큰 디코드 (만료/유효성 검증)"""
-        try:
-            payload = jwt.decode(token, secret_key, algorithms=algorithms)
-            return payload
-        except ExpiredSignatureError:
-            raise HTTPException(status_code=401, detail="Token expired")
-        except JWTError:
-            raise HTTPException(status_code=401, detail="Invalid token")
+        """JWT 토큰 디코드 (만료/유효성/폐기 여부 검증, 검증된 토큰은 exp 전까지 캐시 사용)"""
+        key = cache_key(token, secret_key, algorithms)
+        payload = verified_tokens.get(key)
+        if payload is not None:
+            JWT_DECODES.inc("cached")
+        else:
+            try:
+                payload = jwt_backend.decode(token, secret_key, algorithms)
+            except TokenExpired:
+                JWT_DECODES.inc("expired")
+                raise HTTPException(status_code=401, detail="Token expired")
+            except TokenInvalid:
+                JWT_DECODES.inc("invalid")
+                raise HTTPException(status_code=401, detail="Invalid token")
+            JWT_DECODES.inc("ok")
+
+            ttl = cache_ttl(payload)
+            if ttl > 0:
+                verified_tokens.set(key, payload, ttl=ttl)
+
+        # 캐시된 토큰도 폐기 여부는 매번 확인 (logout, refresh rotation)
+        if is_revoked(payload):
+            JWT_DECODES.inc("revoked")
+            raise HTTPException(status_code=401, detail="Token revoked")
+        return dict(payload)
 
     @staticmethod
     def is_token_valid(token: str, secret_key: str = settings.SECRET_KEY, algorithms: list = settings.ALGORITHM) -> bool:
         """토큰 유효성 확인 (True/False만 반환)"""
         try:
-            jwt.decode(token, secret_key, algorithms=algorithms)
+            JWTHandler.decode(token, secret_key, algorithms)
             return True
-        except JWTError:
+        except HTTPException:
             return False
 
     # ===== 편의 메서드 =====
 
     @staticmethod
-    def create_access_token(email: str, secret_key: str = settings.SECRET_KEY, algorithm: str = settings.ALGORITHM) -> str:
+    def new_jti() -> str:
+        """토큰 고유 id (폐기 목록 키)"""
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def principal_claims(user_id: Optional[int], is_superuser: bool) -> dict:
+        """사용자 식별 claims (uid: user id, su: superuser 여부)"""
+        if user_id is None:
+            return {}
+        return {"uid": user_id, "su": bool(is_superuser)}
+
+    @staticmethod
+    def create_access_token(email: str, secret_key: str = settings.SECRET_KEY, algorithm: str = settings.ALGORITHM, user_id: Optional[int] = None, is_superuser: bool = False) -> str:
         """Access Token 생성 (1시간)"""
-        payload = {"email": email, "type": "access"}
+        payload = {"email": email, "type": "access", "jti": JWTHandler.new_jti(), **JWTHandler.principal_claims(user_id, is_superuser)}
         return JWTHandler.encode(payload, secret_key, algorithm, expires_delta=timedelta(hours=settings.ACCESS_EXPIRE_MINUTES))
 
     @staticmethod
-    def create_refresh_token(email: str, secret_key: str = settings.SECRET_KEY, algorithm: str = settings.ALGORITHM) -> str:
+    def create_refresh_token(email: str, secret_key: str = settings.SECRET_KEY, algorithm: str = settings.ALGORITHM, user_id: Optional[int] = None, is_superuser: bool = False) -> str:
         """Refresh Token 생성 (7일)"""
-        payload = {"email": email, "type": "refresh"}
+        payload = {"email": email, "type": "refresh", "jti": JWTHandler.new_jti(), **JWTHandler.principal_claims(user_id, is_superuser)}
         return JWTHandler.encode(payload, secret_key, algorithm, expires_delta=timedelta(minutes=settings.REFRESH_EXPIRE_MINUTES))
 
+    @staticmethod
+    def principal_from_payload(payload: dict) -> Principal:
+        """토큰 payload → Principal (DB 조회 없음)"""
+        email = payload.get("email")
+        if not email:
+            raise HTTPException(status_code=401, detail="Invalid token payload")
+        return Principal(id=payload.get("uid"), email=email, is_superuser=bool(payload.get("su", False)))
+
     # ===== 토큰 검증 =====
     @staticmethod
     def verify_access_token(token: str, secret_key: str = settings.SECRET_KEY, algorithms: str = settings.ALGORITHM) -> dict:
@@ -121,7 +189,7 @@ class JWTHandler:
         return email
 
     @staticmethod
-    def verify_token_optional(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> Optional[str]:
+    def verify_token_optional(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)) -> Optional[str]:
         """
         Authorization 헤더에서 토큰 검증 후 email 반환 (의존성 주입용)
 
@@ -133,6 +201,9 @@ class JWTHandler:
                 user = get_user_by_email(db, email)
                 return user
         """
+        if credentials is None:
+            return None
+
         token = credentials.credentials
         payload = JWTHandler.verify_access_token(token)
 
@@ -141,3 +212,28 @@ class JWTHandler:
             raise HTTPException(status_code=401, detail="Invalid token payload")
 
         return email
+
+    @staticmethod
+    def verify_token_payload(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+        """Authorization 헤더의 access token 검증 후 payload 반환 (logout 등 jti/exp가 필요한 곳)"""
+        return JWTHandler.verify_access_token(credentials.credentials)
+
+    @staticmethod
+    def verify_principal(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Principal:
+        """
+        Authorization 헤더에서 토큰 검증 후 Principal 반환 (의존성 주입용)
+
+        claims만 사용하며 DB는 조회하지 않는다. 실제 사용자 확인은
+        AuthController.resolve_user()가 요청당 한 번(캐시 우선) 수행한다.
+        """
+        payload = JWTHandler.verify_access_token(credentials.credentials)
+        return JWTHandler.principal_from_payload(payload)
+
+    @staticmethod
+    def verify_principal_optional(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)) -> Optional[Principal]:
+        """verify_principal과 동일하나 토큰이 없으면 None"""
+        if credentials is None:
+            return None
+
+        payload = JWTHandler.verify_access_token(credentials.credentials)
+        return JWTHandler.principal_from_payload(payload)
@@ -1,10 +1,114 @@
-from sqlalchemy import create_engine
+import logging
+import threading
+import time
+
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from common.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+# ===== Connection Pool =====
+
+class PoolWaitStats:
+    """커넥션 checkout 대기 시간 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.timeouts = 0
+
+    def record(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+
+class InstrumentedQueuePool(QueuePool):
+    """checkout 대기 시간을 기록하는 QueuePool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            logger.warning("DB pool checkout timed out: %s", self.status())
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """InstrumentedQueuePool의 AsyncEngine 버전"""
+
+
+def engine_options(url: str, async_driver: bool = False) -> dict:
+    """settings 기반 create_engine 옵션 (풀 크기, 재활용, pre-ping, statement timeout)"""
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+    parsed = make_url(url)
+    # 메모리 SQLite는 단일 커넥션 풀을 써야 하므로 기본값 유지
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if async_driver else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
 
-engine = create_engine(settings.DATABASE_URL)
+    if parsed.get_backend_name() == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS:
+        if async_driver:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return options
+
+
+def pool_status(target_engine) -> dict:
+    """풀 현황 (checkout 수, overflow, 대기 통계)"""
+    pool = target_engine.pool
+    status = {"pool_class": type(pool).__name__, "status": pool.status()}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats:
+        status.update(
+            checkouts=wait_stats.count,
+            wait_avg_ms=round(wait_stats.total_seconds / wait_stats.count * 1000, 3) if wait_stats.count else 0.0,
+            wait_max_ms=round(wait_stats.max_seconds * 1000, 3),
+            timeouts=wait_stats.timeouts,
+        )
+    return status
+
+
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -15,4 +119,36 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# ===== Async (DB_ASYNC=true) =====
+
+# 동기 드라이버 → 비동기 드라이버
+ASYNC_DRIVERS = {
+    "postgresql+psycopg2://": "postgresql+asyncpg://",
+    "postgresql://": "postgresql+asyncpg://",
+    "sqlite://": "sqlite+aiosqlite://",
+}
+
+
+def to_async_url(url: str) -> str:
+    """DATABASE_URL을 비동기 드라이버 URL로 변환"""
+    for sync_prefix, async_prefix in ASYNC_DRIVERS.items():
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC:
+    async_database_url = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+    async_engine = create_async_engine(async_database_url, **engine_options(async_database_url, async_driver=True))
+    # commit 후 속성 재조회(I/O)가 응답 직렬화 시점에 일어나지 않도록 expire 하지 않음
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
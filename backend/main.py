@@ -1,9 +1,57 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+import secrets
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from apis.base import router as api_router
+from apis.posts.view_counter import view_counter
+from apis.dashboard.stats import reconcile_dashboard_stats, run_reconcile_loop
+from apis.generation.counter import ensure_generations
+from apis.tag.counts import reconcile_tag_counts
+from common.config import settings
+from common.query_stats import QueryStatsMiddleware
+from common import metrics
 import apis  # 모든 모델을 로드 (SQLAlchemy relationship이 작동하도록)
 import uvicorn
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 시작: 조회수 flush 스레드 실행
+    view_counter.start()
+
+    # 시작: 대시보드 집계 재계산 + 주기 재계산 task
+    try:
+        await run_in_threadpool(reconcile_dashboard_stats)
+    except Exception:
+        logging.getLogger(__name__).exception("Dashboard stats reconciliation failed")
+    reconcile_task = None
+    if settings.DASHBOARD_RECONCILE_SECONDS > 0:
+        reconcile_task = asyncio.create_task(run_reconcile_loop(settings.DASHBOARD_RECONCILE_SECONDS))
+
+    # 시작: 목록 변경 세대 행 생성 (목록 ETag)
+    try:
+        await run_in_threadpool(ensure_generations)
+    except Exception:
+        logging.getLogger(__name__).exception("Collection generation setup failed")
+
+    # 시작: 태그별 Post 수 재계산
+    try:
+        await run_in_threadpool(reconcile_tag_counts)
+    except Exception:
+        logging.getLogger(__name__).exception("Tag count reconciliation failed")
+
+    yield
+
+    if reconcile_task:
+        reconcile_task.cancel()
+    # 종료: 버퍼에 남은 조회수까지 반영
+    view_counter.stop()
+
+
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
     title="Blog API",
@@ -11,7 +59,8 @@ app = FastAPI(
     version="1.0.0",
     swagger_ui_parameters={
         "persistAuthorization": True  # 새로고침 시에도 토큰 유지
-    }
+    },
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -24,6 +73,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 SQL 쿼리 수/DB 시간 (Server-Timing 헤더, N+1 경고)
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
+# 라우트별 지연시간/요청 수 메트릭 (가장 바깥에서 측정)
+if settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    def verify_metrics_token(request: Request):
+        # METRICS_TOKEN이 없으면 공개 (개발용), 있으면 Authorization: Bearer <token>이 같아야 함
+        if not settings.METRICS_TOKEN:
+            return
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not secrets.compare_digest(request.headers.get("authorization", "").encode(), expected.encode()):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+
+    @app.get("/metrics", include_in_schema=False, dependencies=[Depends(verify_metrics_token)])
+    async def get_metrics():
+        """Prometheus scrape endpoint (METRICS_TOKEN 지정 시 Bearer 토큰 필요)"""
+        return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
 # 라우터 등록
 app.include_router(api_router)
 